@@ -17,5 +17,8 @@ if exist "data\price_data.csv" (
     echo No price data found to delete.
 )
 
+REM Update log of an interrupted run (would be replayed into the fresh price data)
+if exist "data\price_data_updates.jsonl" del "data\price_data_updates.jsonl"
+
 echo.
 pause
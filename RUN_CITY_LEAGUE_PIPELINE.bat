@@ -0,0 +1,13 @@
+@echo off
+echo.
+echo ========================================
+echo CITY LEAGUE PIPELINE (ARCHETYPES + ANALYSIS)
+echo ========================================
+echo.
+python city_league_pipeline.py
+echo.
+echo ========================================
+echo Pipeline finished!
+echo ========================================
+echo.
+pause
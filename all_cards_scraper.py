@@ -12,11 +12,18 @@ import json
 import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict, Optional
 from urllib.parse import urljoin
 
+from card_details_journal import DetailsJournal, card_key, journal_path_for
+from card_detail_page import CardDetailPage, fetch_card_detail_page, parse_card_detail_page, parse_print_link
+from card_list_page import fetch_card_list_page, read_card_list_page_selenium
+from http_client import get_http_client
+
 # Fix Windows console encoding for Unicode characters (✓, •, etc.)
 if sys.platform == 'win32':
     if hasattr(sys.stdout, 'reconfigure'):
@@ -37,10 +44,7 @@ print()
 
 try:
     from selenium import webdriver
-    from selenium.webdriver.common.by import By
     from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -58,8 +62,11 @@ DEFAULT_SETTINGS = {
     "headless": True,
     "skip_detail_scraping": False,  # True = only scrape list (fast), False = scrape details too
     "list_page_delay_seconds": 1.0,
-    "detail_page_wait_seconds": 2.0,
-    "detail_request_delay_seconds": 0.5
+    "detail_page_wait_seconds": 2.0,      # only for the Selenium fallback
+    "detail_workers": 4,                  # parallel detail page workers
+    "detail_requests_per_second": 2.0,    # global cap for all workers together
+    "detail_selenium_fallback": True,     # start a browser per worker if a page can't be read over HTTP
+    "journal_compact_minutes": 10         # write journaled detail results into the CSV this often
 }
 
 
@@ -158,10 +165,9 @@ def load_settings() -> Dict[str, object]:
 
     return settings
 
-def scrape_all_cards_list(settings: Dict[str, object], start_page: int = 1, existing_keys: Optional[set] = None) -> List[Dict[str, str]]:
-    """Scrape card names and basic info from the Limitless TCG card list."""
+def create_browser(settings: Dict[str, object]):
+    """Create a new Chrome browser instance with standard settings (Selenium fallback)."""
     print("[All Cards Scraper] Starting Selenium WebDriver...")
-    
     chrome_options = Options()
     if settings.get("headless", True):
         chrome_options.add_argument("--headless")
@@ -169,12 +175,20 @@ def scrape_all_cards_list(settings: Dict[str, object], start_page: int = 1, exis
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-    
-    driver = webdriver.Chrome(options=chrome_options)
+    return webdriver.Chrome(options=chrome_options)
+
+
+def scrape_all_cards_list(settings: Dict[str, object], start_page: int = 1, existing_keys: Optional[set] = None) -> List[Dict[str, str]]:
+    """Scrape card names and basic info from the Limitless TCG card list.
+
+    List pages are fetched over HTTP and parsed (card_list_page); Selenium is
+    only started if a page can't be read that way.
+    """
     all_cards_data = []
     if existing_keys is None:
         existing_keys = set()
-    
+    driver = None  # Selenium fallback, only started if a page can't be read over HTTP
+
     # Get settings
     max_pages = settings.get("max_pages")
     end_page = settings.get("end_page")
@@ -228,69 +242,48 @@ def scrape_all_cards_list(settings: Dict[str, object], start_page: int = 1, exis
                 continue
             
             print(f"[All Cards Scraper] Loading page {page_index}: {next_url}")
-            driver.get(next_url)
-
-            # Wait for table rows to appear
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr"))
-                )
-            except Exception:
+            page = fetch_card_list_page(next_url)
+            if page is None:
+                print("[All Cards Scraper] HTTP list page unavailable, falling back to Selenium...")
+                if driver is None:
+                    driver = create_browser(settings)
+                page = read_card_list_page_selenium(driver, next_url)
+
+            if page is None or page.row_count == 0:
                 print("[All Cards Scraper] ERROR: Table rows not found on this page.")
                 break
 
-            # Extract data from table rows
-            rows = driver.find_elements(By.CSS_SELECTOR, "tbody tr")
-            print(f"[All Cards Scraper] Found {len(rows)} cards on page {page_index}")
+            print(f"[All Cards Scraper] Found {page.row_count} cards on page {page_index}")
 
             new_added_on_page = 0
             filtered_out_on_page = 0
 
-            for idx, row in enumerate(rows):
-                try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-
-                    if len(cells) >= 4:
-                        # Extract data - column order: Set, No, Name, Type
-                        set_code = cells[0].get_attribute('textContent').strip()
-                        set_number = cells[1].get_attribute('textContent').strip()
-                        card_name = cells[2].get_attribute('textContent').strip()
-                        card_type = cells[3].get_attribute('textContent').strip()
-                        
-                        # Apply set_filter if specified
-                        if set_filter and set_code not in set_filter:
-                            filtered_out_on_page += 1
-                            continue
-
-                        # Try to get card link for detail page
-                        try:
-                            link_elem = cells[2].find_element(By.TAG_NAME, "a")
-                            card_url = link_elem.get_attribute('href')
-                        except:
-                            card_url = None
-
-                        if card_name:
-                            key = f"{card_name}::{set_code}::{set_number}"
-                            if key in seen_keys or key in existing_keys:
-                                continue
-                            seen_keys.add(key)
-                            all_cards_data.append({
-                                'name': card_name,
-                                'set': set_code,
-                                'number': set_number,
-                                'type': card_type,
-                                'card_url': card_url,
-                                'image_url': '',
-                                'rarity': '',
-                                'international_prints': '',
-                                'cardmarket_url': ''
-                            })
-                            new_added_on_page += 1
-
-                            if (len(all_cards_data)) % 500 == 0:
-                                print(f"[All Cards Scraper]   Processed {len(all_cards_data)} cards so far...")
-                except Exception:
+            for set_code, set_number, card_name, card_type, card_url in page.rows:
+                # Apply set_filter if specified
+                if set_filter and set_code not in set_filter:
+                    filtered_out_on_page += 1
                     continue
+
+                if card_name:
+                    key = f"{card_name}::{set_code}::{set_number}"
+                    if key in seen_keys or key in existing_keys:
+                        continue
+                    seen_keys.add(key)
+                    all_cards_data.append({
+                        'name': card_name,
+                        'set': set_code,
+                        'number': set_number,
+                        'type': card_type,
+                        'card_url': card_url,
+                        'image_url': '',
+                        'rarity': '',
+                        'international_prints': '',
+                        'cardmarket_url': ''
+                    })
+                    new_added_on_page += 1
+
+                    if (len(all_cards_data)) % 500 == 0:
+                        print(f"[All Cards Scraper]   Processed {len(all_cards_data)} cards so far...")
             
             if filtered_out_on_page > 0:
                 print(f"[All Cards Scraper]   Filtered out {filtered_out_on_page} cards (not in set_filter)")
@@ -299,42 +292,23 @@ def scrape_all_cards_list(settings: Dict[str, object], start_page: int = 1, exis
             if use_page_tracking:
                 newly_scraped_pages.add(page_index)
 
-            # Find next page link
-            next_link = None
-            next_selectors = [
-                ".pagination a[rel='next']",
-                ".pagination .page-item.next a",
-                ".pagination a[aria-label='Next']"
-            ]
-            for selector in next_selectors:
-                elems = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elems:
-                    next_link = elems[0]
-                    break
-
-            if not next_link:
-                # If no next button found, try to construct next page URL manually
-                # Only stop if we have no rows at all (truly empty page)
-                if len(rows) == 0:
-                    print("[All Cards Scraper] Reached last page (no cards found).")
-                    break
+            # Follow next page link
+            if not page.has_next_link:
+                # If no next button found, construct next page URL manually
                 next_url = f"{base_url}&page={page_index + 1}"
                 page_index += 1
                 time.sleep(float(settings.get("list_page_delay_seconds", 1.0)))
                 continue
 
-            parent = next_link.find_element(By.XPATH, "..")
-            parent_class = parent.get_attribute("class") or ""
-            if "disabled" in parent_class.lower():
+            if page.next_disabled:
                 print("[All Cards Scraper] Reached last page (next disabled).")
                 break
 
-            href = next_link.get_attribute("href")
-            if not href:
+            if not page.next_url:
                 print("[All Cards Scraper] No href on next link. Stopping.")
                 break
 
-            next_url = href
+            next_url = page.next_url
             page_index += 1
             time.sleep(float(settings.get("list_page_delay_seconds", 1.0)))
         
@@ -343,7 +317,8 @@ def scrape_all_cards_list(settings: Dict[str, object], start_page: int = 1, exis
         import traceback
         traceback.print_exc()
     finally:
-        driver.quit()
+        if driver is not None:
+            driver.quit()
     
     print(f"\n[All Cards Scraper] OK: Extracted {len(all_cards_data)} cards from list")
     
@@ -357,6 +332,29 @@ def scrape_all_cards_list(settings: Dict[str, object], start_page: int = 1, exis
     return all_cards_data
 
 
+def write_cards_csv(csv_path: str, cards: List[Dict[str, str]]) -> None:
+    """Write the card database CSV atomically (temp file + rename), so readers never see a half-written file."""
+    tmp_path = f"{csv_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        fieldnames = ['name', 'set', 'number', 'type', 'rarity', 'image_url', 'international_prints', 'cardmarket_url']
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for card in cards:
+            writer.writerow({
+                'name': card.get('name', ''),
+                'set': card.get('set', ''),
+                'number': card.get('number', ''),
+                'type': card.get('type', ''),
+                'rarity': card.get('rarity', ''),
+                'image_url': card.get('image_url', ''),
+                'international_prints': card.get('international_prints', ''),
+                'cardmarket_url': card.get('cardmarket_url', '')
+            })
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, csv_path)
+
+
 def load_existing_cards(csv_path: str, rescrape_incomplete: bool = True) -> (List[Dict[str, str]], set, List[Dict[str, str]]):
     """Load existing cards from CSV to avoid duplicates and allow append mode.
     
@@ -447,315 +445,270 @@ def load_existing_cards(csv_path: str, rescrape_incomplete: bool = True) -> (Lis
     return complete_cards, existing_keys, incomplete_cards
 
 
+# Promo sets: empty rarity is stored as "Promo" (easier to track, fixes threshold logic in frontend)
+PROMO_SETS = ['MEP', 'SVP', 'SP', 'SMP', 'XYP', 'BWP', 'HSP', 'DPP', 'NP', 'WP',
+              'POP', 'SWSH', 'SWSHP', 'PR-SW', 'PR-SM', 'PR-XY', 'PR-BLW', 'PR-HS', 'PR-DP']
+BROWSER_RESTART_EVERY = 1000  # pages per Chrome instance before a restart (session timeouts)
+
+
+def extract_card_details(card: Dict[str, str], page: CardDetailPage) -> (Dict[str, str], List[str]):
+    """Image URL, rarity, international prints and Cardmarket link of card from its detail page.
+
+    Returns (updated fields, log lines) - card itself is not modified, so this can run in a worker thread.
+    """
+    updates = {}
+    log = []
+
+    # Image URL from <img class="card shadow resp-w">
+    if page.image_url:
+        updates['image_url'] = page.image_url
+
+    # Rarity, Strategy 1: .card-prints-current .prints-current-details span (most reliable)
+    rarity_found = False
+    if len(page.current_details) >= 2:
+        rarity_info = page.current_details[1]
+        # Extract rarity from format like "· Double Rare"
+        if '·' in rarity_info:
+            rarity = rarity_info.split('·')[1].strip()
+            if rarity:
+                updates['rarity'] = rarity
+                rarity_found = True
+
+    # Rarity, Strategy 2: the current card's row in the prints table
+    if not rarity_found:
+        for row in page.print_rows:
+            if len(row.cells) >= 2:
+                first_cell_text = row.cells[0]
+                if f"{card['set']}-{card['number']}" in first_cell_text or first_cell_text.startswith(f"{card['set']} "):
+                    rarity_text = row.cells[1]
+                    if rarity_text and rarity_text not in ['—', '-', '']:
+                        updates['rarity'] = rarity_text
+                        rarity_found = True
+                        break
+
+    if not rarity_found:
+        log.append(f"      [WARNING] Could not extract rarity for {card['set']}-{card['number']}")
+
+    if card['set'] in PROMO_SETS and not (updates.get('rarity') or card.get('rarity')):
+        updates['rarity'] = 'Promo'
+
+    # International Prints + Cardmarket Link from <table class="card-prints-versions">
+    if not page.has_prints_table:
+        # Table not found - normal for single-print cards
+        updates['international_prints'] = f"{card['set']}-{card['number']}"
+        updates['cardmarket_url'] = ''
+        log.append("   ℹ No int. prints table (single print)")
+        return updates, log
+
+    int_prints = set()
+    cardmarket_url = ''
+    for row in page.print_rows:
+        # Skip header row
+        if row.has_header:
+            continue
+
+        # Int. Print from the first column (<a href="/cards/SET/NUM">)
+        href = row.card_link
+        if href and '/cards/' in href:
+            print_id = parse_print_link(href)
+            # Skip Japanese sets
+            if print_id and print_id[0] != 'JP':
+                int_prints.add(f"{print_id[0]}-{print_id[1]}")
+
+        # Cardmarket URL from the current card's row (EUR price link)
+        if 'current' in row.css_class and row.cardmarket_url:
+            cardmarket_url = row.cardmarket_url
+
+    # Always add current card's ID to int_prints
+    int_prints.add(f"{card['set']}-{card['number']}")
+    updates['international_prints'] = ','.join(sorted(int_prints))
+    updates['cardmarket_url'] = cardmarket_url
+
+    if len(int_prints) > 1:
+        log.append(f"   → Found {len(int_prints)} int. prints: {', '.join(sorted(int_prints)[:4])}{'...' if len(int_prints) > 4 else ''}")
+    else:
+        log.append(f"   ℹ Single print: {card['name']}")
+    if cardmarket_url:
+        log.append("   ✓ Cardmarket link found")
+    return updates, log
+
+
+class DetailBrowser:
+    """Chrome instance of one detail worker (Selenium fallback) with its own restart / session recovery."""
+
+    def __init__(self, settings: Dict[str, object]):
+        self.settings = settings
+        self.driver = None
+        self.pages = 0  # pages loaded since last (re)start
+
+    def restart(self):
+        self.quit()
+        self.driver = create_browser(self.settings)
+        self.pages = 0
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+    def page_source(self, url: str, limiter) -> str:
+        """Load url (counted against the global rate limit) and return the rendered HTML."""
+        if self.driver is None or self.pages >= BROWSER_RESTART_EVERY:
+            self.restart()
+
+        max_retries = 3
+        for retry in range(max_retries):
+            try:
+                with limiter:
+                    self.driver.get(url)
+                break  # Success, exit retry loop
+            except Exception as e:
+                error_msg = str(e).lower()
+
+                # Handle network errors (DNS resolution, connection errors)
+                if 'err_name_not_resolved' in error_msg or 'err_connection' in error_msg or 'network' in error_msg:
+                    if retry == max_retries - 1:
+                        raise
+                    wait_time = 10 * (retry + 1)  # Increase wait time with each retry
+                    print(f"[All Cards Scraper] NETWORK ERROR: waiting {wait_time} seconds before retry {retry+1}/{max_retries}...")
+                    time.sleep(wait_time)
+
+                # Handle session errors (browser crashes, session timeouts)
+                elif 'invalid session id' in error_msg or 'session' in error_msg:
+                    if retry == max_retries - 1:
+                        raise
+                    print(f"[All Cards Scraper] SESSION ERROR: restarting browser (retry {retry+1}/{max_retries})...")
+                    self.restart()
+                    time.sleep(2)
+                else:
+                    raise  # Re-raise if it's not a known recoverable error
+
+        self.pages += 1
+        # Wait for image to load
+        time.sleep(float(self.settings.get("detail_page_wait_seconds", 2.0)))
+        return self.driver.page_source
+
+
 def scrape_card_details(settings: Dict[str, object], cards: List[Dict[str, str]], 
                         existing_cards: List[Dict[str, str]], csv_path: str, append_mode: bool) -> List[Dict[str, str]]:
     """Scrape detail page for each card to get image URL and rarity.
     
-    Writes CSV progressively every 100 cards so other tools can use updated data while scraping continues.
-    Browser is restarted every 1000 cards to prevent session timeout issues.
+    detail_workers threads pull cards from a shared queue and read the detail pages over HTTP;
+    all of them share one rate limit for limitlesstcg.com (detail_requests_per_second).
+    A worker only starts its own Chrome (Selenium fallback) if a page can't be read over HTTP.
+    Results are merged in the main thread and appended to a JSONL journal (card_details_journal);
+    the journal is compacted into the CSV every journal_compact_minutes and at the end. A crashed
+    run resumes from the journal. CardDataManager applies the journal on top of the CSV, so its
+readers see results before compaction; the CSV file alone is only current after it.
     """
-    print(f"\n[All Cards Scraper] Now scraping detail pages for {len(cards)} cards...")
-    print("[All Cards Scraper] This may take a while - opening ~1 page per card...")
-    print("[All Cards Scraper] CSV will be updated every 100 cards with latest details...")
-    print("[All Cards Scraper] Browser will restart every 1000 cards to prevent session issues...")
-    
-    def create_browser():
-        """Create a new Chrome browser instance with standard settings."""
-        chrome_options = Options()
-        if settings.get("headless", True):
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        return webdriver.Chrome(options=chrome_options)
-    
-    driver = create_browser()
-    restart_counter = 0  # Track cards processed since last restart
-    
-    def write_csv_batch():
-        """Write all cards (existing + new with current details) to CSV with deduplication."""
+    workers = max(1, int(settings.get("detail_workers", 4)))
+    rate = float(settings.get("detail_requests_per_second", 2.0))
+    selenium_fallback = bool(settings.get("detail_selenium_fallback", True))
+    limiter = get_http_client().set_rate_limit('limitlesstcg.com', rate, max_in_flight=workers)
+
+    compact_every = float(settings.get("journal_compact_minutes", 10)) * 60
+
+    # Resume: cards already in the journal (previous run crashed before compaction) are not scraped again
+    journal = DetailsJournal(journal_path_for(csv_path))
+    journaled = journal.load()
+    resumed = 0
+    for card in cards:
+        fields = journaled.get(card_key(card))
+        if fields:
+            card.update(fields)
+            resumed += 1
+    # Journaled cards outside this run's list still belong in the CSV (or stay in the journal)
+    applied = {card_key(card) for card in cards if card_key(card) in journaled}
+    if append_mode:
+        for card in existing_cards:
+            fields = journaled.get(card_key(card))
+            if fields:
+                card.update(fields)
+                applied.add(card_key(card))
+    unapplied = {key: fields for key, fields in journaled.items() if key not in applied}
+    journal.entries = len(applied)
+
+    todo = [card for card in cards if card.get('card_url') and card_key(card) not in journaled]  # Skip cards without URL
+    if resumed:
+        print(f"\n[All Cards Scraper] RESUME: {resumed} cards already in {journal.path}, skipping them")
+    if unapplied:
+        print(f"[All Cards Scraper] {len(unapplied)} journaled results match no card of this run - kept in the journal")
+    print(f"\n[All Cards Scraper] Now scraping detail pages for {len(todo)} cards...")
+    print(f"[All Cards Scraper] {workers} workers, max {rate:g} requests/second to limitlesstcg.com")
+    print(f"[All Cards Scraper] Results go to {journal.path}, CSV is compacted every {compact_every / 60:g} minutes...")
+    
+    browsers: List[DetailBrowser] = []
+    browsers_lock = threading.Lock()
+    worker_state = threading.local()
+
+    def worker_browser() -> DetailBrowser:
+        browser = getattr(worker_state, 'browser', None)
+        if browser is None:
+            browser = worker_state.browser = DetailBrowser(settings)
+            with browsers_lock:
+                browsers.append(browser)
+        return browser
+
+    def scrape_one(card: Dict[str, str]) -> (Dict[str, str], List[str]):
+        # Build full URL if relative
+        full_url = urljoin("https://limitlesstcg.com", card['card_url'])
+        page = fetch_card_detail_page(full_url)
+        if page is None:
+            if not selenium_fallback:
+                raise RuntimeError(f"Detail page not available: {full_url}")
+            page = parse_card_detail_page(full_url, worker_browser().page_source(full_url, limiter))
+        return extract_card_details(card, page)
+
+    def compact_journal():
+        """Write all cards (existing + new with current details) to CSV with deduplication, then clear the journal."""
         all_data = (existing_cards + cards) if append_mode else cards
         
         # Deduplicate by unique key (name::set::number) before writing
         seen_keys = set()
         deduplicated_data = []
         for card in all_data:
-            key = f"{card.get('name', '')}::{card.get('set', '')}::{card.get('number', '')}"
-            if key and key not in seen_keys:
+            key = card_key(card)
+            if key not in seen_keys:
                 seen_keys.add(key)
                 deduplicated_data.append(card)
         
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            fieldnames = ['name', 'set', 'number', 'type', 'rarity', 'image_url', 'international_prints', 'cardmarket_url']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for card in deduplicated_data:
-                writer.writerow({
-                    'name': card.get('name', ''),
-                    'set': card.get('set', ''),
-                    'number': card.get('number', ''),
-                    'type': card.get('type', ''),
-                    'rarity': card.get('rarity', ''),
-                    'image_url': card.get('image_url', ''),
-                    'international_prints': card.get('international_prints', ''),
-                    'cardmarket_url': card.get('cardmarket_url', '')
-                })
+        print(f"[All Cards Scraper] COMPACTING: Writing {journal.entries} journaled results to {csv_path}...")
+        write_cards_csv(csv_path, deduplicated_data)
+        journal.clear(keep=unapplied)
     
+    executor = ThreadPoolExecutor(max_workers=workers)
+    last_compaction = time.monotonic()
     try:
-        for idx, card in enumerate(cards):
+        futures = {executor.submit(scrape_one, card): card for card in todo}
+        for done, future in enumerate(as_completed(futures), 1):
+            card = futures[future]
+            print(f"[All Cards Scraper] [{done}/{len(todo)}] {card['name']} ({card['set']} {card['number']})...")
             try:
-                if not card.get('card_url'):
-                    # Skip cards without URL
-                    continue
-                
-                # Browser restart every 1000 cards to prevent session timeout
-                if restart_counter >= 1000:
-                    print(f"\n[All Cards Scraper] BROWSER RESTART: Processed {restart_counter} cards, restarting browser...")
-                    try:
-                        driver.quit()
-                    except:
-                        pass
-                    driver = create_browser()
-                    restart_counter = 0
-                    print("[All Cards Scraper] Browser restarted successfully!")
-                
-                # Build full URL if relative
-                if card['card_url'].startswith('/'):
-                    full_url = f"https://limitlesstcg.com{card['card_url']}"
-                else:
-                    full_url = card['card_url']
-                
-                print(f"[All Cards Scraper] [{idx+1}/{len(cards)}] {card['name']} ({card['set']} {card['number']})...")
-                
-                # Try to load the page with session recovery
-                max_retries = 3
-                for retry in range(max_retries):
-                    try:
-                        driver.get(full_url)
-                        break  # Success, exit retry loop
-                    except Exception as e:
-                        error_msg = str(e).lower()
-                        
-                        # Handle network errors (DNS resolution, connection errors)
-                        if 'err_name_not_resolved' in error_msg or 'err_connection' in error_msg or 'network' in error_msg:
-                            print(f"[All Cards Scraper] NETWORK ERROR: Cannot reach server")
-                            if retry < max_retries - 1:
-                                wait_time = 10 * (retry + 1)  # Increase wait time with each retry
-                                print(f"   ⏸ Waiting {wait_time} seconds before retry {retry+1}/{max_retries}...")
-                                time.sleep(wait_time)
-                            else:
-                                print(f"[All Cards Scraper] NETWORK FAILED after {max_retries} retries")
-                                print(f"   ⚠ Skipping card: {card['name']}")
-                                raise
-                        
-                        # Handle session errors (browser crashes, session timeouts)
-                        elif 'invalid session id' in error_msg or 'session' in error_msg:
-                            print(f"[All Cards Scraper] SESSION ERROR detected: {e}")
-                            if retry < max_retries - 1:
-                                print(f"[All Cards Scraper] RECOVERING: Restarting browser (retry {retry+1}/{max_retries})...")
-                                try:
-                                    driver.quit()
-                                except:
-                                    pass
-                                driver = create_browser()
-                                restart_counter = 0
-                                time.sleep(2)  # Wait a bit before retrying
-                            else:
-                                print(f"[All Cards Scraper] FAILED after {max_retries} retries, skipping card")
-                                raise
-                        else:
-                            raise  # Re-raise if it's not a known recoverable error
-                
-                # Wait for image to load
-                time.sleep(float(settings.get("detail_page_wait_seconds", 2.0)))
-                
-                # Extract image URL from <img class="card shadow resp-w">
-                try:
-                    img_elem = driver.find_element(By.CSS_SELECTOR, "img.card.shadow.resp-w")
-                    image_url = img_elem.get_attribute('src')
-                    if image_url:
-                        card['image_url'] = image_url
-                except:
-                    pass
-                
-                # Extract rarity from card-prints div with multiple fallback strategies
-                try:
-                    rarity_found = False
-                    
-                    # Strategy 1: Try .card-prints-current .prints-current-details span (most reliable)
-                    try:
-                        rarity_spans = driver.find_elements(By.CSS_SELECTOR, ".card-prints-current .prints-current-details span")
-                        if len(rarity_spans) >= 2:
-                            rarity_info = rarity_spans[1].get_attribute('textContent').strip()
-                            # Extract rarity from format like "· Double Rare"
-                            if '·' in rarity_info:
-                                rarity = rarity_info.split('·')[1].strip()
-                                if rarity:
-                                    card['rarity'] = rarity
-                                    rarity_found = True
-                    except:
-                        pass
-                    
-                    # Strategy 2: Try the prints table rows (alternative method)
-                    if not rarity_found:
-                        try:
-                            # Look for the current card's row in the prints table
-                            table = driver.find_element(By.CSS_SELECTOR, "table.card-prints-versions")
-                            rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-                            
-                            current_set = card['set']
-                            current_number = card['number']
-                            
-                            for row in rows:
-                                cells = row.find_elements(By.TAG_NAME, "td")
-                                if len(cells) >= 2:
-                                    # Check if this row matches current card (set-number)
-                                    first_cell_text = cells[0].get_attribute('textContent').strip()
-                                    if f"{current_set}-{current_number}" in first_cell_text or first_cell_text.startswith(f"{current_set} "):
-                                        # Extract rarity from second column
-                                        rarity_text = cells[1].get_attribute('textContent').strip()
-                                        if rarity_text and rarity_text not in ['—', '-', '']:
-                                            card['rarity'] = rarity_text
-                                            rarity_found = True
-                                            break
-                        except:
-                            pass
-                    
-                    # Log if rarity extraction failed
-                    if not rarity_found:
-                        print(f"      [WARNING] Could not extract rarity for {card['set']}-{card['number']}")
-                        
-                except Exception as e:
-                    print(f"      [ERROR] Rarity extraction failed for {card['set']}-{card['number']}: {e}")
-                
-                # For Promo sets: If rarity is empty, set it to "Promo"
-                # This makes Promo cards easier to track and fixes threshold logic in frontend
-                PROMO_SETS = ['MEP', 'SVP', 'SP', 'SMP', 'XYP', 'BWP', 'HSP', 'DPP', 'NP', 'WP', 
-                              'POP', 'SWSH', 'SWSHP', 'PR-SW', 'PR-SM', 'PR-XY', 'PR-BLW', 'PR-HS', 'PR-DP']
-                if card['set'] in PROMO_SETS and not card.get('rarity'):
-                    card['rarity'] = 'Promo'
-                
-                # Extract International Prints + Cardmarket Link from the prints table
-                # HTML structure: <table class="card-prints-versions"> with rows containing card links and prices
-                try:
-                    int_prints = set()
-                    cardmarket_url = ''
-                    
-                    # Find the card-prints-versions table
-                    try:
-                        table = driver.find_element(By.CSS_SELECTOR, "table.card-prints-versions")
-                        
-                        # Get all rows in the table body
-                        rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-                        
-                        for row in rows:
-                            # Skip header row
-                            if row.find_elements(By.TAG_NAME, "th"):
-                                continue
-                            
-                            # Extract Int. Print from first column (td with <a href="/cards/SET/NUM">)
-                            try:
-                                first_td = row.find_element(By.CSS_SELECTOR, "td:first-child")
-                                card_link = first_td.find_element(By.CSS_SELECTOR, "a[href*='/cards/']")
-                                href = card_link.get_attribute('href')
-                                
-                                if href and '/cards/' in href:
-                                    # Extract SET/NUM from URL
-                                    # URLs can be: /cards/SET/NUM or /cards/en/SET/NUM (with language prefix)
-                                    path = href.split('/cards/')[-1].strip()
-                                    parts = path.split('/')
-                                    
-                                    # Remove language prefix (en, de, fr, etc.) if present
-                                    if len(parts) >= 3 and parts[0].lower() in ['en', 'de', 'fr', 'es', 'it', 'pt', 'ja', 'ko']:
-                                        # Format: /cards/en/SET/NUM
-                                        set_code = parts[1].upper()
-                                        set_num = parts[2]
-                                    elif len(parts) >= 2:
-                                        # Format: /cards/SET/NUM
-                                        set_code = parts[0].upper()
-                                        set_num = parts[1]
-                                    else:
-                                        continue
-                                    
-                                    # Skip Japanese sets
-                                    if set_code != 'JP':
-                                        card_id = f"{set_code}-{set_num}"
-                                        int_prints.add(card_id)
-                            except:
-                                pass  # Row might not have card link (could be current card without href)
-                            
-                            # Extract Cardmarket URL from current card's row (class="current")
-                            try:
-                                if 'current' in row.get_attribute('class'):
-                                    # Find EUR price column (third td) with Cardmarket link
-                                    eur_link = row.find_element(By.CSS_SELECTOR, "a.card-price.eur")
-                                    cardmarket_url = eur_link.get_attribute('href') or ''
-                            except:
-                                pass
-                        
-                        # Always add current card's ID to int_prints
-                        current_id = f"{card['set']}-{card['number']}"
-                        int_prints.add(current_id)
-                        
-                        # Store results
-                        card['international_prints'] = ','.join(sorted(list(int_prints)))
-                        card['cardmarket_url'] = cardmarket_url
-                        
-                        if len(int_prints) > 1:
-                            print(f"   → Found {len(int_prints)} int. prints: {', '.join(sorted(list(int_prints))[:4])}{'...' if len(int_prints) > 4 else ''}")
-                        else:
-                            print(f"   ℹ Single print: {card['name']}")
-                        
-                        if cardmarket_url:
-                            print(f"   ✓ Cardmarket link found")
-                        
-                    except Exception as e:
-                        # Fallback: use own ID if table not found
-                        card['international_prints'] = f"{card['set']}-{card['number']}"
-                        card['cardmarket_url'] = ''
-                        
-                        # Check for network errors (critical)
-                        error_str = str(e)
-                        if 'ERR_NAME_NOT_RESOLVED' in error_str or 'ERR_CONNECTION' in error_str:
-                            print(f"   ⚠ NETWORK ERROR: {error_str.split('Stacktrace')[0].strip()}")
-                            print(f"   ⏸ Pausing for 10 seconds before retry...")
-                            time.sleep(10)
-                        elif 'no such element' in error_str and 'card-prints-versions' in error_str:
-                            # Table not found - normal for single-print cards
-                            print(f"   ℹ No int. prints table (single print)")
-                        else:
-                            # Other errors
-                            print(f"   ⚠ Could not extract prints: {error_str.split('Stacktrace')[0].strip()[:100]}")
-                    
-                except Exception as e:
-                    # Final fallback
-                    card['international_prints'] = f"{card['set']}-{card['number']}"
-                    card['cardmarket_url'] = ''
-                    error_str = str(e)
-                    print(f"   ERROR: {error_str.split('Stacktrace')[0].strip()[:150]}")
-                
-                # Be nice to the server - small delay between requests
-                time.sleep(float(settings.get("detail_request_delay_seconds", 0.5)))
-                
-                restart_counter += 1  # Increment counter for browser restart logic
-                
-                # Progressive CSV update every 100 cards
-                if (idx + 1) % 100 == 0:
-                    print(f"[All Cards Scraper] OK: Completed {idx + 1} detail pages")
-                    print(f"[All Cards Scraper] UPDATING CSV: Writing current progress to {csv_path}...")
-                    write_csv_batch()
-                    print(f"[All Cards Scraper] CSV updated! Other tools can now use {idx + 1} cards with details.")
-                
+                updates, log = future.result()
             except Exception as e:
-                print(f"[All Cards Scraper] ERROR scraping {card['name']}: {e}")
+                print(f"[All Cards Scraper] ERROR scraping {card['name']}: {str(e).split('Stacktrace')[0].strip()[:150]}")
                 continue
+            card.update(updates)
+            journal.append(card_key(card), updates)
+            for line in log:
+                print(line)
+
+            # Compact journal into the CSV on a timer (readers can use CSV + journal in between)
+            if time.monotonic() - last_compaction >= compact_every:
+                print(f"[All Cards Scraper] OK: Completed {done} detail pages")
+                compact_journal()
+                last_compaction = time.monotonic()
     
     finally:
-        try:
-            driver.quit()
-        except:
-            pass
+        executor.shutdown(wait=True, cancel_futures=True)
+        for browser in browsers:
+            browser.quit()
+        if journal.entries:
+            compact_journal()
+        journal.close()
     
     # Count how many got image URLs
     cards_with_images = sum(1 for c in cards if c.get('image_url'))
@@ -832,21 +785,7 @@ try:
     
     # NOTE: Sorting will happen in final CSV write, no need to sort partial data here
     
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        fieldnames = ['name', 'set', 'number', 'type', 'rarity', 'image_url', 'international_prints', 'cardmarket_url']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for card in deduplicated_data:
-            writer.writerow({
-                'name': card.get('name', ''),
-                'set': card.get('set', ''),
-                'number': card.get('number', ''),
-                'type': card.get('type', ''),
-                'rarity': card.get('rarity', ''),
-                'image_url': card.get('image_url', ''),
-                'international_prints': card.get('international_prints', ''),
-                'cardmarket_url': card.get('cardmarket_url', '')
-            })
+    write_cards_csv(csv_path, deduplicated_data)
 
     print(f"[All Cards Scraper] OK: Partial CSV saved to {csv_path}")
     print(f"[All Cards Scraper] {len(deduplicated_data)} unique cards are now available for other tools!")
@@ -865,7 +804,7 @@ try:
         print("=" * 80)
         all_cards = scrape_card_details(settings, all_cards, existing_cards, csv_path, append_mode)
 
-    # Final CSV write to ensure all data is saved (in case last batch was < 100 cards)
+    # Final CSV write, sorted (the detail phase already compacted its journal into the CSV)
     print("\n" + "=" * 80)
     print("FINAL CSV WRITE: Saving all cards with latest details...")
     print("=" * 80)
@@ -959,21 +898,7 @@ try:
     deduplicated_data.sort(key=sort_key)
     print(f"[All Cards Scraper] ✓ Cards sorted (newest sets first)")
     
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        fieldnames = ['name', 'set', 'number', 'type', 'rarity', 'image_url', 'international_prints', 'cardmarket_url']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for card in deduplicated_data:
-            writer.writerow({
-                'name': card.get('name', ''),
-                'set': card.get('set', ''),
-                'number': card.get('number', ''),
-                'type': card.get('type', ''),
-                'rarity': card.get('rarity', ''),
-                'image_url': card.get('image_url', ''),
-                'international_prints': card.get('international_prints', ''),
-                'cardmarket_url': card.get('cardmarket_url', '')
-            })
+    write_cards_csv(csv_path, deduplicated_data)
 
     print(f"\n[All Cards Scraper] OK: Saved to {csv_path}")
     print(f"[All Cards Scraper] Total cards in database: {len(deduplicated_data)}")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Card Lookup Benchmark
+=====================
+Micro-benchmark for CardDatabaseLookup hot paths on the shipped data/ CSVs.
+
+Compares the indexed lookups against the previous linear-scan implementations
+and checks that both return identical results.
+
+Usage:
+    python benchmark_card_lookup.py [--queries 5000]
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+from typing import Callable, List, Optional, Tuple
+
+from card_scraper_shared import CardDatabaseLookup
+
+
+def legacy_get_name_by_set_number(card_db: CardDatabaseLookup, set_code: str, card_number: str) -> Optional[str]:
+    """Previous implementation: scan every variant of every card name."""
+    if not set_code or not card_number:
+        return None
+
+    normalized_set = set_code.strip().upper()
+    normalized_number = card_number.strip().lstrip('0') or card_number.strip()
+
+    for db_name, variants in card_db.cards.items():
+        for variant in variants:
+            variant_set = (variant['set_code'] or '').strip().upper()
+            variant_number = (variant['set_number'] or '').strip()
+            variant_number_norm = variant_number.lstrip('0') or variant_number
+
+            if variant_set == normalized_set and (
+                variant_number == card_number.strip() or variant_number_norm == normalized_number
+            ):
+                return variant['name']
+
+    return None
+
+
+def build_set_number_queries(card_db: CardDatabaseLookup, count: int) -> List[Tuple[str, str]]:
+    """Sample realistic (set, number) queries: hits, zero-padded hits and misses."""
+    rng = random.Random(42)
+    cards = card_db.manager.get_all_cards()
+    queries = []
+    for _ in range(count):
+        card = rng.choice(cards)
+        roll = rng.random()
+        if roll < 0.7:
+            queries.append((card.get('set', ''), card.get('number', '')))
+        elif roll < 0.9:
+            queries.append((card.get('set', '').lower(), card.get('number', '').zfill(3)))
+        else:
+            queries.append(('XXX', str(rng.randint(1, 400))))
+    return queries
+
+
+def time_calls(func: Callable, queries: List[Tuple[str, str]]) -> Tuple[float, list]:
+    """Run func over all queries and return (seconds, results)."""
+    start = time.perf_counter()
+    results = [func(set_code, number) for set_code, number in queries]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CardDatabaseLookup lookups')
+    parser.add_argument('--queries', type=int, default=5000, help='Number of lookups to time')
+    parser.add_argument('--legacy-queries', type=int, default=500,
+                        help='Number of lookups for the (slow) legacy scan')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        card_db = CardDatabaseLookup()
+    print(f"Loaded card database in {(time.perf_counter() - start) * 1000:.0f} ms "
+          f"({len(card_db.cards)} unique names)")
+
+    queries = build_set_number_queries(card_db, args.queries)
+    legacy_queries = queries[:args.legacy_queries]
+
+    print("\nget_name_by_set_number")
+    print("-" * 60)
+    indexed_time, indexed_results = time_calls(card_db.get_name_by_set_number, queries)
+    legacy_time, legacy_results = time_calls(
+        lambda s, n: legacy_get_name_by_set_number(card_db, s, n), legacy_queries
+    )
+
+    mismatches = sum(1 for a, b in zip(indexed_results, legacy_results) if a != b)
+    indexed_per_call = indexed_time / len(queries) * 1e6
+    legacy_per_call = legacy_time / len(legacy_queries) * 1e6
+
+    print(f"  Legacy scan : {legacy_per_call:10.2f} µs/call ({len(legacy_queries)} calls)")
+    print(f"  Reverse map : {indexed_per_call:10.2f} µs/call ({len(queries)} calls)")
+    print(f"  Speedup     : {legacy_per_call / indexed_per_call:10.0f}x")
+    print(f"  Mismatches  : {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -19,11 +19,27 @@ Usage:
 """
 
 import csv
+import gc
+import hashlib
 import os
+import pickle
 import sys
+import time
+from array import array
+from collections.abc import Mapping, Sequence
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+from card_details_journal import JOURNAL_FILE, DetailsJournal, card_key
+
+# Compiled snapshot of the parsed + merged databases (see CardDataManager._load_snapshot).
+# Bump SNAPSHOT_VERSION whenever the snapshot layout or merge logic changes.
+SNAPSHOT_FILENAME = 'card_database_snapshot.pickle'
+SNAPSHOT_VERSION = 3
+# The detail journal of a running all_cards_scraper counts as a source: its results are
+# applied on top of all_cards_database.csv until the scraper compacts them into the CSV.
+SOURCE_FILENAMES = ('all_cards_database.csv', 'japanese_cards_database.csv', JOURNAL_FILE)
+
 
 def get_data_dir() -> str:
     """Get the correct data directory path.
@@ -42,19 +58,375 @@ def get_data_dir() -> str:
     return "data"
 
 
+# ============================================================================
+# COLUMNAR CARD STORE
+# ============================================================================
+
+IMAGE_CDN = 'https://limitlesstcg.nyc3.cdn.digitaloceanspaces.com'
+CARDMARKET_PREFIX = 'https://www.cardmarket.com/en/Pokemon/Products/Singles/'
+CARDMARKET_SUFFIX = '?utm_source=limitlesstcg&utm_medium=text&utm_campaign=card_prices'
+
+# Storage kinds for the URL-like string columns
+KIND_EMPTY = 0      # ''
+KIND_DERIVED = 1    # re-built from set + number (or prefix/suffix + stored middle)
+KIND_DERIVED_JP = 2  # Japanese CDN image URL
+KIND_LITERAL = 255  # stored verbatim
+
+
+class CardStore:
+    """
+    Columnar storage for card rows (replaces one csv.DictReader dict per card).
+    
+    - name / number: interned strings in parallel lists
+    - set / type / rarity / _source: small-int codes into per-column tables
+    - image_url / international_prints / cardmarket_url: only what cannot be
+      re-derived from set + number is kept (see KIND_*)
+    - present: per-row bitmask of which FIELDS the source row had, so the
+      CardRow view behaves exactly like the old dict (missing key vs. '')
+    """
+    
+    FIELDS = ('name', 'set', 'number', 'type', 'rarity', 'image_url',
+              'international_prints', 'cardmarket_url', '_source')
+    CODED_FIELDS = ('set', 'type', 'rarity', '_source')
+    FIELD_BITS = {field: 1 << i for i, field in enumerate(FIELDS)}
+    
+    def __init__(self):
+        self.names: List[str] = []
+        self.numbers: List[str] = []
+        self.codes = {field: array('H') for field in self.CODED_FIELDS}
+        self.tables = {field: [''] for field in self.CODED_FIELDS}  # code 0 = ''
+        self._code_lookup = {field: {'': 0} for field in self.CODED_FIELDS}
+        self.image_url_kinds = array('B')
+        self.prints_kinds = array('B')
+        self.cardmarket_kinds = array('B')
+        self.present = array('H')
+        # Sparse columns: index -> stored string (only for rows that need one)
+        self.image_url_literals: Dict[int, str] = {}
+        self.prints_literals: Dict[int, str] = {}
+        self.cardmarket_literals: Dict[int, str] = {}
+        self.extras: Dict[int, Dict[str, str]] = {}  # columns not in FIELDS
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def _code(self, field: str, value: str) -> int:
+        lookup = self._code_lookup[field]
+        code = lookup.get(value)
+        if code is None:
+            code = len(self.tables[field])
+            self.tables[field].append(sys.intern(value))
+            lookup[value] = code
+        return code
+    
+    @staticmethod
+    def _image_url(kind: int, set_code: str, number: str) -> str:
+        if kind == KIND_DERIVED:
+            return f"{IMAGE_CDN}/tpci/{set_code}/{set_code}_{number.zfill(3)}_R_EN_LG.png"
+        return f"{IMAGE_CDN}/tpc/{set_code}/{set_code}_{number}_R_JP_LG.png"
+    
+    def append(self, row: Dict[str, str]) -> int:
+        """Add a csv.DictReader row and return its index."""
+        index = len(self.names)
+        mask = 0
+        for field, value in row.items():
+            bit = self.FIELD_BITS.get(field)
+            if bit is None:
+                self.extras.setdefault(index, {})[field] = value
+            else:
+                mask |= bit
+        self.present.append(mask)
+        
+        set_code = row.get('set') or ''
+        number = row.get('number') or ''
+        self.names.append(sys.intern(row.get('name') or ''))
+        self.numbers.append(sys.intern(number))
+        for field in self.CODED_FIELDS:
+            self.codes[field].append(self._code(field, row.get(field) or ''))
+        
+        image_url = row.get('image_url') or ''
+        if not image_url:
+            self.image_url_kinds.append(KIND_EMPTY)
+        elif image_url == self._image_url(KIND_DERIVED, set_code, number):
+            self.image_url_kinds.append(KIND_DERIVED)
+        elif image_url == self._image_url(KIND_DERIVED_JP, set_code, number):
+            self.image_url_kinds.append(KIND_DERIVED_JP)
+        else:
+            self.image_url_kinds.append(KIND_LITERAL)
+            self.image_url_literals[index] = image_url
+        
+        prints = row.get('international_prints') or ''
+        if not prints:
+            self.prints_kinds.append(KIND_EMPTY)
+        elif prints == f"{set_code}-{number}":
+            self.prints_kinds.append(KIND_DERIVED)
+        else:
+            self.prints_kinds.append(KIND_LITERAL)
+            self.prints_literals[index] = prints
+        
+        cardmarket_url = row.get('cardmarket_url') or ''
+        if not cardmarket_url:
+            self.cardmarket_kinds.append(KIND_EMPTY)
+        elif cardmarket_url.startswith(CARDMARKET_PREFIX) and cardmarket_url.endswith(CARDMARKET_SUFFIX):
+            self.cardmarket_kinds.append(KIND_DERIVED)
+            self.cardmarket_literals[index] = cardmarket_url[len(CARDMARKET_PREFIX):-len(CARDMARKET_SUFFIX)]
+        else:
+            self.cardmarket_kinds.append(KIND_LITERAL)
+            self.cardmarket_literals[index] = cardmarket_url
+        
+        return index
+    
+    def has_field(self, index: int, field: str) -> bool:
+        bit = self.FIELD_BITS.get(field)
+        if bit is None:
+            return field in self.extras.get(index, ())
+        return bool(self.present[index] & bit)
+    
+    def get(self, index: int, field: str) -> str:
+        """Value of field for a row; KeyError if the source row had no such column."""
+        bit = self.FIELD_BITS.get(field)
+        if bit is None:
+            return self.extras.get(index, {})[field]
+        if not self.present[index] & bit:
+            raise KeyError(field)
+        
+        if field == 'name':
+            return self.names[index]
+        if field == 'number':
+            return self.numbers[index]
+        if field in self.codes:
+            return self.tables[field][self.codes[field][index]]
+        if field == 'image_url':
+            kind = self.image_url_kinds[index]
+            if kind == KIND_EMPTY:
+                return ''
+            if kind == KIND_LITERAL:
+                return self.image_url_literals[index]
+            return self._image_url(kind, self.get_set(index), self.numbers[index])
+        if field == 'international_prints':
+            kind = self.prints_kinds[index]
+            if kind == KIND_EMPTY:
+                return ''
+            if kind == KIND_LITERAL:
+                return self.prints_literals[index]
+            return f"{self.get_set(index)}-{self.numbers[index]}"
+        # cardmarket_url
+        kind = self.cardmarket_kinds[index]
+        if kind == KIND_EMPTY:
+            return ''
+        if kind == KIND_LITERAL:
+            return self.cardmarket_literals[index]
+        return f"{CARDMARKET_PREFIX}{self.cardmarket_literals[index]}{CARDMARKET_SUFFIX}"
+    
+    def get_set(self, index: int) -> str:
+        return self.tables['set'][self.codes['set'][index]]
+    
+    def set_source(self, index: int, source: str):
+        """Mark a row's _source (the only field changed after loading)."""
+        self.codes['_source'][index] = self._code('_source', source)
+        self.present[index] |= self.FIELD_BITS['_source']
+    
+    def iter_fields(self, index: int):
+        mask = self.present[index]
+        for field in self.FIELDS:
+            if mask & self.FIELD_BITS[field]:
+                yield field
+        yield from self.extras.get(index, ())
+
+
+class CardRow(Mapping):
+    """Read-only dict-like view of one CardStore row (backward compatible with the old row dicts)."""
+    
+    __slots__ = ('store', 'index')
+    
+    def __init__(self, store: CardStore, index: int):
+        self.store = store
+        self.index = index
+    
+    def __getitem__(self, field: str) -> str:
+        return self.store.get(self.index, field)
+    
+    def __contains__(self, field) -> bool:
+        return self.store.has_field(self.index, field)
+    
+    def __iter__(self):
+        return self.store.iter_fields(self.index)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self.store.iter_fields(self.index))
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class CardRowSequence(Sequence):
+    """List-like view over a selection of CardStore rows (yields CardRow views)."""
+    
+    __slots__ = ('store', 'indices')
+    
+    def __init__(self, store: CardStore, indices):
+        self.store = store
+        self.indices = indices  # range or array('I')
+    
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [CardRow(self.store, index) for index in self.indices[position]]
+        return CardRow(self.store, self.indices[position])
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+    
+    def __iter__(self):
+        store = self.store
+        for index in self.indices:
+            yield CardRow(store, index)
+
+
+# ============================================================================
+# CARD DATA MANAGER
+# ============================================================================
+
 class CardDataManager:
     """Unified access to English and Japanese card databases."""
     
-    def __init__(self):
-        """Initialize the manager by loading both databases."""
-        self.english_cards = []
-        self.japanese_cards = []
-        self.merged_cards = []
-        self.card_index = {}  # (set, number) -> card dict
+    def __init__(self, use_snapshot: bool = True):
+        """
+        Initialize the manager by loading both databases.
+        
+        Args:
+            use_snapshot: Load from / refresh the compiled snapshot in data/
+                          instead of always re-parsing the CSVs.
+        """
+        self.store = CardStore()  # all loaded rows, column-wise
+        self.english_cards = CardRowSequence(self.store, range(0))
+        self.japanese_cards = CardRowSequence(self.store, range(0))
+        self.merged_cards = CardRowSequence(self.store, array('I'))
+        self.card_index = {}  # SET -> {number: store row index}
+        
+        if use_snapshot and self._load_snapshot():
+            self._build_index()
+            return
+        
+        # Taken before parsing: a CSV rewritten meanwhile must not end up under the new signature
+        signature = self._source_signature() if use_snapshot else None
+        hashes = self._source_hashes() if use_snapshot else None
         
         self._load_databases()
         self._merge_and_deduplicate()
         self._build_index()
+        
+        if use_snapshot:
+            self._save_snapshot(signature, hashes)
+    
+    def _snapshot_path(self) -> Path:
+        return Path(get_data_dir()) / SNAPSHOT_FILENAME
+    
+    def _source_signature(self) -> List[Optional[Tuple[str, int, int]]]:
+        """Cheap change detection for the source files: (name, size, mtime_ns) each."""
+        data_dir = Path(get_data_dir())
+        signature = []
+        for filename in SOURCE_FILENAMES:
+            path = data_dir / filename
+            try:
+                stat = path.stat()
+                signature.append((filename, stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                signature.append(None)
+        return signature
+    
+    def _source_hashes(self) -> List[Optional[str]]:
+        """Content hashes of the source files (used when only mtimes changed)."""
+        data_dir = Path(get_data_dir())
+        hashes = []
+        for filename in SOURCE_FILENAMES:
+            path = data_dir / filename
+            try:
+                hashes.append(hashlib.sha1(path.read_bytes()).hexdigest())
+            except OSError:
+                hashes.append(None)
+        return hashes
+    
+    def _load_snapshot(self) -> bool:
+        """
+        Load the compiled snapshot if it matches the current source files (CSVs + detail journal).
+        
+        The snapshot is valid when size + mtime of every source file match. If only
+        the mtimes differ (e.g. after a git checkout) but the content hashes still
+        match, the snapshot is reused and its signature refreshed.
+        """
+        snapshot_path = self._snapshot_path()
+        if not snapshot_path.exists():
+            return False
+        
+        start = time.perf_counter()
+        try:
+            # Disabling the cyclic GC while unpickling ~20k dicts halves load time
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                with open(snapshot_path, 'rb') as f:
+                    snapshot = pickle.load(f)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+        except Exception as e:
+            print(f"[CardDataManager] ⚠ Could not read snapshot ({e}), rebuilding from CSV")
+            return False
+        
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            return False
+        
+        signature = self._source_signature()
+        if snapshot.get('signature') != signature:
+            # Sizes must still match for the content to possibly be unchanged
+            old_sizes = [entry[1] if entry else None for entry in snapshot.get('signature', [])]
+            new_sizes = [entry[1] if entry else None for entry in signature]
+            if old_sizes != new_sizes or snapshot.get('hashes') != self._source_hashes():
+                return False
+            snapshot['signature'] = signature
+            self._write_snapshot(snapshot)
+        
+        self.store = snapshot['store']
+        self.english_cards = CardRowSequence(self.store, snapshot['english_rows'])
+        self.japanese_cards = CardRowSequence(self.store, snapshot['japanese_rows'])
+        self.merged_cards = CardRowSequence(self.store, snapshot['merged_rows'])
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"[CardDataManager] ✓ Loaded snapshot: {len(self.merged_cards)} unique cards "
+              f"({len(self.english_cards)} English, {len(self.japanese_cards)} Japanese) in {elapsed_ms:.0f} ms")
+        return True
+    
+    def _save_snapshot(self, signature: List[Optional[Tuple[str, int, int]]], hashes: List[Optional[str]]):
+        """
+        Write the parsed + merged databases to the compiled snapshot.
+        signature / hashes must describe the CSVs as they were *before* parsing.
+        """
+        if not self.merged_cards:
+            return
+        self._write_snapshot({
+            'version': SNAPSHOT_VERSION,
+            'signature': signature,
+            'hashes': hashes,
+            'store': self.store,
+            'english_rows': self.english_cards.indices,
+            'japanese_rows': self.japanese_cards.indices,
+            'merged_rows': self.merged_cards.indices,
+        })
+    
+    def _write_snapshot(self, snapshot: Dict):
+        """Atomically replace the snapshot file (safe with stages running in parallel)."""
+        snapshot_path = self._snapshot_path()
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snapshot_path)
+            print(f"[CardDataManager] ✓ Wrote snapshot to {snapshot_path}")
+        except Exception as e:
+            print(f"[CardDataManager] ⚠ Could not write snapshot: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
     
     def _load_databases(self):
         """Load both English and Japanese card databases."""
@@ -63,8 +435,11 @@ class CardDataManager:
         # Load English cards
         english_path = Path(data_dir) / 'all_cards_database.csv'
         if english_path.exists():
-            self.english_cards = self._load_csv(english_path)
-            print(f"[CardDataManager] ✓ Loaded {len(self.english_cards)} English cards")
+            # Detail results the running scraper has not compacted into the CSV yet
+            journaled = DetailsJournal(str(Path(data_dir) / JOURNAL_FILE)).load()
+            self.english_cards = self._load_csv(english_path, journaled)
+            print(f"[CardDataManager] ✓ Loaded {len(self.english_cards)} English cards"
+                  + (f" ({len(journaled)} journaled detail results applied)" if journaled else ""))
         else:
             print(f"[CardDataManager] ⚠ English database not found at {english_path}")
         
@@ -76,18 +451,20 @@ class CardDataManager:
         else:
             print(f"[CardDataManager] ⚠ Japanese database not found at {japanese_path}")
     
-    def _load_csv(self, filepath: Path) -> List[Dict[str, str]]:
-        """Load cards from CSV file."""
-        cards = []
+    def _load_csv(self, filepath: Path, journaled: Optional[Dict[str, Dict[str, str]]] = None) -> CardRowSequence:
+        """Load cards from CSV file into the column store (journaled: card_key -> detail fields to apply)."""
+        start = len(self.store)
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
                     if row.get('name'):  # Skip empty rows
-                        cards.append(row)
+                        if journaled and card_key(row) in journaled:
+                            row.update(journaled[card_key(row)])
+                        self.store.append(row)
         except Exception as e:
             print(f"[CardDataManager] ERROR loading {filepath}: {e}")
-        return cards
+        return CardRowSequence(self.store, range(start, len(self.store)))
     
     def _merge_and_deduplicate(self):
         """
@@ -95,23 +472,27 @@ class CardDataManager:
         Priority: English preferred, Japanese as fallback for newer cards.
         """
         seen_keys = set()
+        store = self.store
+        merged_rows = array('I')
         
         # Add English cards first (priority)
-        for card in self.english_cards:
-            key = (card.get('set', ''), card.get('number', ''))
-            if key and key not in seen_keys:
-                self.merged_cards.append(card)
+        for index in self.english_cards.indices:
+            key = (store.get_set(index), store.numbers[index])
+            if key not in seen_keys:
+                merged_rows.append(index)
                 seen_keys.add(key)
         
         # Add Japanese cards not already in English
-        for card in self.japanese_cards:
-            key = (card.get('set', ''), card.get('number', ''))
-            if key and key not in seen_keys:
+        for index in self.japanese_cards.indices:
+            key = (store.get_set(index), store.numbers[index])
+            if key not in seen_keys:
                 # Mark as Japanese-only
-                card['_source'] = 'japanese'
-                self.merged_cards.append(card)
+                store.set_source(index, 'japanese')
+                merged_rows.append(index)
                 seen_keys.add(key)
         
+        self.merged_cards = CardRowSequence(store, merged_rows)
+        
         print(f"[CardDataManager] ✓ Merged to {len(self.merged_cards)} unique cards")
         print(f"[CardDataManager]   - {len(self.english_cards)} from English DB")
         print(f"[CardDataManager]   - {len(self.japanese_cards) - (len(self.merged_cards) - len(self.english_cards))} Japanese-only")
@@ -119,10 +500,12 @@ class CardDataManager:
     def _build_index(self):
         """Build lookup index for O(1) card access."""
         self.card_index = {}
-        for card in self.merged_cards:
-            key = (card.get('set', '').upper(), card.get('number', ''))
-            if key[0] and key[1]:
-                self.card_index[key] = card
+        store = self.store
+        for index in self.merged_cards.indices:
+            set_code = sys.intern(store.get_set(index).upper())
+            number = store.numbers[index]
+            if set_code and number:
+                self.card_index.setdefault(set_code, {})[number] = index
     
     def get_card(self, set_code: str, number: str) -> Optional[Dict[str, str]]:
         """
@@ -135,8 +518,8 @@ class CardDataManager:
         Returns:
             Card dictionary or None if not found
         """
-        key = (set_code.upper(), number)
-        return self.card_index.get(key)
+        index = self.card_index.get(set_code.upper(), {}).get(number)
+        return CardRow(self.store, index) if index is not None else None
     
     def get_card_by_name_and_set(self, name: str, set_code: str) -> Optional[Dict[str, str]]:
         """
@@ -241,6 +624,26 @@ class CardDataManager:
             return False
 
 
+# ============================================================================
+# SHARED INSTANCE
+# ============================================================================
+
+_shared_manager: Optional[CardDataManager] = None
+
+
+def get_shared_manager() -> CardDataManager:
+    """
+    Get or create the process-wide CardDataManager.
+    
+    CardDatabaseLookup and card_type_lookup both read from this instance, so
+    the card databases are loaded once per run no matter how many lookups exist.
+    """
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = CardDataManager()
+    return _shared_manager
+
+
 # Example usage / testing
 if __name__ == '__main__':
     print("\n" + "=" * 80)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Card Detail Page - limitlesstcg.com/cards/SET/NUM without a browser
+===================================================================
+Card detail pages are server-rendered, so the fields all_cards_scraper read
+over Selenium come straight out of the HTML:
+
+- image URL        (img.card.shadow.resp-w)
+- current print    (.card-prints-current .prints-current-details span)
+- prints table     (table.card-prints-versions tbody tr: cells, card link,
+                    Cardmarket link + EUR price a.card-price.eur, row class)
+
+The prints table lists the EUR price of every print of the card, so one page
+gives prices for all reprints at once (card_price_scraper uses this).
+
+Selenium can still hand its page_source to parse_card_detail_page (fallback).
+
+Usage:
+    from card_detail_page import fetch_card_detail_page
+
+    page = fetch_card_detail_page('https://limitlesstcg.com/cards/SVI/1')
+    if page: print(page.image_url, page.current_details)
+"""
+
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urljoin
+
+from card_list_page import VOID_TAGS
+from http_client import fetch_page
+
+PRINT_LANGUAGE_PREFIXES = ['en', 'de', 'fr', 'es', 'it', 'pt', 'ja', 'ko']
+
+
+class PrintRow:
+    """One `tbody tr` of table.card-prints-versions."""
+
+    __slots__ = ('css_class', 'has_header', 'cells', 'card_link', 'cardmarket_url', 'eur_price')
+
+    def __init__(self, css_class: str):
+        self.css_class = css_class
+        self.has_header = False  # row contains a <th>
+        self.cells: List[str] = []  # textContent of each td
+        self.card_link: Optional[str] = None  # first a[href*='/cards/'] of the first td
+        self.cardmarket_url: Optional[str] = None  # first a.card-price.eur
+        self.eur_price = ''  # its text, e.g. '0.25€'
+
+
+class CardDetailPage:
+    """Parsed detail page of one card."""
+
+    __slots__ = ('url', 'image_url', 'current_details', 'has_prints_table', 'print_rows')
+
+    def __init__(self, url: str):
+        self.url = url
+        self.image_url: Optional[str] = None
+        self.current_details: List[str] = []  # span texts, e.g. ['Scarlet & Violet (SVI)', '· Double Rare']
+        self.has_prints_table = False
+        self.print_rows: List[PrintRow] = []
+
+
+class CardDetailPageParser(HTMLParser):
+    """Collects the card image, the current print details and the prints table."""
+
+    def __init__(self, page: CardDetailPage):
+        super().__init__(convert_charrefs=True)
+        self.page = page
+        self.stack: List[Tuple[str, Set[str]]] = []  # (tag, classes) of open elements
+        self.open_spans: List[Tuple[int, List[str]]] = []  # (stack depth, text parts) of collected spans
+        self.prints_table_depth = 0  # stack depth of the open prints table (0 = none)
+        self.row: Optional[PrintRow] = None
+        self.cell: Optional[List[str]] = None
+        self.price_text: Optional[List[str]] = None  # text of the open a.card-price.eur
+        self.price_depth = 0
+
+    def _inside(self, css_class: str) -> bool:
+        return any(css_class in classes for _, classes in self.stack)
+
+    def handle_starttag(self, tag, attrs):
+        attrs_dict = dict(attrs)
+        classes = set((attrs_dict.get('class') or '').split())
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, classes))
+
+        if tag == 'img':
+            if self.page.image_url is None and {'card', 'shadow', 'resp-w'} <= classes and attrs_dict.get('src'):
+                self.page.image_url = urljoin(self.page.url, attrs_dict['src'])
+        elif tag == 'span':
+            if self._inside('prints-current-details') and self._inside('card-prints-current'):
+                parts: List[str] = []
+                self.page.current_details.append(parts)  # joined in close()
+                self.open_spans.append((len(self.stack), parts))
+        elif tag == 'table':
+            if not self.prints_table_depth and 'card-prints-versions' in classes:
+                self.page.has_prints_table = True
+                self.prints_table_depth = len(self.stack)
+        elif tag == 'tr':
+            if self.prints_table_depth and any(t == 'tbody' for t, _ in self.stack[self.prints_table_depth:]):
+                self.row = PrintRow(attrs_dict.get('class') or '')
+                self.page.print_rows.append(self.row)
+                self.cell = None
+        elif tag == 'th':
+            if self.row is not None:
+                self.row.has_header = True
+        elif tag == 'td':
+            if self.row is not None:
+                self.cell = []
+                self.row.cells.append(self.cell)
+        elif tag == 'a':
+            href = attrs_dict.get('href')
+            if self.row is not None and href:
+                if (self.row.card_link is None and len(self.row.cells) == 1 and self.cell is not None
+                        and '/cards/' in href):
+                    self.row.card_link = urljoin(self.page.url, href)
+                if self.row.cardmarket_url is None and {'card-price', 'eur'} <= classes:
+                    self.row.cardmarket_url = urljoin(self.page.url, href)
+                    self.price_text = []
+                    self.price_depth = len(self.stack)
+
+    def handle_data(self, data):
+        for _, parts in self.open_spans:
+            parts.append(data)
+        if self.cell is not None:
+            self.cell.append(data)
+        if self.price_depth:
+            self.price_text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth][0] == tag:
+                del self.stack[depth:]
+                break
+        else:
+            return
+
+        depth = len(self.stack)
+        while self.open_spans and self.open_spans[-1][0] > depth:
+            self.open_spans.pop()
+        if self.price_depth and depth < self.price_depth:
+            self.price_depth = 0
+            if self.row is not None:
+                self.row.eur_price = ''.join(self.price_text).strip()
+        if self.prints_table_depth and depth < self.prints_table_depth:
+            self.prints_table_depth = 0
+            self.row = None
+            self.cell = None
+        elif tag in ('td', 'th'):
+            self.cell = None
+        elif tag in ('tr', 'tbody'):
+            self.row = None
+            self.cell = None
+
+    def close(self):
+        super().close()
+        self.page.current_details = [''.join(parts).strip() for parts in self.page.current_details]
+        for row in self.page.print_rows:
+            row.cells = [''.join(parts).strip() for parts in row.cells]
+
+
+def parse_print_link(href: str) -> Optional[Tuple[str, str]]:
+    """(SET, NUM) of a print link: /cards/SET/NUM or /cards/en/SET/NUM (with language prefix)."""
+    parts = href.split('/cards/')[-1].strip().split('/')
+    if len(parts) >= 3 and parts[0].lower() in PRINT_LANGUAGE_PREFIXES:
+        return parts[1].upper(), parts[2]
+    if len(parts) >= 2:
+        return parts[0].upper(), parts[1]
+    return None
+
+
+def print_prices(page: CardDetailPage) -> Dict[Tuple[str, str], Tuple[str, str]]:
+    """EUR price and Cardmarket URL of every print in the prints table: (SET, NUM) -> (eur_price, cardmarket_url)."""
+    prices = {}
+    for row in page.print_rows:
+        # The current card's row may have no link - it is the page itself
+        link = row.card_link or (page.url if 'current' in row.css_class else None)
+        if row.has_header or not row.eur_price or not link or '/cards/' not in link:
+            continue
+        print_id = parse_print_link(link)
+        if print_id:
+            prices[print_id] = (row.eur_price, row.cardmarket_url or '')
+    return prices
+
+
+def parse_card_detail_page(url: str, html: str) -> CardDetailPage:
+    """Parse an already fetched detail page."""
+    page = CardDetailPage(url)
+    parser = CardDetailPageParser(page)
+    parser.feed(html)
+    parser.close()
+    return page
+
+
+def fetch_card_detail_page(url: str, retries: int = 2, revalidate: bool = False) -> Optional[CardDetailPage]:
+    """
+    Fetch and parse a detail page over HTTP (revalidate=True: never trust a cached copy, for prices).
+    Returns None if the request failed or the page has no card image (caller may fall back to Selenium).
+    """
+    html = fetch_page(url, retries=retries, revalidate=revalidate)
+    if not html:
+        return None
+    page = parse_card_detail_page(url, html)
+    return page if page.image_url else None
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Card Details Journal
+====================
+Append-only progress journal for the detail phase of all_cards_scraper.
+
+Every scraped card is appended as one JSON line instead of rewriting the whole
+all_cards_database.csv. The scraper compacts the journal into the CSV (atomic
+rename) on a timer and at the end, then clears it. After a crash the next run
+resumes: cards already in the journal are not scraped again.
+
+Line format:
+    {"key": "Pikachu::SVI::1", "fields": {"image_url": ..., "rarity": ...}, "ts": "2026-..."}
+
+CardDataManager applies the journal when loading all_cards_database.csv (the
+journal is part of its snapshot signature). Other tools that read the CSV
+directly only see results after compaction - or use:
+    from card_details_journal import read_cards_with_journal
+    cards = read_cards_with_journal('data/all_cards_database.csv')
+"""
+
+import csv
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+JOURNAL_FILE = 'all_cards_details_journal.jsonl'
+JOURNAL_FIELDS = ('image_url', 'rarity', 'international_prints', 'cardmarket_url')
+
+
+def card_key(card: Dict[str, str]) -> str:
+    """Unique key of a card row (same as the CSV deduplication)."""
+    return f"{card.get('name', '')}::{card.get('set', '')}::{card.get('number', '')}"
+
+
+def journal_path_for(csv_path: str) -> str:
+    """Journal next to the CSV it belongs to."""
+    return os.path.join(os.path.dirname(csv_path) or '.', JOURNAL_FILE)
+
+
+class DetailsJournal:
+    """JSONL journal of per-card detail results (thread-safe appends)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+        self.entries = 0  # lines appended since open / last clear
+
+    def load(self) -> Dict[str, Dict[str, str]]:
+        """key -> fields of every journaled card (later lines win; a torn last line is ignored)."""
+        results: Dict[str, Dict[str, str]] = {}
+        if not os.path.isfile(self.path):
+            return results
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # incomplete line from a crash
+                if isinstance(entry, dict) and entry.get('key'):
+                    results.setdefault(entry['key'], {}).update(entry.get('fields') or {})
+        return results
+
+    def append(self, key: str, fields: Dict[str, str]):
+        """Append one result and flush it to the OS, so it survives a crash of the scraper."""
+        line = json.dumps({'key': key, 'fields': {name: fields[name] for name in JOURNAL_FIELDS if name in fields},
+                           'ts': datetime.now().isoformat()}, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.entries += 1
+
+    def clear(self, keep: Optional[Dict[str, Dict[str, str]]] = None):
+        """
+        Drop all entries (after they were compacted into the CSV).
+        keep: results no CSV row took (key -> fields) - written back so a later run can still apply them.
+        """
+        with self._lock:
+            self._close_file()
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.entries = 0
+            if keep:
+                self._file = open(self.path, 'a', encoding='utf-8')
+                for key, fields in keep.items():
+                    self._file.write(json.dumps({'key': key, 'fields': fields, 'ts': datetime.now().isoformat()},
+                                                ensure_ascii=False) + '\n')
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._close_file()
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_cards_with_journal(csv_path: str, journal_path: Optional[str] = None) -> List[Dict[str, str]]:
+    """Rows of all_cards_database.csv with the not yet compacted journal results applied."""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        cards = list(csv.DictReader(f))
+    journaled = DetailsJournal(journal_path or journal_path_for(csv_path)).load()
+    if journaled:
+        for card in cards:
+            fields = journaled.get(card_key(card))
+            if fields:
+                card.update(fields)
+    return cards
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Card List Page - limitlesstcg.com/cards?...&display=list without a browser
+==========================================================================
+The card list table is server-rendered, so one HTTP request plus HTMLParser
+gives the same rows Selenium used to read cell by cell:
+
+    (set, number, name, type, card_url) per `tbody tr`
+
+plus the pagination "next" link and, where the view shows them, EUR price
+links (a.card-price.eur) per row. Used by all_cards_scraper,
+japanese_cards_scraper and the bulk pass of card_price_scraper; Selenium
+stays as fallback (read_card_list_page_selenium) for when the HTTP request
+fails or the page has no table. probe_latest_sets() only reads the first
+rows of a page and stops the download once enough sets are found.
+
+Usage:
+    from card_list_page import fetch_card_list_page
+
+    page = fetch_card_list_page('https://limitlesstcg.com/cards?q=lang%3Aen&display=list')
+    for set_code, number, name, card_type, card_url in page.rows: ...
+"""
+
+import contextlib
+import http.client
+import zlib
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin
+
+from http_client import HttpError, fetch_page, get_http_client
+
+# (set, number, name, type, card_url)
+CardListRow = Tuple[str, str, str, str, Optional[str]]
+# (set, number, eur_price, cardmarket_url)
+CardListPrice = Tuple[str, str, str, str]
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+
+class CardListPage:
+    """One parsed list page: card rows, total row count and the pagination next link."""
+
+    __slots__ = ('url', 'rows', 'prices', 'row_count', 'has_table', 'next_url', 'has_next_link', 'next_disabled')
+
+    def __init__(self, url: str):
+        self.url = url
+        self.rows: List[CardListRow] = []  # rows with at least 4 cells
+        self.prices: List[CardListPrice] = []  # rows with a EUR price link
+        self.row_count = 0  # all `tbody tr`, like find_elements(By.CSS_SELECTOR, "tbody tr")
+        self.has_table = False
+        self.next_url: Optional[str] = None
+        self.has_next_link = False
+        self.next_disabled = False
+
+
+class CardListPageParser(HTMLParser):
+    """
+    Collects `tbody tr` cells (textContent + first link of the name cell) and
+    the next link of the `.pagination` element.
+    """
+
+    def __init__(self, page: CardListPage):
+        super().__init__(convert_charrefs=True)
+        self.page = page
+        self.stack: List[Tuple[str, str]] = []  # (tag, class) of open elements
+        self.tbody_depth = 0
+        self.pagination_depth = 0  # stack depth of the open .pagination element (0 = none)
+        self.in_row = False
+        self.cells: List[List[str]] = []
+        self.cell_links: List[Optional[str]] = []
+        self.in_cell = False
+        self.price_link: Optional[str] = None  # href of the row's a.card-price.eur
+        self.price_text: Optional[List[str]] = None  # its text while collecting / after </a>
+        self.price_depth = 0  # stack depth of the open price link (0 = none)
+
+    def handle_starttag(self, tag, attrs):
+        attrs_dict = dict(attrs)
+        css_class = attrs_dict.get('class') or ''
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, css_class))
+
+        if tag == 'table':
+            self.page.has_table = True
+        elif tag == 'tbody':
+            self.tbody_depth += 1
+        elif tag == 'tr' and self.tbody_depth:
+            if self.in_row:
+                self._finish_row()  # previous <tr> was not closed
+            self.in_row = True
+            self.cells = []
+            self.cell_links = []
+            self.price_link = None
+            self.price_text = None
+        elif tag == 'td' and self.in_row:
+            self.in_cell = True
+            self.cells.append([])
+            self.cell_links.append(None)
+        elif tag == 'a':
+            if self.in_cell and self.cell_links[-1] is None and attrs_dict.get('href'):
+                self.cell_links[-1] = urljoin(self.page.url, attrs_dict['href'])
+            if self.in_row and self.price_text is None and {'card-price', 'eur'} <= set(css_class.split()):
+                self.price_link = urljoin(self.page.url, attrs_dict['href']) if attrs_dict.get('href') else ''
+                self.price_text = []
+                self.price_depth = len(self.stack)
+            if self.pagination_depth and not self.page.has_next_link and self._is_next_link(attrs_dict):
+                self.page.has_next_link = True
+                href = attrs_dict.get('href')
+                self.page.next_url = urljoin(self.page.url, href) if href else None
+                parent_class = self.stack[-2][1] if len(self.stack) >= 2 else ''
+                self.page.next_disabled = 'disabled' in parent_class.lower()
+
+        if 'pagination' in css_class.split() and not self.pagination_depth and tag not in VOID_TAGS:
+            self.pagination_depth = len(self.stack)
+
+    def _is_next_link(self, attrs_dict) -> bool:
+        """Same selectors as before: a[rel='next'], .page-item.next a, a[aria-label='Next']."""
+        if attrs_dict.get('rel') == 'next' or attrs_dict.get('aria-label') == 'Next':
+            return True
+        parent_class = self.stack[-2][1].split() if len(self.stack) >= 2 else []
+        return 'page-item' in parent_class and 'next' in parent_class
+
+    def handle_data(self, data):
+        if self.in_cell:
+            self.cells[-1].append(data)
+        if self.price_depth:
+            self.price_text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        # Pop up to the matching open tag (tolerates unclosed children)
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth][0] == tag:
+                del self.stack[depth:]
+                break
+        else:
+            return
+
+        if self.pagination_depth and len(self.stack) < self.pagination_depth:
+            self.pagination_depth = 0
+        if self.price_depth and len(self.stack) < self.price_depth:
+            self.price_depth = 0
+        if tag == 'td':
+            self.in_cell = False
+        elif tag == 'tr' and self.in_row:
+            self.in_row = False
+            self.in_cell = False
+            self._finish_row()
+        elif tag == 'tbody' and self.tbody_depth:
+            if self.in_row:
+                self.in_row = self.in_cell = False
+                self._finish_row()
+            self.tbody_depth -= 1
+
+    def _finish_row(self):
+        self.page.row_count += 1
+        self.price_depth = 0
+        if len(self.cells) >= 4:
+            # Column order: Set, No, Name, Type
+            set_code, set_number, card_name, card_type = (''.join(cell).strip() for cell in self.cells[:4])
+            self.page.rows.append((set_code, set_number, card_name, card_type, self.cell_links[2]))
+            eur_price = ''.join(self.price_text or []).strip()
+            if eur_price:
+                self.page.prices.append((set_code, set_number, eur_price, self.price_link))
+
+
+def parse_card_list_page(url: str, html: str) -> CardListPage:
+    """Parse an already fetched list page."""
+    page = CardListPage(url)
+    parser = CardListPageParser(page)
+    parser.feed(html)
+    parser.close()
+    return page
+
+
+def fetch_card_list_page(url: str, revalidate: bool = False) -> Optional[CardListPage]:
+    """
+    Fetch and parse a list page over HTTP (revalidate=True: never trust a cached copy, for prices).
+    Returns None if the request failed or the page has no table (caller falls back to Selenium).
+    """
+    html = fetch_page(url, revalidate=revalidate)
+    if not html:
+        return None
+    page = parse_card_list_page(url, html)
+    return page if page.has_table else None
+
+
+def probe_latest_sets(url: str, count: int, timeout: float = 15) -> List[str]:
+    """
+    First `count` distinct set codes of a list page (page order = newest first).
+    The response is parsed while it streams in and the download stops as soon as
+    they are found. Returns [] if the request failed or no card rows were read.
+    """
+    page = CardListPage(url)
+    parser = CardListPageParser(page)
+    sets: List[str] = []
+    checked = 0
+    try:
+        with contextlib.closing(get_http_client().iter_text(url, timeout=timeout)) as chunks:
+            for chunk in chunks:
+                parser.feed(chunk)
+                for set_code, *_ in page.rows[checked:]:
+                    if set_code and set_code not in sets:
+                        sets.append(set_code)
+                checked = len(page.rows)
+                if len(sets) >= count:
+                    return sets[:count]
+        parser.close()
+    except (HttpError, OSError, http.client.HTTPException, zlib.error, ValueError) as e:
+        print(f"  Error fetching {url}: {e}")
+        return []
+
+    # Whole page read: fewer sets than asked for (or none)
+    for set_code, *_ in page.rows[checked:]:
+        if set_code and set_code not in sets:
+            sets.append(set_code)
+    return sets[:count]
+
+
+def read_card_list_page_selenium(driver, url: str) -> Optional[CardListPage]:
+    """
+    Selenium fallback: load url in driver and read the same CardListPage.
+    Returns None if no table rows appear within 15 seconds.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    driver.get(url)
+    try:
+        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr")))
+    except Exception:
+        return None
+
+    # One round-trip for the whole page instead of one per cell
+    return parse_card_list_page(url, driver.page_source)
@@ -4,6 +4,18 @@ Card Price Scraper - Update EUR prices from Limitless TCG
 ==========================================================
 Fast scraper that only updates Cardmarket EUR prices for existing cards.
 Reads from all_cards_database.csv and updates price_data.csv.
+
+Bulk mode (default): prices are harvested over HTTP first - from the card
+list/search pages (if the view shows prices) and from the prints table of
+each Limitless card page, which lists every print of the card at once. The
+browser (Cardmarket, then Limitless) is only used for prints still missing.
+
+Priority refresh (opt-in, priority_refresh): instead of all cards / only cards without price,
+price_refresh_scheduler ranks cards by staleness, deck usage and volatility
+and the top refresh_top_k are refreshed until the time/request budget is used.
+
+Progress saves go through price_store (only changed rows are appended to an
+update log); price_data.csv itself is exported once at the end of the run.
 """
 
 import csv
@@ -12,7 +24,13 @@ import os
 import sys
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
+
+from card_detail_page import fetch_card_detail_page, print_prices
+from card_list_page import fetch_card_list_page
+from http_client import get_http_client
+from price_refresh_scheduler import select_refresh_batch
+from price_store import PriceStore
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
@@ -32,6 +50,8 @@ try:
     from selenium import webdriver
     from selenium.webdriver.common.by import By
     from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -41,10 +61,29 @@ except ImportError:
 DEFAULT_SETTINGS: Dict[str, object] = {
     "delay_seconds": 0.5,
     "headless": True,
-    "batch_size": 100,
-    "skip_cards_with_prices": True
+    "batch_size": 100,            # save progress + restart browser every N scraped cards
+    "skip_cards_with_prices": True,
+    "lean_browser": True,         # block images/media/fonts, don't wait for subresources
+    "price_wait_seconds": 4.0,    # max wait for the price element per page
+    "bulk_mode": True,            # harvest prices over HTTP before opening the browser
+    "bulk_list_url": "https://limitlesstcg.com/cards?q=lang%3Aen&display=list",
+    "bulk_max_pages": None,       # None = all list pages
+    "priority_refresh": False,    # opt-in: rank cards (staleness, deck usage, volatility) instead of skip_cards_with_prices
+    "refresh_top_k": 1000,        # cards per run (0 = all, in priority order)
+    "refresh_min_age_hours": 24,  # never refresh prices younger than this
+    "refresh_time_budget_minutes": None,  # stop after this many minutes (None = no limit)
+    "refresh_max_requests": None,         # stop after this many page loads, HTTP + browser (None = no limit)
+    "priority_weights": {"staleness": 0.5, "relevance": 0.35, "volatility": 0.15}
 }
 
+# Price elements (in order of preference)
+CARDMARKET_PRICE_SELECTORS = ["dd.col-6, dd.col-xl-7, dd[class*='col']", "span.price, .price-container, [class*='price']"]
+LIMITLESS_PRICE_SELECTOR = "table.card-prints-versions tr.current a.card-price.eur"
+LIMITLESS_PAGE_SELECTOR = "table.card-prints-versions, img.card"  # page content is there
+# Subresources the price lookup never needs (blocked in the lean profile)
+BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+                        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm", "*.mp3"]
+
 def get_app_dir() -> str:
     """Get the directory where the script is located."""
     if getattr(sys, 'frozen', False):
@@ -116,34 +155,8 @@ def load_cards_to_update(csv_path: str) -> List[Dict[str, str]]:
     print(f"[Price Scraper] Loaded {len(cards)} cards from database")
     return cards
 
-def load_existing_prices(csv_path: str) -> Dict[str, Dict[str, str]]:
-    """Load existing prices from price_data.csv."""
-    if not os.path.isfile(csv_path):
-        return {}
-    
-    prices = {}
-    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if not row:
-                continue
-            key = f"{row.get('set', '')}_{row.get('number', '')}"
-            prices[key] = {
-                'eur_price': (row.get('eur_price') or '').strip(),
-                'last_updated': (row.get('last_updated') or '').strip()
-            }
-    
-    return prices
-
-def scrape_prices(cards: List[Dict[str, str]], settings: Dict[str, object], 
-                 existing_prices: Dict[str, Dict[str, str]], csv_path: str) -> List[Dict[str, str]]:
-    """Scrape EUR prices from Limitless card pages."""
-    
-    if not SELENIUM_AVAILABLE:
-        print("[Price Scraper] ERROR: Selenium not available!")
-        return []
-    
-    print(f"\n[Price Scraper] Starting browser...")
+def create_browser(settings: Dict[str, object]):
+    """Start Chrome; with lean_browser only the HTML/CSS/JS needed to read prices is loaded."""
     chrome_options = Options()
     if settings.get("headless", True):
         chrome_options.add_argument("--headless")
@@ -152,11 +165,178 @@ def scrape_prices(cards: List[Dict[str, str]], settings: Dict[str, object],
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
     
+    lean = bool(settings.get("lean_browser", True))
+    if lean:
+        # Return from driver.get() at DOMContentLoaded instead of waiting for every subresource
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+    
     driver = webdriver.Chrome(options=chrome_options)
+    if lean:
+        try:
+            # Fonts/media have no content setting - block them (and images) at the network level
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"[Price Scraper] Note: Could not block subresources: {str(e)[:60]}")
+    return driver
+
+def wait_for_price_text(driver, selectors: List[str], timeout: float) -> str:
+    """
+    Wait until an element matching one of selectors shows a EUR price.
+    Returns '' if the page finished loading without one, or on timeout.
+    """
+    def find_price(d):
+        for selector in selectors:
+            for elem in d.find_elements(By.CSS_SELECTOR, selector):
+                text = elem.text.strip()
+                # Match price pattern: digits, comma/dot, digits, €
+                if '€' in text and any(c.isdigit() for c in text):
+                    return text
+        if d.execute_script("return document.readyState") == 'complete':
+            return ' '  # loaded, no price (truthy to end the wait, stripped below)
+        return False
+    
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(find_price).strip()
+    except TimeoutException:
+        return ''
+
+def wait_for_elements(driver, selector: str, timeout: float) -> Optional[list]:
+    """
+    Wait until selector matches. Returns the elements, [] if the page finished
+    loading without a match (e.g. card without price table), None on timeout.
+    """
+    def find_elements(d):
+        elems = d.find_elements(By.CSS_SELECTOR, selector)
+        if elems or d.execute_script("return document.readyState") == 'complete':
+            return (elems,)  # tuple: an empty match must still end the wait
+        return False
+    
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(find_elements)[0]
+    except TimeoutException:
+        return None
+
+def limitless_card_url(card: Dict[str, str]) -> str:
+    """Limitless card page (card_url from database if available, else /cards/SET/NUM)."""
+    if card.get('card_url'):
+        if card['card_url'].startswith('/'):
+            return f"https://limitlesstcg.com{card['card_url']}"
+        return card['card_url']
+    return f"https://limitlesstcg.com/cards/{card['set']}/{card['number']}"
+
+def harvest_list_prices(settings: Dict[str, object], page_cap: Optional[int] = None,
+                        budget_used_up: Optional[Callable[[], Optional[str]]] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Bulk pass: EUR prices of every print on the card list/search pages (SET_NUM -> price).
+    Stops after the first page if the view has no price column, after page_cap pages
+    (on top of bulk_max_pages) or once budget_used_up() reports a reason.
+    """
+    base_url = str(settings.get("bulk_list_url") or DEFAULT_SETTINGS["bulk_list_url"])
+    max_pages = settings.get("bulk_max_pages")
+    if page_cap is not None:
+        max_pages = min(int(max_pages), page_cap) if max_pages else page_cap
+    harvested: Dict[str, Dict[str, str]] = {}
+    seen_pages = set()
+    page_index = 1
+    next_url = base_url
+    
+    print(f"[Price Scraper] Bulk: reading list pages {base_url}")
+    while next_url and next_url not in seen_pages:
+        if max_pages and page_index > max_pages:
+            break
+        reason = budget_used_up() if budget_used_up else None
+        if reason:
+            print(f"[Price Scraper] Bulk: {reason} - stopping list pass after {page_index - 1} pages")
+            break
+        seen_pages.add(next_url)
+        
+        page = fetch_card_list_page(next_url, revalidate=True)  # prices must be current, not from the cache
+        if page is None or page.row_count == 0:
+            break
+        for set_code, set_number, eur_price, cardmarket_url in page.prices:
+            harvested[f"{set_code}_{set_number}"] = {'eur_price': eur_price, 'cardmarket_url': cardmarket_url}
+        if page_index == 1 and not page.prices:
+            print("[Price Scraper] Bulk: list view shows no prices - using card pages only")
+            break
+        if page_index % 10 == 0:
+            print(f"[Price Scraper] Bulk: {page_index} list pages, {len(harvested)} prices...")
+        
+        if page.has_next_link:
+            if page.next_disabled or not page.next_url:
+                break
+            next_url = page.next_url
+        else:
+            next_url = f"{base_url}&page={page_index + 1}"
+        page_index += 1
+    
+    print(f"[Price Scraper] Bulk: {len(harvested)} prices from list pages")
+    return harvested
+
+def harvest_card_page_prices(card: Dict[str, str], harvested: Dict[str, Dict[str, str]]) -> bool:
+    """
+    Read the Limitless card page over HTTP and add the price of every print in its prints table.
+    Returns whether the page was read (if so, loading it again in the browser can't find more).
+    """
+    page = fetch_card_detail_page(limitless_card_url(card), revalidate=True)  # never a cached price
+    if page is None:
+        return False
+    for (set_code, set_number), (eur_price, cardmarket_url) in print_prices(page).items():
+        harvested[f"{set_code}_{set_number}"] = {'eur_price': eur_price, 'cardmarket_url': cardmarket_url}
+    return True
+
+def scrape_prices(cards: List[Dict[str, str]], settings: Dict[str, object], 
+                 existing_prices: Dict[str, Dict[str, str]], store: PriceStore) -> List[Dict[str, str]]:
+    """Scrape EUR prices from Limitless card pages."""
+    
+    bulk_mode = bool(settings.get("bulk_mode", True))
+    if not SELENIUM_AVAILABLE:
+        if not bulk_mode:
+            print("[Price Scraper] ERROR: Selenium not available!")
+            return []
+        print("[Price Scraper] Selenium not available - HTTP bulk prices only, no browser fallback")
+    
+    driver = None  # started on the first card the bulk pass couldn't price
     
     results = []
-    skip_existing = bool(settings.get("skip_cards_with_prices", True))
+    # Priority refresh hands over an already ranked selection - refresh all of it
+    skip_existing = bool(settings.get("skip_cards_with_prices", True)) and not settings.get("priority_refresh", False)
     delay = float(settings.get("delay_seconds", 0.5))
+    price_wait = float(settings.get("price_wait_seconds", 4.0))
+    batch_size = max(1, int(settings.get("batch_size", 100)))
+    scraped_in_batch = 0  # cards processed since the last progress save / browser restart
+    saved = 0  # results already handed to the store
+    bulk_hits = 0
+    browser_lookups = 0
+    
+    # Budgets: wall time and page loads (HTTP requests incl. the list pass + browser page loads)
+    time_budget = settings.get("refresh_time_budget_minutes")
+    max_requests = settings.get("refresh_max_requests")
+    started = time.monotonic()
+    http_requests_before = get_http_client().stats()['requests']
+    browser_page_loads = 0
+    
+    def budget_used_up() -> Optional[str]:
+        if time_budget and time.monotonic() - started > float(time_budget) * 60:
+            return f"Time budget ({time_budget} min) used up"
+        page_loads = get_http_client().stats()['requests'] - http_requests_before + browser_page_loads
+        if max_requests and page_loads >= int(max_requests):
+            return f"Request budget ({max_requests}) used up"
+        return None
+    
+    harvested = {}
+    if bulk_mode:
+        # A priority selection costs at most one card page per card - never spend more on list pages
+        page_cap = len(cards) if settings.get("priority_refresh", False) else None
+        harvested = harvest_list_prices(settings, page_cap, budget_used_up)
     
     try:
         for idx, card in enumerate(cards):
@@ -175,6 +355,11 @@ def scrape_prices(cards: List[Dict[str, str]], settings: Dict[str, object],
                 })
                 continue
             
+            reason = budget_used_up()
+            if reason:
+                print(f"[Price Scraper] {reason} after {idx} cards. Stopping.")
+                break
+            
             # Only print every 10th card to reduce spam
             if (idx + 1) % 10 == 0 or idx == 0:
                 print(f"[Price Scraper] Progress: {idx+1}/{len(cards)} cards...")
@@ -187,67 +372,53 @@ def scrape_prices(cards: List[Dict[str, str]], settings: Dict[str, object],
                 eur_price = ''
                 cardmarket_url_final = card.get('cardmarket_url', '')
                 
+                # Bulk: price from the list pass or the prints table of an earlier card page
+                limitless_page_read = False  # card page already read over HTTP - no need to load it in the browser
+                if bulk_mode:
+                    if card_key not in harvested:
+                        limitless_page_read = harvest_card_page_prices(card, harvested)
+                    if card_key in harvested:
+                        eur_price = harvested[card_key]['eur_price']
+                        cardmarket_url_final = cardmarket_url_final or harvested[card_key]['cardmarket_url']
+                        bulk_hits += 1
+                
+                # Per-card browser path for prints the bulk pass missed
+                used_browser = (SELENIUM_AVAILABLE and not eur_price
+                                and (bool(cardmarket_url_final) or not limitless_page_read))
+                if used_browser:
+                    browser_lookups += 1
+                    if driver is None:
+                        print("\n[Price Scraper] Starting browser...")
+                        driver = create_browser(settings)
+                
                 # Try Cardmarket first (if URL available)
-                if cardmarket_url_final:
+                if used_browser and cardmarket_url_final and not eur_price:
                     try:
+                        browser_page_loads += 1
                         driver.get(cardmarket_url_final)
-                        time.sleep(1.5)  # Reduced delay
-                        
-                        # Try multiple robust selectors for Cardmarket price
-                        try:
-                            # Strategy 1: Find all dd elements with price pattern
-                            price_elems = driver.find_elements(By.CSS_SELECTOR, "dd.col-6, dd.col-xl-7, dd[class*='col']")
-                            for elem in price_elems:
-                                text = elem.text.strip()
-                                # Match price pattern: digits, comma/dot, digits, €
-                                if '€' in text and any(c.isdigit() for c in text):
-                                    eur_price = text
-                                    print(f"   ✓ CM: {eur_price}")
-                                    break
-                        except:
-                            pass
                         
-                        if not eur_price:
-                            # Strategy 2: Try span.price or similar
-                            try:
-                                price_elem = driver.find_element(By.CSS_SELECTOR, "span.price, .price-container, [class*='price']")
-                                text = price_elem.text.strip()
-                                if '€' in text:
-                                    eur_price = text
-                                    print(f"   ✓ CM: {eur_price}")
-                            except:
-                                pass
+                        # Wait for a price (dd elements first, then span.price or similar)
+                        eur_price = wait_for_price_text(driver, CARDMARKET_PRICE_SELECTORS, price_wait)
+                        if eur_price:
+                            print(f"   ✓ CM: {eur_price}")
                         
                         # Silent fail - Cardmarket often blocks, this is expected
                     except Exception:
                         pass  # Silent - try Limitless instead
                 
                 # Fallback: Try Limitless if Cardmarket failed or no URL
-                if not eur_price:
+                if used_browser and not eur_price and not limitless_page_read:
                     try:
-                        # Build URL (try to use card_url from database if available)
-                        if card.get('card_url'):
-                            if card['card_url'].startswith('/'):
-                                url = f"https://limitlesstcg.com{card['card_url']}"
-                            else:
-                                url = card['card_url']
-                        else:
-                            # Build URL manually (format: /cards/SET/NUM)
-                            url = f"https://limitlesstcg.com/cards/{card['set']}/{card['number']}"
-                        
-                        driver.get(url)
-                        time.sleep(1.5)  # Reduced delay
+                        browser_page_loads += 1
+                        driver.get(limitless_card_url(card))
                         
-                        # Find the table with prices
+                        # Wait until the card page is there, then look for the EUR link of the current row
                         cardmarket_url_from_page = ''
+                        page_elems = wait_for_elements(driver, LIMITLESS_PAGE_SELECTOR, price_wait)
+                        price_links = driver.find_elements(By.CSS_SELECTOR, LIMITLESS_PRICE_SELECTOR) if page_elems else []
                         
-                        try:
-                            # Find the current card row (class="current")
-                            table = driver.find_element(By.CSS_SELECTOR, "table.card-prints-versions")
-                            current_row = table.find_element(By.CSS_SELECTOR, "tr.current")
-                            
-                            # Extract EUR price from third column
-                            eur_link = current_row.find_element(By.CSS_SELECTOR, "a.card-price.eur")
+                        if price_links:
+                            eur_link = price_links[0]
                             eur_price = eur_link.text.strip()
                             cardmarket_url_from_page = eur_link.get_attribute('href') or ''
                             
@@ -256,34 +427,42 @@ def scrape_prices(cards: List[Dict[str, str]], settings: Dict[str, object],
                             # Update Cardmarket URL if we got a new one from Limitless
                             if cardmarket_url_from_page and not cardmarket_url_final:
                                 cardmarket_url_final = cardmarket_url_from_page
-                        except Exception as e:
-                            error_str = str(e).lower()
-                            # Only log if it's NOT a common "no price table" case
-                            if 'no such element' not in error_str or 'card-prints-versions' not in error_str:
-                                # Real error - log it
-                                print(f"   ⚠ Error: {str(e).split('Stacktrace')[0].strip()[:60]}")
-                            # Silent fail for "no price table" - many cards don't have prices
+                        elif page_elems is None:
+                            print(f"   ⚠ Error: Card page did not load within {price_wait:g}s")
+                        # Silent fail for "no price table" - many cards don't have prices
                     
                     except Exception:
                         pass  # Silent - no price available
                 
-                # Store result (even if price is empty - we track all attempts)
+                # Store result (even if price is empty - last_checked records the attempt)
+                checked = datetime.now().isoformat()
                 results.append({
                     'name': card['name'],
                     'set': card['set'],
                     'number': card['number'],
                     'eur_price': eur_price,
                     'cardmarket_url': cardmarket_url_final,
-                    'last_updated': datetime.now().isoformat()
+                    'last_updated': checked,
+                    'last_checked': checked
                 })
                 
-                time.sleep(delay)
+                if used_browser:
+                    time.sleep(delay)
                 
-                # Progress save every 100 cards
-                if (idx + 1) % 100 == 0:
+                # Progress save + fresh browser every batch_size cards (keeps Chrome's memory flat)
+                scraped_in_batch += 1
+                if scraped_in_batch >= batch_size:
                     print(f"[Price Scraper] Completed {idx + 1} cards, saving progress...")
-                    save_prices(results, csv_path)
+                    save_prices(results[saved:], store)
+                    saved = len(results)
                     print(f"[Price Scraper] Progress saved: {len(results)} prices")
+                    if driver is not None:
+                        try:
+                            driver.quit()
+                        except:
+                            pass
+                        driver = None  # restarted on the next browser lookup
+                    scraped_in_batch = 0
             
             except Exception as e:
                 error_str = str(e).lower()
@@ -297,14 +476,7 @@ def scrape_prices(cards: List[Dict[str, str]], settings: Dict[str, object],
                         pass
                     
                     # Recreate browser
-                    chrome_options = Options()
-                    if settings.get("headless", True):
-                        chrome_options.add_argument("--headless")
-                    chrome_options.add_argument("--no-sandbox")
-                    chrome_options.add_argument("--disable-dev-shm-usage")
-                    chrome_options.add_argument("--disable-gpu")
-                    chrome_options.add_argument("--window-size=1920,1080")
-                    driver = webdriver.Chrome(options=chrome_options)
+                    driver = create_browser(settings)
                     
                     print(f"[Price Scraper] Browser restarted, continuing...")
                     time.sleep(2)
@@ -315,56 +487,20 @@ def scrape_prices(cards: List[Dict[str, str]], settings: Dict[str, object],
                 continue
     
     finally:
-        driver.quit()
+        if driver is not None:
+            driver.quit()
     
+    if bulk_mode:
+        print(f"[Price Scraper] Bulk: {bulk_hits} prices without browser, {browser_lookups} cards via browser")
     return results
 
-def save_prices(prices: List[Dict[str, str]], csv_path: str):
+def save_prices(prices: List[Dict[str, str]], store: PriceStore):
     """
-    Save prices to price_data.csv, preserving existing prices.
-    Only overwrites when a new valid price is found.
+    Apply prices to the price store, preserving existing prices.
+    Only overwrites when a new valid price is found; only changed rows are written (update log).
     """
-    # Load existing prices from CSV
-    existing_prices = {}
-    if os.path.isfile(csv_path):
-        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if not row:
-                    continue
-                key = f"{row.get('set', '')}_{row.get('number', '')}"
-                existing_prices[key] = {
-                    'name': row.get('name', ''),
-                    'set': row.get('set', ''),
-                    'number': row.get('number', ''),
-                    'eur_price': row.get('eur_price', ''),
-                    'cardmarket_url': row.get('cardmarket_url', ''),
-                    'last_updated': row.get('last_updated', '')
-                }
-    
-    # Merge new prices with existing ones
-    # Only update if new price is non-empty
-    for price in prices:
-        key = f"{price.get('set', '')}_{price.get('number', '')}"
-        new_price = (price.get('eur_price') or '').strip()
-        
-        if new_price:
-            # New valid price found - update everything
-            existing_prices[key] = price
-        elif key not in existing_prices:
-            # New card but no price yet - add entry with empty price
-            existing_prices[key] = price
-        # else: Keep existing price (don't overwrite with empty)
-    
-    # Write all prices back to CSV
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        fieldnames = ['name', 'set', 'number', 'eur_price', 'cardmarket_url', 'last_updated']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for key in sorted(existing_prices.keys()):
-            writer.writerow(existing_prices[key])
-    
-    print(f"[Price Scraper] OK: Saved {len(existing_prices)} prices to {csv_path}")
+    changed = store.update(prices)
+    print(f"[Price Scraper] OK: {changed} of {len(prices)} prices changed ({len(store.rows)} in store)")
 
 
 # Main execution
@@ -391,22 +527,38 @@ try:
         input("\nPress ENTER to close...")
         sys.exit(1)
     
-    existing_prices = load_existing_prices(prices_csv)
+    # Reads price_data.csv once (+ updates of an interrupted run); later saves only touch changed rows
+    store = PriceStore(prices_csv)
+    existing_prices = dict(store.rows)
     print(f"[Price Scraper] Found {len(existing_prices)} existing prices")
     
+    if settings.get("priority_refresh", False):
+        cards = select_refresh_batch(
+            cards, existing_prices, data_dir,
+            top_k=int(settings.get("refresh_top_k") or 0),
+            min_age_hours=float(settings.get("refresh_min_age_hours") or 0),
+            weights=settings.get("priority_weights"),
+        )
+        if not cards:
+            print("[Price Scraper] All prices are fresh. Nothing to refresh.")
+    
     # Scrape prices
     print("\n" + "=" * 80)
     print("SCRAPING PRICES...")
     print("=" * 80)
     
-    all_prices = scrape_prices(cards, settings, existing_prices, prices_csv)
+    all_prices = scrape_prices(cards, settings, existing_prices, store)
     
     # Save results
     print("\n" + "=" * 80)
     print("SAVING RESULTS...")
     print("=" * 80)
     
-    save_prices(all_prices, prices_csv)
+    save_prices(all_prices, store)  # already saved batches are no-ops
+    if store.export_csv():
+        print(f"[Price Scraper] OK: Exported {len(store.rows)} prices to {prices_csv}")
+    else:
+        print(f"[Price Scraper] No price changes - {prices_csv} left as is")
     
     print("\n" + "=" * 80)
     print("SUCCESS: Price update complete!")
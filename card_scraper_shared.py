@@ -25,9 +25,8 @@ Usage:
   save_to_csv(aggregated, 'output.csv')
 """
 
-import urllib.request
-import urllib.parse
 import csv
+import html
 import re
 import time
 import json
@@ -38,12 +37,15 @@ from html.parser import HTMLParser
 from typing import List, Dict, Optional, Tuple, Any
 from collections import defaultdict
 
+from http_client import get_http_client
+
 # Import the new unified card data manager
 try:
-    from card_data_manager import CardDataManager
+    from card_data_manager import CardRow, get_shared_manager
     _CARD_DATA_MANAGER_AVAILABLE = True
 except ImportError:
     _CARD_DATA_MANAGER_AVAILABLE = False
+    CardRow = object
     print("[WARNING] CardDataManager not available, falling back to CSV loading")
 
 # ============================================================================
@@ -182,17 +184,8 @@ def get_data_dir() -> str:
     return data_dir
 
 def fetch_page(url: str, timeout: int = 30) -> str:
-    """Fetch a webpage and return its HTML content."""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            return response.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"  Error fetching {url}: {e}")
-        return ""
+    """Fetch a webpage and return its HTML content (shared pooled HTTP client)."""
+    return get_http_client().fetch_text(url, timeout=timeout)
 
 def normalize_archetype_name(archetype: str) -> str:
     """Normalize archetype names to consistent Title Case format.
@@ -219,6 +212,296 @@ def normalize_archetype_name(archetype: str) -> str:
     
     return name.strip()
 
+# ============================================================================
+# NAME MATCH INDEXES (partial-match fallbacks of get_card_info)
+# ============================================================================
+
+class NameSubstringIndex:
+    """
+    Trigram inverted index answering "which DB name contains the query?".
+
+    Names are numbered in insertion order and every posting list is sorted,
+    so the first verified candidate is the same name a linear scan over the
+    name list would return first.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, names: List[str]):
+        self.names = names
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+
+        for position, name in enumerate(names):
+            seen = set()
+            for i in range(len(name) - self.GRAM_SIZE + 1):
+                gram = name[i:i + self.GRAM_SIZE]
+                if gram not in seen:
+                    seen.add(gram)
+                    self.postings[gram].append(position)
+
+    def iter_matches(self, query: str):
+        """Yield positions of names containing query, in insertion order."""
+        if len(query) < self.GRAM_SIZE:
+            # Too short for a trigram - scan (rare, and query is tiny)
+            for position, name in enumerate(self.names):
+                if query in name:
+                    yield position
+            return
+
+        # Every match must contain ALL query trigrams - walk the rarest one
+        shortest = None
+        for i in range(len(query) - self.GRAM_SIZE + 1):
+            posting = self.postings.get(query[i:i + self.GRAM_SIZE])
+            if not posting:
+                return
+            if shortest is None or len(posting) < len(shortest):
+                shortest = posting
+
+        for position in shortest:
+            if query in self.names[position]:
+                yield position
+
+
+class NameContainmentAutomaton:
+    """
+    Aho-Corasick automaton answering "which DB name is contained in the query?".
+
+    Each node remembers the lowest insertion position of any name ending there
+    (directly or via its failure chain), so one pass over the query yields
+    every contained name and the caller can pick them in insertion order.
+    """
+
+    def __init__(self, names: List[str], min_length: int = 0):
+        self.names = names
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[int, ...]] = [()]  # shared empty tuple for most nodes
+
+        for position, name in enumerate(names):
+            if len(name) <= min_length:
+                continue
+            node = 0
+            for char in name:
+                child = self.goto[node].get(char)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][char] = child
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                node = child
+            self.output[node] = self.output[node] + (position,)
+
+        # Breadth-first failure links; outputs inherit their suffix's outputs
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self.goto[node].items():
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                if self.output[self.fail[child]]:
+                    self.output[child] = self.output[child] + self.output[self.fail[child]]
+                queue.append(child)
+
+    def find_all(self, text: str) -> List[int]:
+        """Return sorted positions of all names occurring in text."""
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            if self.output[node]:
+                found.update(self.output[node])
+        return sorted(found)
+
+class FuzzyNameMatcher:
+    """
+    Typo-tolerant resolver over the names of a NameSubstringIndex.
+
+    Reuses the index's trigram postings as a candidate filter: a name within
+    edit distance k of the query still shares all but at most 3*k of the
+    query's distinct trigrams. Surviving candidates are verified with a
+    bounded Levenshtein distance; the closest name wins, ties going to the
+    lowest insertion position.
+    """
+
+    def __init__(self, substring_index: NameSubstringIndex, min_similarity: float = 0.85,
+                 min_length: int = 5):
+        self.index = substring_index
+        self.min_similarity = min_similarity
+        self.min_length = min_length
+
+    @staticmethod
+    def edit_distance(a: str, b: str, limit: int) -> int:
+        """Levenshtein distance of a and b, or limit + 1 once it exceeds limit."""
+        if abs(len(a) - len(b)) > limit:
+            return limit + 1
+        previous = list(range(len(b) + 1))
+        for i, char_a in enumerate(a, 1):
+            current = [i]
+            for j, char_b in enumerate(b, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1,
+                                   previous[j - 1] + (char_a != char_b)))
+            if min(current) > limit:
+                return limit + 1
+            previous = current
+        return previous[-1]
+
+    def match(self, query: str) -> Optional[int]:
+        """Return the position of the closest name with enough similarity, or None."""
+        if len(query) < self.min_length:
+            return None
+
+        gram_size = self.index.GRAM_SIZE
+        grams = {query[i:i + gram_size] for i in range(len(query) - gram_size + 1)}
+        # Longest candidate allowed is len(query) / min_similarity -> max edits
+        max_edits = int((1 - self.min_similarity) * len(query) / self.min_similarity)
+        required = max(1, len(grams) - gram_size * max_edits)
+
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for position in self.index.postings.get(gram, ()):
+                shared[position] += 1
+
+        best_position = None
+        best_distance = max_edits + 1
+        for position, count in shared.items():
+            if count < required:
+                continue
+            name = self.index.names[position]
+            limit = int((1 - self.min_similarity) * max(len(query), len(name)))
+            distance = self.edit_distance(query, name, min(limit, best_distance))
+            if distance <= limit and (distance < best_distance or
+                                      (distance == best_distance and (best_position is None or position < best_position))):
+                best_position = position
+                best_distance = distance
+        return best_position
+
+# ============================================================================
+# CARD VARIANT VIEW (entries of CardDatabaseLookup.cards)
+# ============================================================================
+
+class CardVariant(CardRow):
+    """
+    Read-only view of a CardDataManager row under the legacy variant keys
+    (set_code, set_number, card_type, ...), so CardDatabaseLookup.cards no
+    longer copies every row into a second dict.
+    """
+    
+    __slots__ = ()
+    
+    # legacy key -> (store field, default when the source row lacks it)
+    KEYS = {
+        'name': ('name', ''),
+        'set_code': ('set', ''),
+        'set_number': ('number', ''),
+        'rarity': ('rarity', ''),
+        'type': ('type', ''),
+        'card_type': ('type', 'Pokemon'),
+        'image_url': ('image_url', ''),
+        '_source': ('_source', 'english'),
+    }
+    
+    def __getitem__(self, key: str) -> str:
+        field, default = self.KEYS[key]
+        store = self.store
+        if store.has_field(self.index, field):
+            return store.get(self.index, field)
+        return default
+    
+    def __contains__(self, key) -> bool:
+        return key in self.KEYS
+    
+    def __iter__(self):
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+# ============================================================================
+# RESOLVED CARD PROFILES (precomputed per normalized name at load time)
+# ============================================================================
+
+class CardPrint:
+    """Immutable record of one printing of a card (set, number, rarity, type)."""
+    
+    __slots__ = ('name', 'set_code', 'number', 'rarity', 'supertype', 'image_url')
+    
+    def __init__(self, name: str, set_code: str, number: str, rarity: str, supertype: str, image_url: str = ''):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'set_code', set_code)
+        object.__setattr__(self, 'number', number)
+        object.__setattr__(self, 'rarity', rarity)
+        object.__setattr__(self, 'supertype', supertype)
+        object.__setattr__(self, 'image_url', image_url)
+    
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __repr__(self) -> str:
+        return f"CardPrint({self.name!r}, {self.set_code} {self.number}, {self.rarity!r}, {self.supertype!r})"
+
+
+class CardProfile:
+    """
+    Everything the scrapers need to know about one normalized card name.
+    
+    - first_print: first DB variant, supertype normalized (lookup_card)
+    - latest_low_rarity_print: newest Common/Uncommon/Promo print (SVE for basic energy)
+    - preferred_print: EN-preferred print used by get_card_info
+    """
+    
+    __slots__ = ('supertype', 'is_trainer_or_energy', 'is_ace_spec', 'first_print',
+                 'latest_low_rarity_print', 'preferred_print', 'image_url', 'card_info')
+    
+    def __init__(self, first_print: Optional[CardPrint], latest_low_rarity_print: Optional[CardPrint],
+                 preferred_print: Optional[CardPrint], is_trainer_or_energy: bool, is_ace_spec: bool,
+                 card_info: Optional[Dict[str, str]]):
+        object.__setattr__(self, 'supertype', first_print.supertype if first_print else '')
+        object.__setattr__(self, 'is_trainer_or_energy', is_trainer_or_energy)
+        object.__setattr__(self, 'is_ace_spec', is_ace_spec)
+        object.__setattr__(self, 'first_print', first_print)
+        object.__setattr__(self, 'latest_low_rarity_print', latest_low_rarity_print)
+        object.__setattr__(self, 'preferred_print', preferred_print)
+        object.__setattr__(self, 'image_url', preferred_print.image_url if preferred_print else '')
+        object.__setattr__(self, 'card_info', card_info)
+    
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class ResolvedCard:
+    """
+    Immutable resolve_many() result for one decklist entry.
+    
+    - set_code/number: print the entry should be recorded as
+    - from_database: True if set_code/number came from the database
+      (low-rarity or forced basic energy print), False if the given print was kept
+    """
+    
+    __slots__ = ('name', 'section', 'set_code', 'number', 'from_database', 'is_ace_spec')
+    
+    def __init__(self, name: str, section: Optional[str], set_code: str, number: str,
+                 from_database: bool, is_ace_spec: bool):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'section', section)
+        object.__setattr__(self, 'set_code', set_code)
+        object.__setattr__(self, 'number', number)
+        object.__setattr__(self, 'from_database', from_database)
+        object.__setattr__(self, 'is_ace_spec', is_ace_spec)
+    
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __repr__(self) -> str:
+        return f"ResolvedCard({self.name!r}, {self.set_code} {self.number}, section={self.section!r})"
+
 # ============================================================================
 # CARD DATABASE LOOKUP - Now a Wrapper around CardDataManager
 # ============================================================================
@@ -296,6 +579,21 @@ class CardDatabaseLookup:
     'M3': 20, 'MC': 15, 'MP1': 50
     }
     
+    # Basic energies are always resolved to their SVE printing
+    BASIC_ENERGY_PRINTS = {
+        'grass energy': ('SVE', '17'),
+        'fire energy': ('SVE', '18'),
+        'water energy': ('SVE', '19'),
+        'lightning energy': ('SVE', '20'),
+        'psychic energy': ('SVE', '21'),
+        'fighting energy': ('SVE', '22'),
+        'darkness energy': ('SVE', '23'),
+        'metal energy': ('SVE', '24'),
+        'fairy energy': ('SVE', '25')
+    }
+    
+    LOW_RARITIES = {'Common', 'Uncommon', 'Promo'}
+    
     def __init__(self, csv_path: str = None):
         """
         Initialize CardDatabaseLookup.
@@ -314,43 +612,162 @@ class CardDatabaseLookup:
         
         # Load the unified card database
         print("[CardDatabaseLookup] Loading unified card database (English + Japanese)...")
-        self.manager = CardDataManager()
+        self.manager = get_shared_manager()
         self.cards = {}  # name -> list of card variants (for compatibility)
+        self._normalized_names = {}  # raw name -> normalize_name() result
+        self._ace_spec_names = {}  # raw name -> in KNOWN_ACE_SPECS
         self._build_name_index()
     
     def _build_name_index(self):
         """Build a name-based index for compatibility with old code."""
         print("[CardDatabaseLookup] Building name index...")
         
-        for card in self.manager.get_all_cards():
-            name = card.get('name', '')
-            normalized = self.normalize_name(name)
+        # Variants are views onto the manager's column store, not copied dicts
+        store = self.manager.store
+        for index in self.manager.get_all_cards().indices:
+            normalized = self.normalize_name(store.names[index])
             
             if normalized not in self.cards:
                 self.cards[normalized] = []
             
-            self.cards[normalized].append({
-                'name': name,
-                'set_code': card.get('set', ''),
-                'set_number': card.get('number', ''),
-                'rarity': card.get('rarity', ''),
-                'type': card.get('type', ''),
-                'card_type': card.get('type', 'Pokemon'),
-                'image_url': card.get('image_url', ''),
-                '_source': card.get('_source', 'english')
-            })
+            self.cards[normalized].append(CardVariant(store, index))
+        
+        # Reverse SET -> {number: name} map for get_name_by_set_number.
+        # Numbers are keyed zero-stripped; first name in index order wins.
+        self._name_by_set_number = {}
+        for db_name, variants in self.cards.items():
+            for variant in variants:
+                set_key, number_key = self._set_number_key(variant['set_code'] or '', variant['set_number'] or '')
+                numbers = self._name_by_set_number.setdefault(sys.intern(set_key), {})
+                if number_key not in numbers:
+                    numbers[sys.intern(number_key)] = variant['name']
+        
+        # Resolved profiles: every per-card query below becomes a dict hit
+        self.profiles = {}
+        for normalized, variants in self.cards.items():
+            self.profiles[normalized] = self._build_profile(normalized, variants)
+        for normalized in self.BASIC_ENERGY_PRINTS:
+            if normalized not in self.profiles:
+                self.profiles[normalized] = self._build_profile(normalized, [])
+        
+        # Indexes for the partial-match fallbacks of get_card_info
+        names = list(self.cards.keys())
+        self._substring_index = NameSubstringIndex(names)
+        self._containment_automaton = NameContainmentAutomaton(names, min_length=3)
+        self._fuzzy_matcher = FuzzyNameMatcher(self._substring_index)
+        self._fuzzy_names = {}  # normalized query -> matched DB name (or None)
         
         print(f"[CardDatabaseLookup] ✓ Indexed {len(self.cards)} unique card names")
         return True
     
     def normalize_name(self, name: str) -> str:
-        """Normalize card name for matching."""
-        normalized = name.strip().lower()
-        normalized = normalized.replace("'", "'").replace("'", "'").replace("`", "'")
-        normalized = normalized.replace('-', ' ').replace('.', '')
-        normalized = ' '.join(normalized.split())
+        """Normalize card name for matching (memoized per raw name)."""
+        normalized = self._normalized_names.get(name)
+        if normalized is None:
+            normalized = name.strip().lower()
+            normalized = normalized.replace("'", "'").replace("'", "'").replace("`", "'")
+            normalized = normalized.replace('-', ' ').replace('.', '')
+            normalized = sys.intern(' '.join(normalized.split()))
+            self._normalized_names[name] = normalized
         return normalized
     
+    def get_profile(self, card_name: str) -> Optional[CardProfile]:
+        """Get the precomputed CardProfile for a card name (None if unknown)."""
+        return self.profiles.get(self.normalize_name(card_name))
+    
+    def _build_profile(self, normalized: str, variants: List[Dict[str, str]]) -> CardProfile:
+        """Resolve everything lookup_card/get_latest_low_rarity_version/get_card_info need, once."""
+        first_print = None
+        preferred_print = None
+        latest_print = None
+        card_info = None
+        
+        if variants:
+            first = variants[0]
+            card_type = first.get('card_type', '') or first.get('type', '')
+            card_type_lower = card_type.lower()
+            # Normalize supertype
+            if 'pokemon' in card_type_lower or card_type == '':
+                supertype = 'Pokémon'
+            elif 'energy' in card_type_lower:
+                supertype = 'Energy'
+            elif any(x in card_type_lower for x in ['trainer', 'supporter', 'item', 'tool', 'stadium']):
+                supertype = 'Trainer'
+            else:
+                supertype = 'Pokémon'  # Default
+            first_print = CardPrint(first.get('name', ''), first.get('set_code', ''),
+                                    first.get('set_number', ''), first.get('rarity', ''), supertype)
+            
+            # Latest LOW RARITY version; fallback to ANY rarity (prefer newest set)
+            low_rarity_variants = [v for v in variants if v.get('rarity', '') in self.LOW_RARITIES]
+            if not low_rarity_variants:
+                low_rarity_variants = variants
+            best_card = None
+            best_set_order = -1
+            for variant in low_rarity_variants:
+                set_order = self.SET_ORDER.get(variant.get('set_code', ''), 0)
+                if set_order > best_set_order:
+                    best_card = variant
+                    best_set_order = set_order
+            if best_card:
+                latest_print = self._make_print(best_card)
+            
+            # Prefer EN variant if available (MC or numeric set_code is JP)
+            en_variant = None
+            jp_variant = None
+            for variant in variants:
+                set_code = variant.get('set_code', '').upper()
+                if set_code and not set_code.startswith('MC') and not set_code.isdigit():
+                    en_variant = variant
+                    break
+                if set_code.startswith('MC') or set_code.isdigit():
+                    jp_variant = variant
+            preferred_print = self._make_print(en_variant if en_variant else jp_variant if jp_variant else first)
+            card_info = {
+                'set_code': preferred_print.set_code,
+                'set_name': '',  # Not in CSV
+                'number': preferred_print.number,
+                'rarity': preferred_print.rarity,
+                'type': preferred_print.supertype,
+                'image_url': preferred_print.image_url
+            }
+        
+        if normalized in self.BASIC_ENERGY_PRINTS:
+            set_code, set_number = self.BASIC_ENERGY_PRINTS[normalized]
+            rarity = 'Basic Energy'
+            image_url = self.generate_limitless_image_url(set_code, set_number, rarity)
+            name = variants[0].get('name', '') if variants else normalized.title()
+            latest_print = CardPrint(name, set_code, set_number, rarity, 'Energy', image_url)
+            card_info = {
+                'set_code': set_code,
+                'set_name': 'SVE',
+                'number': set_number,
+                'rarity': rarity,
+                'type': 'Energy',
+                'image_url': image_url
+            }
+        
+        return CardProfile(
+            first_print=first_print,
+            latest_low_rarity_print=latest_print,
+            preferred_print=preferred_print,
+            is_trainer_or_energy=self.is_card_trainer_or_energy(variants),
+            is_ace_spec=self.is_ace_spec_from_variants(variants),
+            card_info=card_info
+        )
+    
+    def _make_print(self, variant: Dict[str, str]) -> CardPrint:
+        """CardPrint for a DB variant (raw type as supertype, generated image URL)."""
+        return CardPrint(
+            variant.get('name', ''),
+            variant.get('set_code', ''),
+            variant.get('set_number', ''),
+            variant.get('rarity', ''),
+            variant.get('card_type', '') or variant.get('type', ''),
+            self.generate_limitless_image_url(variant.get('set_code', ''), variant.get('set_number', ''),
+                                              variant.get('rarity', ''))
+        )
+    
     def is_japanese_set(self, set_code: str) -> bool:
         """Check if set code is Japanese."""
         # Simple heuristic: Japanese sets are typically 1-3 lowercase letters
@@ -367,130 +784,8 @@ class CardDatabaseLookup:
     
     def is_card_trainer_or_energy_by_name(self, card_name: str) -> bool:
         """Check if a card (by name) is a Trainer or Energy card."""
-        normalized = self.normalize_name(card_name)
-        if normalized in self.cards:
-            return self.is_card_trainer_or_energy(self.cards[normalized])
-        return False
-    
-    def is_ace_spec_by_name(self, card_name: str) -> bool:
-        """Check if a card is an Ace Spec."""
-        normalized = self.normalize_name(card_name)
-        if normalized not in self.cards:
-            return False
-        
-        variants = self.cards[normalized]
-        if not variants:
-            return False
-        
-        # Check rarity and type
-        first = variants[0]
-        rarity = first.get('rarity', '').lower()
-        card_type = (first.get('card_type', '') or first.get('type', '')).lower()
-        
-        return ('ultra rare' in rarity or 'special' in rarity) and any(
-            t in card_type for t in ['trainer', 'supporter', 'tool', 'item', 'stadium']
-        )
-    
-    def is_ace_spec(self, variants: List[Dict[str, str]]) -> bool:
-        """Check if card variants represent an Ace Spec."""
-        if not variants:
-            return False
-        
-        for variant in variants:
-            rarity = variant.get('rarity', '').lower()
-            card_type = (variant.get('card_type', '') or variant.get('type', '')).lower()
-            
-            if ('ultra rare' in rarity or 'special' in rarity) and any(
-                t in card_type for t in ['trainer', 'supporter', 'tool', 'item', 'stadium']
-            ):
-                return True
-        
-        return False
-    
-    def get_latest_low_rarity_version(self, card_name: str) -> Optional[Any]:
-        """Get the latest LOW RARITY version of a Trainer/Energy card."""
-        normalized = self.normalize_name(card_name)
-        
-        # Force SVE for basic energies
-        basic_energy_map = {
-            'grass energy': ('SVE', '17'),
-            'fire energy': ('SVE', '18'),
-            'water energy': ('SVE', '19'),
-            'lightning energy': ('SVE', '20'),
-            'psychic energy': ('SVE', '21'),
-            'fighting energy': ('SVE', '22'),
-            'darkness energy': ('SVE', '23'),
-            'metal energy': ('SVE', '24'),
-            'fairy energy': ('SVE', '25')
-        }
-        
-        if normalized in basic_energy_map:
-            set_code, set_number = basic_energy_map[normalized]
-            class CardInfo:
-                def __init__(self):
-                    self.name = card_name
-                    self.set_code = set_code
-                    self.number = set_number
-                    self.rarity = 'Basic Energy'
-                    self.supertype = 'Energy'
-            return CardInfo()
-        
-        if normalized not in self.cards:
-            return None
-        
-        variants = self.cards[normalized]
-        LOW_RARITIES = {'Common', 'Uncommon', 'Promo'}
-        
-        low_rarity_variants = [v for v in variants if v.get('rarity', '') in LOW_RARITIES]
-        if not low_rarity_variants:
-            low_rarity_variants = variants
-        
-        best_card = None
-        best_set_order = -1
-        
-        for variant in low_rarity_variants:
-            set_code = variant.get('set_code', '')
-            set_order = self.SET_ORDER.get(set_code, 0)
-            
-            if set_order > best_set_order:
-                best_card = variant
-                best_set_order = set_order
-        
-        if not best_card:
-            return None
-        
-        class CardInfo:
-            def __init__(self, data):
-                self.name = data.get('name', '')
-                self.set_code = data.get('set_code', '')
-                self.number = data.get('set_number', '')
-                self.rarity = data.get('rarity', '')
-                self.supertype = data.get('card_type', '') or data.get('type', '')
-        
-        return CardInfo(best_card)
-    
-    def lookup_card(self, card_name: str) -> Optional[Any]:
-        """Lookup card in database and return CardInfo object."""
-        normalized = self.normalize_name(card_name)
-        
-        if normalized not in self.cards:
-            return None
-        
-        variants = self.cards[normalized]
-        if not variants:
-            return None
-        
-        best_card = variants[0]
-        
-        class CardInfo:
-            def __init__(self, data):
-                self.name = data.get('name', '')
-                self.set_code = data.get('set_code', '')
-                self.number = data.get('set_number', '')
-                self.rarity = data.get('rarity', '')
-                self.supertype = data.get('card_type', '') or data.get('type', '')
-        
-        return CardInfo(best_card)
+        profile = self.profiles.get(self.normalize_name(card_name))
+        return profile.is_trainer_or_energy if profile else False
     
     def is_ace_spec_by_name(self, card_name: str) -> bool:
         """
@@ -500,19 +795,17 @@ class CardDatabaseLookup:
         2. Fallback: Check 'Ultra Rare' rarity with Trainer/Stadium/Tool/Item type
         3. Fallback: Check for 'ace spec' in card type text
         """
-        normalized = normalize_card_name_for_ace_check(card_name)
-        
         # Method 1: Check known Ace Specs list (most reliable)
-        if normalized in KNOWN_ACE_SPECS:
+        known = self._ace_spec_names.get(card_name)
+        if known is None:
+            known = normalize_card_name_for_ace_check(card_name) in KNOWN_ACE_SPECS
+            self._ace_spec_names[card_name] = known
+        if known:
             return True
         
-        # Method 2: Not in known list - check database with fallback logic
-        normalized_db = self.normalize_name(card_name)
-        if normalized_db in self.cards:
-            variants = self.cards[normalized_db]
-            return self.is_ace_spec_from_variants(variants)
-        
-        return False
+        # Method 2: Not in known list - use the database verdict from the profile
+        profile = self.profiles.get(self.normalize_name(card_name))
+        return profile.is_ace_spec if profile else False
     
     def is_ace_spec(self, variants: List[Dict[str, str]]) -> bool:
         """
@@ -555,116 +848,77 @@ class CardDatabaseLookup:
         
         return False
     
-    def get_latest_low_rarity_version(self, card_name: str) -> Optional[Any]:
+    def get_latest_low_rarity_version(self, card_name: str) -> Optional[CardPrint]:
         """
         Get the latest LOW RARITY version of a Trainer/Energy card.
-        Returns a CardInfo object with set_code, number, rarity, etc.
+        Returns a CardPrint with set_code, number, rarity, supertype and image_url.
         
         For Basic Energy: Force SVE set (17-25)
         For Trainer/Energy cards: Filter to LOW RARITY only (Common, Uncommon, Promo),
         then select NEWEST set from those low-rarity versions.
         """
-        normalized = self.normalize_name(card_name)
-        
-        # Force SVE for basic energies
-        basic_energy_map = {
-            'grass energy': ('SVE', '17'),
-            'fire energy': ('SVE', '18'),
-            'water energy': ('SVE', '19'),
-            'lightning energy': ('SVE', '20'),
-            'psychic energy': ('SVE', '21'),
-            'fighting energy': ('SVE', '22'),
-            'darkness energy': ('SVE', '23'),
-            'metal energy': ('SVE', '24'),
-            'fairy energy': ('SVE', '25')
-        }
-        
-        if normalized in basic_energy_map:
-            set_code, set_number = basic_energy_map[normalized]
-            class CardInfo:
-                def __init__(self):
-                    self.name = card_name
-                    self.set_code = set_code
-                    self.number = set_number
-                    self.rarity = 'Basic Energy'
-                    self.supertype = 'Energy'
-            return CardInfo()
-        
-        if normalized not in self.cards:
-            return None
-        
-        variants = self.cards[normalized]
-        
-        # Define LOW RARITY values
-        LOW_RARITIES = {'Common', 'Uncommon', 'Promo'}
-        
-        # Filter to only LOW RARITY variants
-        low_rarity_variants = [v for v in variants if v.get('rarity', '') in LOW_RARITIES]
-        
-        # If no low rarity version exists, fallback to ANY rarity (prefer newest set)
-        if not low_rarity_variants:
-            low_rarity_variants = variants  # Use all variants as fallback
-        
-        # Find the NEWEST set among available variants
-        best_card = None
-        best_set_order = -1
-        
-        for variant in low_rarity_variants:
-            set_code = variant.get('set_code', '')
-            set_order = self.SET_ORDER.get(set_code, 0)
-            
-            if set_order > best_set_order:
-                best_card = variant
-                best_set_order = set_order
-        
-        if not best_card:
-            return None
-        
-        # Return a CardInfo-like object
-        class CardInfo:
-            def __init__(self, data):
-                self.name = data.get('name', '')
-                self.set_code = data.get('set_code', '')
-                self.number = data.get('set_number', '')
-                self.rarity = data.get('rarity', '')
-                self.supertype = data.get('card_type', '') or data.get('type', '')
-        
-        return CardInfo(best_card)
+        profile = self.profiles.get(self.normalize_name(card_name))
+        return profile.latest_low_rarity_print if profile else None
     
-    def lookup_card(self, card_name: str) -> Optional[Any]:
+    def lookup_card(self, card_name: str) -> Optional[CardPrint]:
         """
-        Lookup card in database and return CardInfo object with supertype, set_code, etc.
+        Lookup card in database and return CardPrint with supertype, set_code, etc.
         Used for determining card type (Pokemon vs Trainer vs Energy).
         """
-        normalized = self.normalize_name(card_name)
+        profile = self.profiles.get(self.normalize_name(card_name))
+        return profile.first_print if profile else None
+
+    def resolve_many(self, entries: List[Tuple[str, str, str, Optional[str]]]) -> List[ResolvedCard]:
+        """
+        Resolve a whole batch of decklist entries in one call.
         
-        if normalized not in self.cards:
-            return None
+        Each entry is (name, set_code, number, section), section being
+        'pokemon', 'trainer', 'energy' or None (infer from the database):
+        - pokemon: keep the given set/number
+        - trainer/energy: latest low-rarity print (given set/number if none)
+        - None: basic energy -> forced SVE print, Pokémon -> given set/number,
+          everything else like trainer/energy (copy button format)
         
-        variants = self.cards[normalized]
-        if not variants:
-            return None
-        
-        # Return first variant as CardInfo object
-        class CardInfo:
-            def __init__(self, data):
-                self.name = data.get('name', '')
-                self.set_code = data.get('set_code', '')
-                self.number = data.get('set_number', '')
-                self.rarity = data.get('rarity', '')
-                card_type = data.get('card_type', '') or data.get('type', '')
-                # Normalize supertype
-                if 'pokemon' in card_type.lower() or card_type == '':
-                    self.supertype = 'Pokémon'
-                elif 'energy' in card_type.lower():
-                    self.supertype = 'Energy'
-                elif any(x in card_type.lower() for x in ['trainer', 'supporter', 'item', 'tool', 'stadium']):
-                    self.supertype = 'Trainer'
-                else:
-                    self.supertype = 'Pokémon'  # Default
+        Repeated names share one normalization/profile lookup and identical
+        entries share one ResolvedCard. Results are returned in input order.
+        """
+        by_name = {}  # raw name -> (normalized name, profile, is_ace_spec)
+        by_entry = {}  # entry tuple -> ResolvedCard
+        results = []
+        
+        for entry in entries:
+            resolved = by_entry.get(entry)
+            if resolved is None:
+                name, set_code, number, section = entry
+                
+                known = by_name.get(name)
+                if known is None:
+                    normalized = self.normalize_name(name)
+                    known = by_name[name] = (normalized, self.profiles.get(normalized),
+                                             self.is_ace_spec_by_name(name))
+                normalized, profile, is_ace_spec = known
+                
+                db_print = None
+                if section is None:
+                    if normalized in self.BASIC_ENERGY_PRINTS:
+                        set_code, number = self.BASIC_ENERGY_PRINTS[normalized]
+                        resolved = ResolvedCard(name, section, set_code, number, True, is_ace_spec)
+                    elif not (profile and profile.supertype == 'Pokémon'):
+                        db_print = profile.latest_low_rarity_print if profile else None
+                elif section != 'pokemon':
+                    db_print = profile.latest_low_rarity_print if profile else None
+                
+                if resolved is None:
+                    if db_print:
+                        resolved = ResolvedCard(name, section, db_print.set_code, db_print.number, True, is_ace_spec)
+                    else:
+                        resolved = ResolvedCard(name, section, set_code, number, False, is_ace_spec)
+                by_entry[entry] = resolved
+            
+            results.append(resolved)
         
-        return CardInfo(variants[0])
-
+        return results
+    
     def generate_limitless_image_url(self, set_code: str, card_number: str, rarity: str) -> str:
         """Generate Limitless CDN image URL for EN or JP cards."""
         set_code = set_code.upper()
@@ -691,158 +945,114 @@ class CardDatabaseLookup:
         
         return url
     
-    def get_card_info(self, card_name: str) -> Optional[Dict[str, str]]:
-        """Get card info with proper handling of basic energies and card selection."""
-        # Force SVE EN variant for standard basic energies
-        basic_energy_map = {
-            'grass energy': ('SVE', '17'),
-            'fire energy': ('SVE', '18'),
-            'water energy': ('SVE', '19'),
-            'lightning energy': ('SVE', '20'),
-            'psychic energy': ('SVE', '21'),
-            'fighting energy': ('SVE', '22'),
-            'darkness energy': ('SVE', '23'),
-            'metal energy': ('SVE', '24'),
-            'fairy energy': ('SVE', '25')
-        }
-        norm_name = self.normalize_name(card_name)
-        if norm_name in basic_energy_map:
-            set_code, set_number = basic_energy_map[norm_name]
-            rarity = 'Basic Energy'
-            image_url = self.generate_limitless_image_url(set_code, set_number, rarity)
-            return {
-                'set_code': set_code,
-                'set_name': 'SVE',
-                'number': set_number,
-                'rarity': rarity,
-                'type': 'Energy',
-                'image_url': image_url
-            }
+    def get_card_info(self, card_name: str, fuzzy: bool = False) -> Optional[Dict[str, str]]:
+        """Get card info with proper handling of basic energies and card selection.
         
-        """For Trainer/Energy cards: Use NEWEST set (ASC > MEG > BRS...) regardless of rarity
+        Exact names (and basic energies, forced to SVE) come from the precomputed
+        profile. Otherwise falls back to partial matches:
+        For Trainer/Energy cards: Use NEWEST set (ASC > MEG > BRS...) regardless of rarity
         For Pokemon cards: Use LOWEST rarity (Common > Uncommon) regardless of set
+        
+        With fuzzy=True, names that still don't match are resolved with
+        match_fuzzy_name() (HTML entities, typos) before giving up.
         """
         normalized = self.normalize_name(card_name)
         
-        # Try exact match first
-        if normalized in self.cards:
-            variants = self.cards[normalized]
-            # Prefer EN variant if available
-            en_variant = None
-            jp_variant = None
-            for variant in variants:
-                set_code = variant.get('set_code', '').upper()
-                # EN cards: set_code is not MC, not a pure number, not JP-only
-                if set_code and not set_code.startswith('MC') and not set_code.isdigit():
-                    en_variant = variant
-                    break
-                # MC or numeric set_code is JP
-                if set_code.startswith('MC') or set_code.isdigit():
-                    jp_variant = variant
-            best_card = en_variant if en_variant else jp_variant if jp_variant else variants[0]
-            image_url = self.generate_limitless_image_url(
-                best_card['set_code'],
-                best_card['set_number'],
-                best_card['rarity']
-            )
-            return {
-                'set_code': best_card['set_code'],
-                'set_name': '',  # Not in CSV
-                'number': best_card['set_number'],
-                'rarity': best_card['rarity'],
-                'type': best_card.get('type', ''),
-                'image_url': image_url
-            }
+        # Exact match (EN variant preferred) or basic energy
+        profile = self.profiles.get(normalized)
+        if profile and profile.card_info:
+            return dict(profile.card_info)
         
         # Try partial match (for cards with ex/V suffixes or truncated names)
         # First try: cards where input is contained in database name
-        for db_name, variants in self.cards.items():
-            if normalized in db_name:
-                # Determine if this is a Trainer/Energy card
-                is_trainer_energy = self.is_card_trainer_or_energy(variants)
-                
-                best_card = None
-                best_priority = 999
-                best_set_order = -1
-                
-                for variant in variants:
-                    set_order = self.SET_ORDER.get(variant['set_code'], 0)
-                    
-                    if is_trainer_energy:
-                        # For Trainer/Energy: Prefer NEWEST set only
-                        if set_order > best_set_order:
-                            best_card = variant
-                            best_set_order = set_order
-                    else:
-                        # For Pokemon: Prefer LOWEST rarity, then NEWEST set
-                        rarity = variant['rarity']
-                        priority = self.RARITY_PRIORITY.get(rarity, 50)
-                        if priority < best_priority or (priority == best_priority and set_order > best_set_order):
-                            best_card = variant
-                            best_priority = priority
-                            best_set_order = set_order
-                
-                if best_card:
-                    image_url = self.generate_limitless_image_url(
-                        best_card['set_code'],
-                        best_card['set_number'],
-                        best_card['rarity']
-                    )
-                    
-                    return {
-                        'set_code': best_card['set_code'],
-                        'set_name': '',
-                        'number': best_card['set_number'],
-                        'rarity': best_card['rarity'],
-                        'type': best_card.get('type', ''),
-                        'image_url': image_url
-                    }
+        names = self._substring_index.names
+        for position in self._substring_index.iter_matches(normalized):
+            card_info = self._partial_match_card_info(self.cards[names[position]])
+            if card_info:
+                return card_info
         
         # Second try: database name is contained in input (for cases where scraped name is longer)
-        for db_name, variants in self.cards.items():
-            if db_name in normalized and len(db_name) > 3:  # Only if db_name is meaningful length
-                # Determine if this is a Trainer/Energy card
-                is_trainer_energy = self.is_card_trainer_or_energy(variants)
-                
-                best_card = None
-                best_priority = 999
-                best_set_order = -1
-                
-                for variant in variants:
-                    set_order = self.SET_ORDER.get(variant['set_code'], 0)
-                    
-                    if is_trainer_energy:
-                        # For Trainer/Energy: Prefer NEWEST set only
-                        if set_order > best_set_order:
-                            best_card = variant
-                            best_set_order = set_order
-                    else:
-                        # For Pokemon: Prefer LOWEST rarity, then NEWEST set
-                        rarity = variant['rarity']
-                        priority = self.RARITY_PRIORITY.get(rarity, 50)
-                        if priority < best_priority or (priority == best_priority and set_order > best_set_order):
-                            best_card = variant
-                            best_priority = priority
-                            best_set_order = set_order
-                
-                if best_card:
-                    image_url = self.generate_limitless_image_url(
-                        best_card['set_code'],
-                        best_card['set_number'],
-                        best_card['rarity']
-                    )
-                    
-                    return {
-                        'set_code': best_card['set_code'],
-                        'set_name': '',
-                        'number': best_card['set_number'],
-                        'rarity': best_card['rarity'],
-                        'type': best_card.get('type', ''),
-                        'image_url': image_url
-                    }
+        # Only names longer than 3 chars are in the automaton (meaningful length)
+        for position in self._containment_automaton.find_all(normalized):
+            card_info = self._partial_match_card_info(self.cards[names[position]])
+            if card_info:
+                return card_info
+        
+        if fuzzy:
+            match = self.match_fuzzy_name(card_name)
+            if match:
+                return self.get_card_info(match)
         
         return None
     
+    def match_fuzzy_name(self, card_name: str) -> Optional[str]:
+        """
+        Resolve a mangled card name to a database name without any network access.
+        
+        Tries the HTML-unescaped name first, then the closest database name by
+        edit distance (similarity >= FuzzyNameMatcher.min_similarity).
+        Returns the normalized database name, or None.
+        """
+        normalized = self.normalize_name(card_name)
+        if normalized in self._fuzzy_names:
+            return self._fuzzy_names[normalized]
+        
+        match = None
+        unescaped = self.normalize_name(html.unescape(card_name))
+        if unescaped in self.cards:
+            match = unescaped
+        else:
+            position = self._fuzzy_matcher.match(unescaped)
+            if position is not None:
+                match = self._substring_index.names[position]
+        
+        self._fuzzy_names[normalized] = match
+        return match
+    
+    def _partial_match_card_info(self, variants: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """Pick the best variant of a partially matched card name."""
+        # Determine if this is a Trainer/Energy card
+        is_trainer_energy = self.is_card_trainer_or_energy(variants)
+        
+        best_card = None
+        best_priority = 999
+        best_set_order = -1
+        
+        for variant in variants:
+            set_order = self.SET_ORDER.get(variant['set_code'], 0)
+            
+            if is_trainer_energy:
+                # For Trainer/Energy: Prefer NEWEST set only
+                if set_order > best_set_order:
+                    best_card = variant
+                    best_set_order = set_order
+            else:
+                # For Pokemon: Prefer LOWEST rarity, then NEWEST set
+                rarity = variant['rarity']
+                priority = self.RARITY_PRIORITY.get(rarity, 50)
+                if priority < best_priority or (priority == best_priority and set_order > best_set_order):
+                    best_card = variant
+                    best_priority = priority
+                    best_set_order = set_order
+        
+        if not best_card:
+            return None
+        
+        image_url = self.generate_limitless_image_url(
+            best_card['set_code'],
+            best_card['set_number'],
+            best_card['rarity']
+        )
+        
+        return {
+            'set_code': best_card['set_code'],
+            'set_name': '',
+            'number': best_card['set_number'],
+            'rarity': best_card['rarity'],
+            'type': best_card.get('type', ''),
+            'image_url': image_url
+        }
+    
     def get_card_info_by_set_number(self, card_name: str, set_code: str, card_number: str) -> Optional[Dict[str, str]]:
         """Get card info for a specific set and number.
         
@@ -875,27 +1085,37 @@ class CardDatabaseLookup:
         
         return None
     
+    @staticmethod
+    def _set_number_key(set_code: str, card_number: str) -> Tuple[str, str]:
+        """Key for the reverse set/number index (uppercased set, zero-stripped number)."""
+        number = card_number.strip()
+        return set_code.strip().upper(), number.lstrip('0') or number
+    
     def get_name_by_set_number(self, set_code: str, card_number: str) -> Optional[str]:
-        """Lookup card name by set code and number."""
+        """Lookup card name by set code and number (exact or zero-stripped number)."""
         if not set_code or not card_number:
             return None
-
-        normalized_set = set_code.strip().upper()
-        normalized_number = card_number.strip().lstrip('0') or card_number.strip()
         
-        # Search through all cards for matching set+number
-        for db_name, variants in self.cards.items():
-            for variant in variants:
-                variant_set = (variant['set_code'] or '').strip().upper()
-                variant_number = (variant['set_number'] or '').strip()
-                variant_number_norm = variant_number.lstrip('0') or variant_number
+        set_key, number_key = self._set_number_key(set_code, card_number)
+        return self._name_by_set_number.get(set_key, {}).get(number_key)
 
-                if variant_set == normalized_set and (
-                    variant_number == card_number.strip() or variant_number_norm == normalized_number
-                ):
-                    return variant['name']
-        
-        return None
+
+# Global singleton instance. CardTypeLookup only uses it with compat_normalization=False
+# (for normalize_name); both read rows from the shared CardDataManager.
+_card_database_instance: Optional[CardDatabaseLookup] = None
+
+
+def get_card_database() -> CardDatabaseLookup:
+    """
+    Get or create the process-wide CardDatabaseLookup instance.
+    
+    Use this instead of CardDatabaseLookup() when several modules of one run
+    need card lookups, so the name index and profiles are only built once.
+    """
+    global _card_database_instance
+    if _card_database_instance is None:
+        _card_database_instance = CardDatabaseLookup()
+    return _card_database_instance
 
 # ============================================================================
 # CARD PARSING
@@ -920,7 +1140,8 @@ def parse_copy_button_decklist(copy_text: str, card_db: CardDatabaseLookup) -> L
     Trainer/Energy: Database lookup for low-rarity version (Common/Uncommon)
     Basic Energy: Force SVE set
     """
-    cards = []
+    entries = []
+    counts = []
     lines = copy_text.strip().split('\n')
     
     for line in lines:
@@ -932,61 +1153,19 @@ def parse_copy_button_decklist(copy_text: str, card_db: CardDatabaseLookup) -> L
         # Parse format: "4 Card Name SET 123"
         match = re.match(r'^(\d+)\s+(.+?)\s+([A-Z0-9]+)\s+(\d+)$', line)
         if match:
-            count = int(match.group(1))
-            card_name = match.group(2).strip()
-            set_code = match.group(3).strip()
-            set_number = match.group(4).strip()
-            
-            # Check if basic energy
-            norm_name = card_db.normalize_name(card_name)
-            basic_energies = ['grass energy', 'fire energy', 'water energy', 'lightning energy',
-                            'psychic energy', 'fighting energy', 'darkness energy', 'metal energy', 'fairy energy']
-            
-            if norm_name in basic_energies:
-                # Force SVE set for basic energies
-                basic_energy_map = {
-                    'grass energy': '17', 'fire energy': '18', 'water energy': '19',
-                    'lightning energy': '20', 'psychic energy': '21', 'fighting energy': '22',
-                    'darkness energy': '23', 'metal energy': '24', 'fairy energy': '25'
-                }
-                cards.append({
-                    'name': card_name,
-                    'count': count,
-                    'set_code': 'SVE',
-                    'set_number': basic_energy_map[norm_name]
-                })
-            else:
-                # Check card type
-                db_card = card_db.lookup_card(card_name)
-                
-                if db_card and db_card.supertype == 'Pokémon':
-                    # Pokemon: Keep original set+number from copy button
-                    cards.append({
-                        'name': card_name,
-                        'count': count,
-                        'set_code': set_code,
-                        'set_number': set_number
-                    })
-                else:
-                    # Trainer/Energy: Get low-rarity version from database
-                    latest_card = card_db.get_latest_low_rarity_version(card_name)
-                    if latest_card:
-                        cards.append({
-                            'name': card_name,
-                            'count': count,
-                            'set_code': latest_card.set_code,
-                            'set_number': latest_card.number
-                        })
-                    else:
-                        # Fallback: Keep original if no low-rarity found
-                        cards.append({
-                            'name': card_name,
-                            'count': count,
-                            'set_code': set_code,
-                            'set_number': set_number
-                        })
-    
-    return cards
+            counts.append(int(match.group(1)))
+            entries.append((match.group(2).strip(), match.group(3).strip(), match.group(4).strip(), None))
+    
+    # Section is inferred from the database (basic energy / Pokémon / Trainer+Energy)
+    return [
+        {
+            'name': card.name,
+            'count': count,
+            'set_code': card.set_code,
+            'set_number': card.number
+        }
+        for count, card in zip(counts, card_db.resolve_many(entries))
+    ]
 
 # ============================================================================
 # DATA AGGREGATION
@@ -1162,15 +1341,14 @@ def aggregate_card_data(all_decks: List[Dict[str, Any]], card_db: CardDatabaseLo
                     # Trainer/Energy - use latest LOW RARITY version (ignore source set/number)
                     latest_card = card_db.get_latest_low_rarity_version(card_name)
                     if latest_card:
-                        # Convert to dict format
-                        image_url = card_db.generate_limitless_image_url(latest_card.set_code, latest_card.number, latest_card.rarity)
+                        # Convert to dict format (image URL is precomputed on the print)
                         card_info = {
                             'set_code': latest_card.set_code,
                             'set_name': '',
                             'number': latest_card.number,
                             'rarity': latest_card.rarity,
                             'type': latest_card.supertype,
-                            'image_url': image_url
+                            'image_url': latest_card.image_url
                         }
                         final_set_code = latest_card.set_code
                         final_card_number = latest_card.number
@@ -1183,15 +1361,13 @@ def aggregate_card_data(all_decks: List[Dict[str, Any]], card_db: CardDatabaseLo
                         elif set_code and card_number:
                             # Last resort: Use source set/number
                             image_url = card_db.generate_limitless_image_url(set_code, card_number, 'Common')
-                            # Try to get type from database
-                            fallback_info = card_db.get_card_info(card_name)
-                            card_type = fallback_info.get('type', 'Trainer') if fallback_info else 'Trainer'
+                            # Not in database (get_card_info above found nothing)
                             card_info = {
                                 'set_code': set_code,
                                 'set_name': '',
                                 'number': card_number,
                                 'rarity': 'Unknown',
-                                'type': card_type,
+                                'type': 'Trainer',
                                 'image_url': image_url
                             }
                             final_set_code = set_code
@@ -3,6 +3,8 @@
 Card Type Lookup Module
 Central module for reliable card type detection based on:
 1. all_cards_database.csv (from Card_Database_Scraper) - PRIORITY
+   (read through the shared CardDataManager, so a run that also uses
+   CardDatabaseLookup loads the database only once)
 2. Alle Karten.txt (fallback)
 3. Japanische extra Karten.txt (fallback)
 NO MORE KEYWORD GUESSING - 100% accurate lookup!
@@ -11,18 +13,51 @@ NO MORE KEYWORD GUESSING - 100% accurate lookup!
 import os
 import sys
 import csv
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
+try:
+    from card_data_manager import get_data_dir, get_shared_manager
+    _CARD_DATA_MANAGER_AVAILABLE = True
+except ImportError:
+    _CARD_DATA_MANAGER_AVAILABLE = False
+
+# Characters normalize_card_name() maps away (applied after lower())
+_NORMALIZE_TABLE = str.maketrans({'é': 'e', "'": None, '-': None, '.': None, '!': None, '♂': None, '♀': None})
+
+# Suffixes that may be missing from / added to a deck list name
+_STRIP_SUFFIXES = (' ex', ' v', ' vmax', ' vstar', ' gx', ' mega')
+_APPEND_SUFFIXES = (' ex', ' v', ' vmax', ' vstar', ' gx')
+
+
+@lru_cache(maxsize=8192)
+def _normalize_compat(name: str) -> str:
+    """Memoized normalize_card_name() for raw input strings."""
+    return ' '.join(name.strip().lower().translate(_NORMALIZE_TABLE).split())
+
+
 class CardTypeLookup:
     """Manages card type lookup from CSV database and fallback text files"""
     
-    def __init__(self, load_japanese: bool = False):
+    # Alias map value for names that are neither known nor valid
+    _UNKNOWN_ALIAS = ("Pokemon", False)
+    
+    def __init__(self, load_japanese: bool = False, compat_normalization: bool = True):
+        """
+        Args:
+            load_japanese: Also load Japanische extra Karten.txt (text fallback only)
+            compat_normalization: Keep this module's own normalize_card_name()
+                                  results. If False, names are normalized like
+                                  CardDatabaseLookup.normalize_name() and keys are
+                                  shared with the CardDatabaseLookup index.
+        """
         self.card_database: Dict[str, str] = {}  # normalized name -> type
         self.japanese_database: Dict[str, str] = {}  # normalized name -> type (Japanese extras)
         self.load_japanese = load_japanese
+        self.compat_normalization = compat_normalization
         
-        # Try to load from CSV first (most up-to-date)
-        csv_loaded = self.load_csv_database()
+        # Use the shared in-process card index, then the CSV itself (most up-to-date)
+        csv_loaded = self.load_shared_database() or self.load_csv_database()
         
         # Fallback to text files if CSV not available
         if not csv_loaded:
@@ -30,6 +65,8 @@ class CardTypeLookup:
             self.load_card_database()
             if self.load_japanese:
                 self.load_japanese_database()
+        
+        self._build_alias_map()
     
     def get_app_path(self) -> str:
         """Get the directory where the executable/script is located."""
@@ -43,23 +80,7 @@ class CardTypeLookup:
         Normalize card name for reliable lookup.
         Removes special characters, extra spaces, and converts to lowercase.
         """
-        # Remove set codes and numbers that might be at the end
-        normalized = name.strip().lower()
-        
-        # Remove common variations
-        normalized = normalized.replace('é', 'e')
-        normalized = normalized.replace("'", '')
-        normalized = normalized.replace("'", '')
-        normalized = normalized.replace('-', '')
-        normalized = normalized.replace('.', '')
-        normalized = normalized.replace('!', '')
-        normalized = normalized.replace('♂', '')
-        normalized = normalized.replace('♀', '')
-        
-        # Replace multiple spaces with single space
-        normalized = ' '.join(normalized.split())
-        
-        return normalized
+        return _normalize_compat(name)
     
     def _determine_card_category(self, type_code: str) -> str:
         """
@@ -93,6 +114,58 @@ class CardTypeLookup:
         # Default to Pokemon for unknown types
         return "Pokemon"
     
+    def load_shared_database(self) -> bool:
+        """
+        Build the type map from the shared CardDataManager instead of parsing
+        all_cards_database.csv a second time. Rows are the same English CSV rows
+        in file order, so the result matches load_csv_database().
+        Only used if the manager reads the same data/ directory (next to this
+        script / the EXE) that load_csv_database() would read.
+        Returns True if successfully loaded, False otherwise.
+        """
+        if not _CARD_DATA_MANAGER_AVAILABLE:
+            return False
+        
+        # The manager resolves data/ against the working directory - started from
+        # elsewhere it would read a different (or no) database
+        data_dir = os.path.join(self.get_app_path(), 'data')
+        if os.path.realpath(get_data_dir()) != os.path.realpath(data_dir):
+            return False
+        
+        try:
+            manager = get_shared_manager()
+            if not self.compat_normalization:
+                from card_scraper_shared import get_card_database
+                self.normalize_card_name = get_card_database().normalize_name
+            
+            categories: Dict[str, str] = {}  # raw type code -> category (few distinct codes)
+            for row in manager.english_cards:
+                card_name = row.get('name', '').strip()
+                card_type_raw = row.get('type', '').strip()
+                if not card_name or not card_type_raw:
+                    continue
+                
+                card_type = categories.get(card_type_raw)
+                if card_type is None:
+                    card_type = categories[card_type_raw] = self._determine_card_category(card_type_raw)
+                self.card_database[self.normalize_card_name(card_name)] = card_type
+        except Exception as e:
+            print(f"ERROR loading shared card database: {e}")
+            self.card_database = {}
+            return False
+        
+        if not self.card_database:
+            return False
+        
+        counts = {category: 0 for category in ("Pokemon", "Trainer", "Energy")}
+        for card_type in self.card_database.values():
+            counts[card_type] += 1
+        print(f"Loaded {len(self.card_database)} card types from shared card database:")
+        print(f"  - Pokemon: {counts['Pokemon']}")
+        print(f"  - Trainer: {counts['Trainer']}")
+        print(f"  - Energy: {counts['Energy']}")
+        return True
+    
     def load_csv_database(self) -> bool:
         """
         Load all cards from all_cards_database.csv (created by convert_alle_karten.py).
@@ -343,6 +416,56 @@ class CardTypeLookup:
             import traceback
             traceback.print_exc()
     
+    def _build_alias_map(self):
+        """
+        Expand every name get_card_type/is_valid_card accept into one table.
+        
+        Maps each accepted normalized name (exact, Japanese extra, "basic X",
+        suffix stripped/added) to a (card type, is valid) pair. Entries are added
+        in the same priority order the per-call fallbacks used to try them, so the
+        first hit wins exactly as before.
+        """
+        types: Dict[str, str] = {}
+        valid = set()
+        
+        # Exact names (main database before Japanese extras)
+        for name, card_type in self.card_database.items():
+            types[name] = card_type
+        for name, card_type in self.japanese_database.items():
+            types.setdefault(name, card_type)
+        valid.update(types)
+        
+        # "Basic Grass Energy" -> "Grass Energy"
+        for name, card_type in self.card_database.items():
+            alias = f"basic {name}"
+            types.setdefault(alias, card_type)
+            valid.add(alias)
+        
+        # Name with a suffix the database entry doesn't have ("Mew ex" -> "Mew")
+        for suffix in _STRIP_SUFFIXES:
+            for name, card_type in self.card_database.items():
+                alias = f"{name}{suffix}"
+                types.setdefault(alias, card_type)
+                valid.add(alias)
+        
+        # Name missing a suffix the database entry has ("Mew" -> "Mew ex")
+        for suffix in _APPEND_SUFFIXES:
+            for name, card_type in self.card_database.items():
+                if name.endswith(suffix):
+                    types.setdefault(name[:-len(suffix)], card_type)
+        for suffix in _STRIP_SUFFIXES:
+            for name in self.card_database:
+                if name.endswith(suffix):
+                    alias = name[:-len(suffix)]
+                    if not alias.endswith(suffix):
+                        valid.add(alias)
+        
+        pairs: Dict[Tuple[str, bool], Tuple[str, bool]] = {}  # share the few distinct values
+        self._aliases: Dict[str, Tuple[str, bool]] = {}
+        for alias in types.keys() | valid:
+            pair = (types.get(alias, "Pokemon"), alias in valid)
+            self._aliases[alias] = pairs.setdefault(pair, pair)
+    
     def get_card_type(self, card_name: str) -> str:
         """
         Get the type of a card (Pokemon, Trainer, or Energy).
@@ -355,40 +478,10 @@ class CardTypeLookup:
         Returns:
             "Pokemon", "Trainer", or "Energy"
         """
-        normalized = self.normalize_card_name(card_name)
-        
-        # Direct lookup in main database
-        if normalized in self.card_database:
-            return self.card_database[normalized]
-        
-        # Fallback to Japanese database if available
-        if normalized in self.japanese_database:
-            return self.japanese_database[normalized]
-        
-        # For Energy cards: Try removing "basic" prefix (e.g., "Basic Grass Energy" -> "Grass Energy")
-        if normalized.startswith('basic '):
-            without_basic = normalized[6:]  # Remove "basic "
-            if without_basic in self.card_database:
-                return self.card_database[without_basic]
-        
-        # Try without "ex", "v", "vmax", "vstar" suffixes that might be missing
-        for suffix in [' ex', ' v', ' vmax', ' vstar', ' gx', ' mega']:
-            if normalized.endswith(suffix):
-                base_name = normalized[:-len(suffix)].strip()
-                if base_name in self.card_database:
-                    # Found the base card - assume same type
-                    return self.card_database[base_name]
-        
-        # Try adding common suffixes
-        for suffix in [' ex', ' v', ' vmax', ' vstar', ' gx']:
-            variant = f"{normalized}{suffix}"
-            if variant in self.card_database:
-                return self.card_database[variant]
-        
         # Not found - return Pokemon as safe default
         # (Most cards are Pokemon, and it's safer to include an extra Pokemon
         # than to accidentally classify a Pokemon as Trainer/Energy)
-        return "Pokemon"
+        return self._aliases.get(self.normalize_card_name(card_name), self._UNKNOWN_ALIAS)[0]
     
     def is_trainer_or_energy(self, card_name: str) -> bool:
         """
@@ -416,34 +509,7 @@ class CardTypeLookup:
         Returns:
             True if the card exists in the database, False otherwise
         """
-        normalized = self.normalize_card_name(card_name)
-        
-        # Direct lookup in main database
-        if normalized in self.card_database:
-            return True
-        
-        # Check Japanese database if available
-        if normalized in self.japanese_database:
-            return True
-        
-        # Try common variations
-        if normalized.startswith('basic '):
-            without_basic = normalized[6:]
-            if without_basic in self.card_database:
-                return True
-        
-        # Try with/without suffixes
-        for suffix in [' ex', ' v', ' vmax', ' vstar', ' gx', ' mega']:
-            if normalized.endswith(suffix):
-                base_name = normalized[:-len(suffix)].strip()
-                if base_name in self.card_database:
-                    return True
-            else:
-                variant = f"{normalized}{suffix}"
-                if variant in self.card_database:
-                    return True
-        
-        return False
+        return self._aliases.get(self.normalize_card_name(card_name), self._UNKNOWN_ALIAS)[1]
 
 
 # Global singleton instances
@@ -41,6 +41,7 @@ from card_scraper_shared import (
     get_app_path, get_data_dir, CardDatabaseLookup, 
     aggregate_card_data, save_to_csv, fetch_page, normalize_archetype_name
 )
+from http_client import backoff_delay, configure_rate_limit, get_http_client
 
 # Try to import city_league_module for tournament scraping
 try:
@@ -111,7 +112,9 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
     },
     "output_file": "city_league_analysis.csv",
     "append_mode": True,
-    "delay_between_requests": 1.5,
+    "requests_per_second": 2.0,       # start rate per host (close to the old 0.3 s sleeps per deck list)
+    "max_requests_per_second": 3.0,   # the adaptive rate never climbs above this
+    "max_requests_in_flight": 1,
     "_comment": "Scrapes City League tournaments and extracts card data by archetype. append_mode=True keeps old tournament dates when adding new data."
 }
 
@@ -169,7 +172,7 @@ def resolve_date_range(start_date: str, end_date: str) -> Tuple[datetime, dateti
 
 
 def safe_fetch(url: str, timeout: int, retries: int, retry_delay: float) -> str:
-    """Fetch a URL with retries and a configurable timeout."""
+    """Fetch a URL with retries (exponential backoff with jitter) and a configurable timeout."""
     attempts = retries + 1
     for attempt in range(1, attempts + 1):
         print(f"  Fetching: {url} (attempt {attempt}/{attempts})", flush=True)
@@ -177,7 +180,8 @@ def safe_fetch(url: str, timeout: int, retries: int, retry_delay: float) -> str:
         if html:
             return html
         print(f"  [WARN] Fetch failed (attempt {attempt}/{attempts}): {url}")
-        time.sleep(retry_delay)
+        if attempt < attempts:
+            time.sleep(backoff_delay(retry_delay, attempt))
     return ""
 
 
@@ -202,7 +206,8 @@ def extract_cards_from_deck_html(deck_html: str, card_db: CardDatabaseLookup) ->
     Extract Pokemon, Trainer, and Energy cards from a deck HTML page.
     Returns list of cards with: name, count, set_code, set_number
     """
-    cards = []
+    entries = []  # (name, set, number, section) for card_db.resolve_many
+    counts = []
     
     # ========== POKEMON CARDS ==========
     pokemon_section = re.search(
@@ -218,12 +223,8 @@ def extract_cards_from_deck_html(deck_html: str, card_db: CardDatabaseLookup) ->
         )
         
         for set_code, set_number, count, card_name in pokemon_cards:
-            cards.append({
-                'name': card_name.strip(),
-                'count': int(float(count)),
-                'set_code': set_code.strip(),
-                'set_number': set_number.strip()
-            })
+            counts.append(int(float(count)))
+            entries.append((card_name.strip(), set_code.strip(), set_number.strip(), 'pokemon'))
     
     # ========== TRAINER CARDS ==========
     trainer_section = re.search(
@@ -238,15 +239,8 @@ def extract_cards_from_deck_html(deck_html: str, card_db: CardDatabaseLookup) ->
         )
         
         for count, card_name in trainer_cards:
-            card_name = card_name.strip()
-            latest_card = card_db.get_latest_low_rarity_version(card_name)
-            if latest_card:
-                cards.append({
-                    'name': card_name,
-                    'count': int(float(count)),
-                    'set_code': latest_card.set_code,
-                    'set_number': latest_card.number
-                })
+            counts.append(int(float(count)))
+            entries.append((card_name.strip(), '', '', 'trainer'))
     
     # ========== ENERGY CARDS ==========
     energy_section = re.search(
@@ -261,15 +255,19 @@ def extract_cards_from_deck_html(deck_html: str, card_db: CardDatabaseLookup) ->
         )
         
         for count, card_name in energy_cards:
-            card_name = card_name.strip()
-            latest_card = card_db.get_latest_low_rarity_version(card_name)
-            if latest_card:
-                cards.append({
-                    'name': card_name,
-                    'count': int(float(count)),
-                    'set_code': latest_card.set_code,
-                    'set_number': latest_card.number
-                })
+            counts.append(int(float(count)))
+            entries.append((card_name.strip(), '', '', 'energy'))
+    
+    # Trainer/Energy cards without a low-rarity print in the database are skipped
+    cards = []
+    for count, card in zip(counts, card_db.resolve_many(entries)):
+        if card.section == 'pokemon' or card.from_database:
+            cards.append({
+                'name': card.name,
+                'count': count,
+                'set_code': card.set_code,
+                'set_number': card.number
+            })
     
     return cards
 
@@ -278,7 +276,6 @@ def process_tournament_decklists(
     tournament_html: str,
     max_decklists: int,
     tournament_info: Dict[str, Any],
-    delay: float,
     request_timeout: int,
     max_retries: int,
     retry_delay: float,
@@ -356,8 +353,6 @@ def process_tournament_decklists(
                     'source': 'City League',
                     'tournament_date': tournament_date
                 })
-            
-            time.sleep(0.3)
         
         except Exception as e:
             print(f"  [WARN] Decklist error (tournament {tournament_id}): {e}", flush=True)
@@ -388,7 +383,6 @@ def scrape_city_league(settings: Dict[str, Any], card_db: CardDatabaseLookup) ->
     request_timeout = config.get('request_timeout', 20)
     max_retries = config.get('max_retries', 2)
     retry_delay = config.get('retry_delay', 1.0)
-    delay = settings.get('delay_between_requests', 1.5)
     additional_ids = config.get('additional_tournament_ids', [])
     
     # Resolve date range
@@ -408,10 +402,7 @@ def scrape_city_league(settings: Dict[str, Any], card_db: CardDatabaseLookup) ->
         print(f"\nFetching {len(additional_ids)} additional tournament(s) by ID...", flush=True)
         for tournament_id in additional_ids:
             try:
-                tournament_info = city_league_module.get_tournament_by_id(
-                    str(tournament_id),
-                    delay
-                )
+                tournament_info = city_league_module.get_tournament_by_id(str(tournament_id))
                 if tournament_info:
                     tournaments.append(tournament_info)
                     print(f"  ✓ Added tournament {tournament_id}", flush=True)
@@ -489,7 +480,6 @@ def scrape_city_league(settings: Dict[str, Any], card_db: CardDatabaseLookup) ->
                 html,
                 max_decklists,
                 tournament,
-                delay,
                 request_timeout,
                 max_retries,
                 retry_delay,
@@ -500,8 +490,6 @@ def scrape_city_league(settings: Dict[str, Any], card_db: CardDatabaseLookup) ->
             
             # Track successfully scraped tournament
             newly_scraped_ids.add(str(tournament_id))
-            
-            time.sleep(delay)
         
         except Exception as e:
             print(f"  [WARN] Tournament error (ID: {tournament_id}): {e}", flush=True)
@@ -519,6 +507,22 @@ def scrape_city_league(settings: Dict[str, Any], card_db: CardDatabaseLookup) ->
     return all_decks
 
 
+def save_results(all_decks: List[Dict[str, Any]], settings: Dict[str, Any], card_db: CardDatabaseLookup) -> None:
+    """Aggregate card usage by archetype and write the output CSV."""
+    # Add meta field for tracking
+    for deck in all_decks:
+        deck['meta'] = 'City League'
+    
+    # Aggregate card data
+    print(f"\nAggregating card data from {len(all_decks)} decks...")
+    aggregated_data = aggregate_card_data(all_decks, card_db)
+    
+    # Save to CSV
+    output_file = settings.get('output_file', 'city_league_analysis.csv')
+    append_mode = settings.get('append_mode', True)
+    save_to_csv(aggregated_data, output_file, append_mode=append_mode)
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
@@ -532,6 +536,7 @@ def main():
     
     # Load settings
     settings = load_settings()
+    configure_rate_limit(settings, DEFAULT_SETTINGS)
     
     # Initialize Card Database (now uses unified CardDataManager)
     print("Loading unified card database (English + Japanese)...")
@@ -557,22 +562,12 @@ def main():
         input("\nPress Enter to exit...")
         return
     
-    # Add meta field for tracking
-    for deck in all_decks:
-        deck['meta'] = 'City League'
-    
-    # Aggregate card data
-    print(f"\nAggregating card data from {len(all_decks)} decks...")
-    aggregated_data = aggregate_card_data(all_decks, card_db)
-    
-    # Save to CSV
-    output_file = settings.get('output_file', 'city_league_analysis.csv')
-    append_mode = settings.get('append_mode', True)
-    save_to_csv(aggregated_data, output_file, append_mode=append_mode)
+    save_results(all_decks, settings, card_db)
     
     print("\n" + "="*60)
     print("SCRAPING COMPLETE!")
     print("="*60)
+    print(get_http_client().format_stats())
     input("\nPress Enter to exit...")
 
 
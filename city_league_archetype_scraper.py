@@ -5,8 +5,6 @@ Scrapes archetype data from limitlesstcg.com Japanese City League tournaments
 No external dependencies required - uses only Python standard library
 """
 
-import urllib.request
-import urllib.parse
 import csv
 import re
 import time
@@ -17,6 +15,8 @@ from datetime import datetime
 from html.parser import HTMLParser
 from typing import List, Dict, Optional, Tuple, Any
 
+from http_client import get_http_client
+
 # Fix Windows console encoding for Unicode characters (✓, ×, •, etc.)
 if sys.platform == 'win32':
     if hasattr(sys.stdout, 'reconfigure'):
@@ -139,17 +139,8 @@ def parse_date(date_str: str) -> datetime:
         raise
 
 def fetch_page(url: str) -> str:
-    """Fetch a webpage and return its HTML content."""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            return response.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"Error fetching {url}: {type(e).__name__}: {str(e)[:50]}")
-        return ""
+    """Fetch a webpage and return its HTML content (shared pooled HTTP client)."""
+    return get_http_client().fetch_text(url, timeout=10)
 
 class TournamentListParser(HTMLParser):
     """Parser to extract tournament information from the list page."""
@@ -361,7 +352,7 @@ class TournamentDateParser(HTMLParser):
                 self.in_header = False
                 self.current_data = ""
 
-def get_tournament_by_id(tournament_id: str, delay: float = 1.5) -> Optional[Dict[str, str]]:
+def get_tournament_by_id(tournament_id: str, delay: float = 1.5, html: Optional[str] = None) -> Optional[Dict[str, str]]:
     """
     Fetch tournament info from a specific tournament ID from the main site.
     Extracts date and player count from the tournament detail page.
@@ -369,14 +360,15 @@ def get_tournament_by_id(tournament_id: str, delay: float = 1.5) -> Optional[Dic
     Args:
         tournament_id: The tournament ID (e.g., "547")
         delay: Delay between requests
+        html: Already fetched tournament page (skips the request)
         
     Returns:
         Dictionary with tournament info or None if failed
     """
     url = f"https://limitlesstcg.com/tournaments/{tournament_id}"
-    print(f"\nFetching tournament from: {url}")
-    
-    html = fetch_page(url)
+    if html is None:
+        print(f"\nFetching tournament from: {url}")
+        html = fetch_page(url)
     if not html:
         print(f"  Failed to fetch tournament page for ID {tournament_id}")
         return None
@@ -487,6 +479,14 @@ def scrape_tournament_archetypes(tournament_url: str, tournament_info: Dict[str,
         print(f"  Failed to fetch tournament page.")
         return []
     
+    results = build_archetype_rows(html, tournament_info)
+    print(f"  Found {len(results)} deck entries")
+    return results
+
+def build_archetype_rows(html: str, tournament_info: Dict[str, str]) -> List[Dict[str, str]]:
+    """
+    Build the CSV rows (one per deck entry) from an already fetched tournament page.
+    """
     # Use regex-based extraction
     archetypes = extract_tournament_data_regex(html)
     
@@ -504,7 +504,6 @@ def scrape_tournament_archetypes(tournament_url: str, tournament_info: Dict[str,
             'archetype': entry['archetype']
         })
     
-    print(f"  Found {len(results)} deck entries")
     return results
 
 def save_to_csv(data: List[Dict[str, str]], output_file: str):
@@ -1017,6 +1016,126 @@ def create_html_comparison(comparison_data: List[Dict[str, Any]], output_file: s
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write(html_content)
 
+def load_existing_tournament_ids(output_file: str) -> set:
+    """Tournament IDs already present in the output CSV (skipped on the next run)."""
+    existing_tournament_ids = set()
+    output_path = os.path.join(get_data_dir(), output_file)
+    if os.path.exists(output_path):
+        try:
+            with open(output_path, 'r', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f, delimiter=';')
+                for row in reader:
+                    if 'tournament_id' in row and row['tournament_id']:
+                        existing_tournament_ids.add(row['tournament_id'])
+            print(f"\nFound {len(existing_tournament_ids)} already scraped tournaments")
+        except Exception as e:
+            print(f"\nCould not load existing tournament IDs: {e}")
+    return existing_tournament_ids
+
+def regenerate_deck_statistics(output_file: str):
+    """Regenerate deck statistics from the existing CSV (nothing new was scraped)."""
+    output_path = os.path.join(get_data_dir(), output_file)
+    if os.path.exists(output_path):
+        try:
+            with open(output_path, 'r', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f, delimiter=';')
+                all_saved_data = list(reader)
+            print(f"\n✓ Loaded {len(all_saved_data)} entries from existing CSV")
+            
+            # Regenerate deck statistics only (comparison stays the same since no new data)
+            save_deck_statistics(all_saved_data, output_file)
+            print("✓ Deck statistics regenerated from existing data")
+            print("   (Comparison report not updated - no new data to add)")
+        except Exception as e:
+            print(f"Error regenerating statistics: {e}")
+
+def save_results(all_data: List[Dict[str, str]], output_file: str):
+    """
+    Merge newly scraped entries into the output CSV and regenerate
+    deck statistics, comparison report and HTML report.
+    """
+    # Save results
+    print("\n" + "=" * 60)
+    print(f"Scraping complete! Total entries collected: {len(all_data)}")
+    
+    # Load existing data BEFORE saving new data (for comparison)
+    output_path = os.path.join(get_data_dir(), output_file)
+    old_data = []
+    
+    if os.path.exists(output_path):
+        try:
+            with open(output_path, 'r', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f, delimiter=';')
+                old_data = list(reader)
+            print(f"\n✓ Loaded {len(old_data)} existing entries from CSV (for comparison)")
+        except Exception as e:
+            print(f"\n⚠️  Could not load existing data: {e}")
+            old_data = []
+    
+    # Combine old data + new data = complete dataset
+    new_data = old_data + all_data
+    
+    if all_data:
+        # Save complete dataset (overwrites CSV with old + new data combined)
+        save_to_csv(new_data, output_file)
+        print(f"✓ Saved {len(new_data)} total entries to CSV ({len(old_data)} existing + {len(all_data)} new)")
+    
+    # Generate deck statistics from complete dataset
+    if new_data:
+        save_deck_statistics(new_data, output_file)
+        
+        # Create comparison: old_data (before scrape) vs. new_data (after scrape)
+        print(f"\n📊 Creating comparison report:")
+        print(f"   Before this scrape: {len(old_data)} entries")
+        print(f"   After this scrape:  {len(new_data)} entries")
+        print(f"   Change: +{len(all_data)} new entries")
+        
+        create_comparison_report(old_data, new_data, output_file)
+        print("✓ Comparison report generated successfully!")
+    elif old_data:
+        # No new data scraped, but we can still regenerate stats from existing data
+        save_deck_statistics(old_data, output_file)
+        print("\n✓ Deck statistics regenerated from existing data")
+        print("   (No comparison report - no new data to compare)")
+    
+    # Create HTML report if we have data
+    if all_data:
+        try:
+            # Convert to comparison data format for HTML
+            comparison_data = []
+            for i, entry in enumerate(all_data, 1):
+                comparison_data.append({
+                    'rank': i,
+                    'placement': entry.get('placement', ''),
+                    'player': entry.get('player', ''),
+                    'archetype': entry.get('archetype', ''),
+                    'date': entry.get('date', ''),
+                    'shop': entry.get('shop', ''),
+                    'prefecture': entry.get('prefecture', '')
+                })
+            
+            html_file = output_file.replace('.csv', '.html')
+            create_html_comparison(comparison_data, html_file)
+            print(f"✓ HTML report created: {html_file}")
+        except Exception as e:
+            print(f"⚠️  Could not create HTML report: {e}")
+        
+        # Print summary statistics
+        print("\n" + "=" * 60)
+        print("Archetype Summary:")
+        print("=" * 60)
+        
+        archetype_counts = {}
+        for entry in all_data:
+            arch = entry['archetype']
+            archetype_counts[arch] = archetype_counts.get(arch, 0) + 1
+        
+        # Sort by count
+        sorted_archetypes = sorted(archetype_counts.items(), key=lambda x: x[1], reverse=True)
+        
+        for archetype, count in sorted_archetypes:
+            print(f"  {archetype}: {count}")
+
 def main():
     """Main execution function."""
     print("=" * 60)
@@ -1080,40 +1199,14 @@ def main():
         return
     
     # Load existing tournament IDs to skip already scraped ones
-    existing_tournament_ids = set()
-    output_path = os.path.join(get_data_dir(), settings['output_file'])
-    if os.path.exists(output_path):
-        try:
-            with open(output_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f, delimiter=';')
-                for row in reader:
-                    if 'tournament_id' in row and row['tournament_id']:
-                        existing_tournament_ids.add(row['tournament_id'])
-            print(f"\nFound {len(existing_tournament_ids)} already scraped tournaments")
-        except Exception as e:
-            print(f"\nCould not load existing tournament IDs: {e}")
+    existing_tournament_ids = load_existing_tournament_ids(settings['output_file'])
     
     # Filter out already scraped tournaments
     new_tournaments = [t for t in tournaments if str(t['tournament_id']) not in existing_tournament_ids]
     
     if not new_tournaments:
         print("\n✅ All tournaments in date range already scraped! Nothing new to scrape.")
-        
-        # Load existing data and regenerate deck statistics
-        output_path = os.path.join(get_data_dir(), settings['output_file'])
-        if os.path.exists(output_path):
-            try:
-                with open(output_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f, delimiter=';')
-                    all_saved_data = list(reader)
-                print(f"\n✓ Loaded {len(all_saved_data)} entries from existing CSV")
-                
-                # Regenerate deck statistics only (comparison stays the same since no new data)
-                save_deck_statistics(all_saved_data, settings['output_file'])
-                print("✓ Deck statistics regenerated from existing data")
-                print("   (Comparison report not updated - no new data to add)")
-            except Exception as e:
-                print(f"Error regenerating statistics: {e}")
+        regenerate_deck_statistics(settings['output_file'])
         return
     
     print(f"\n📊 Tournaments to scrape: {len(new_tournaments)} new (skipping {len(tournaments) - len(new_tournaments)} already scraped)")
@@ -1135,90 +1228,11 @@ def main():
         
         all_data.extend(archetypes)
     
-    # Save results
-    print("\n" + "=" * 60)
-    print(f"Scraping complete! Total entries collected: {len(all_data)}")
-    
-    # Load existing data BEFORE saving new data (for comparison)
-    output_path = os.path.join(get_data_dir(), settings['output_file'])
-    old_data = []
-    
-    if os.path.exists(output_path):
-        try:
-            with open(output_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f, delimiter=';')
-                old_data = list(reader)
-            print(f"\n✓ Loaded {len(old_data)} existing entries from CSV (for comparison)")
-        except Exception as e:
-            print(f"\n⚠️  Could not load existing data: {e}")
-            old_data = []
-    
-    # Combine old data + new data = complete dataset
-    new_data = old_data + all_data
-    
-    if all_data:
-        # Save complete dataset (overwrites CSV with old + new data combined)
-        save_to_csv(new_data, settings['output_file'])
-        print(f"✓ Saved {len(new_data)} total entries to CSV ({len(old_data)} existing + {len(all_data)} new)")
-    
-    # Generate deck statistics from complete dataset
-    if new_data:
-        save_deck_statistics(new_data, settings['output_file'])
-        
-        # Create comparison: old_data (before scrape) vs. new_data (after scrape)
-        print(f"\n📊 Creating comparison report:")
-        print(f"   Before this scrape: {len(old_data)} entries")
-        print(f"   After this scrape:  {len(new_data)} entries")
-        print(f"   Change: +{len(all_data)} new entries")
-        
-        create_comparison_report(old_data, new_data, settings['output_file'])
-        print("✓ Comparison report generated successfully!")
-    elif old_data:
-        # No new data scraped, but we can still regenerate stats from existing data
-        save_deck_statistics(old_data, settings['output_file'])
-        print("\n✓ Deck statistics regenerated from existing data")
-        print("   (No comparison report - no new data to compare)")
-    
-    # Create HTML report if we have data
-    if all_data:
-        try:
-            # Convert to comparison data format for HTML
-            comparison_data = []
-            for i, entry in enumerate(all_data, 1):
-                comparison_data.append({
-                    'rank': i,
-                    'placement': entry.get('placement', ''),
-                    'player': entry.get('player', ''),
-                    'archetype': entry.get('archetype', ''),
-                    'date': entry.get('date', ''),
-                    'shop': entry.get('shop', ''),
-                    'prefecture': entry.get('prefecture', '')
-                })
-            
-            html_file = settings['output_file'].replace('.csv', '.html')
-            create_html_comparison(comparison_data, html_file)
-            print(f"✓ HTML report created: {html_file}")
-        except Exception as e:
-            print(f"⚠️  Could not create HTML report: {e}")
-        
-        # Print summary statistics
-        print("\n" + "=" * 60)
-        print("Archetype Summary:")
-        print("=" * 60)
-        
-        archetype_counts = {}
-        for entry in all_data:
-            arch = entry['archetype']
-            archetype_counts[arch] = archetype_counts.get(arch, 0) + 1
-        
-        # Sort by count
-        sorted_archetypes = sorted(archetype_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        for archetype, count in sorted_archetypes:
-            print(f"  {archetype}: {count}")
+    save_results(all_data, settings['output_file'])
     
     print("\n" + "=" * 60)
     print("Scraping finished!")
+    print(get_http_client().format_stats())
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+City League Pipeline
+====================
+Runs the City League Archetype and City League Analysis scrapers in one pass.
+
+Both scrapers read the same pages: the JP tournament list and every City
+League tournament page. Here each page is fetched once and its HTML goes to
+both extractors:
+- extract_tournament_data_regex -> city_league_archetypes.csv (+ statistics, comparison, HTML report)
+- process_tournament_decklists  -> city_league_analysis.csv
+
+Settings and incremental tracking of both scrapers are used unchanged
+(city_league_archetype_settings.json / city_league_analysis_settings.json).
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+import city_league_analysis_scraper as analysis_scraper
+import city_league_archetype_scraper as archetype_scraper
+from card_scraper_shared import get_card_database
+from http_client import configure_rate_limit, fetch_page, get_http_client
+
+
+def tournament_key(tournament: Dict[str, Any]) -> str:
+    return str(tournament.get('tournament_id') or tournament.get('id', ''))
+
+
+def in_date_range(tournament: Dict[str, Any], start_dt: datetime, end_dt: datetime) -> bool:
+    tournament_date = archetype_scraper.parse_tournament_date(tournament.get('date_str', ''))
+    return bool(tournament_date) and start_dt <= tournament_date <= end_dt
+
+
+def main():
+    print("=" * 60)
+    print("CITY LEAGUE PIPELINE (Archetypes + Analysis)")
+    print("=" * 60)
+
+    archetype_settings = archetype_scraper.load_settings()
+    analysis_settings = analysis_scraper.load_settings()
+    analysis_config = analysis_settings.get('sources', {}).get('city_league', {})
+    configure_rate_limit(analysis_settings, analysis_scraper.DEFAULT_SETTINGS)
+    analysis_enabled = analysis_config.get('enabled', False)
+
+    start_str, end_str = archetype_scraper.calculate_date_range(archetype_settings['start_date'],
+                                                                archetype_settings['end_date'])
+    archetype_start = archetype_scraper.parse_date(start_str)
+    archetype_end = archetype_scraper.parse_date(end_str)
+    analysis_start, analysis_end = analysis_scraper.resolve_date_range(
+        analysis_config.get('start_date', '24.01.2026'), analysis_config.get('end_date', 'auto'))
+
+    print(f"\nArchetypes: {start_str} - {end_str} (region: {archetype_settings['region']})")
+    if analysis_enabled:
+        print(f"Analysis:   {analysis_start.strftime('%d.%m.%Y')} - {analysis_end.strftime('%d.%m.%Y')}")
+    else:
+        print("Analysis:   disabled in settings - skipping")
+
+    # ------------------------------------------------------------------
+    # 1. Tournament list - one request covering both date ranges
+    # ------------------------------------------------------------------
+    if analysis_enabled and archetype_settings['region'] == 'jp':
+        listed = archetype_scraper.get_tournaments_in_date_range(
+            'jp', min(archetype_start, analysis_start), max(archetype_end, analysis_end))
+        archetype_tournaments = [t for t in listed if in_date_range(t, archetype_start, archetype_end)]
+        analysis_tournaments = [t for t in listed if in_date_range(t, analysis_start, analysis_end)]
+    else:
+        archetype_tournaments = archetype_scraper.get_tournaments_in_date_range(
+            archetype_settings['region'], archetype_start, archetype_end)
+        analysis_tournaments = (analysis_scraper.fetch_city_league_tournaments(analysis_start, analysis_end)
+                                if analysis_enabled else [])
+
+    # ------------------------------------------------------------------
+    # 2. Additional tournaments by ID (e.g. Champions League)
+    # ------------------------------------------------------------------
+    pages: Dict[str, str] = {}  # url -> html, so every page is fetched once
+    archetype_ids = [str(tid) for tid in archetype_settings.get('additional_tournament_ids', [])]
+    analysis_ids = [str(tid) for tid in analysis_config.get('additional_tournament_ids', [])] if analysis_enabled else []
+    additional = {}
+    for tournament_id in dict.fromkeys(archetype_ids + analysis_ids):
+        url = f"https://limitlesstcg.com/tournaments/{tournament_id}"
+        print(f"\nFetching tournament from: {url}")
+        pages[url] = fetch_page(url)
+        info = archetype_scraper.get_tournament_by_id(tournament_id, html=pages[url]) if pages[url] else None
+        if info:
+            additional[tournament_id] = info
+        else:
+            print(f"  ✗ Failed to fetch tournament {tournament_id}")
+    archetype_tournaments += [additional[tid] for tid in archetype_ids if tid in additional]
+    analysis_tournaments += [additional[tid] for tid in analysis_ids if tid in additional]
+
+    max_tournaments = analysis_config.get('max_tournaments', 0)
+    if max_tournaments and max_tournaments > 0:
+        analysis_tournaments = analysis_tournaments[:max_tournaments]
+
+    # ------------------------------------------------------------------
+    # 3. Skip tournaments each scraper already has
+    # ------------------------------------------------------------------
+    archetype_done = archetype_scraper.load_existing_tournament_ids(archetype_settings['output_file'])
+    archetype_new = [t for t in archetype_tournaments if tournament_key(t) not in archetype_done]
+    analysis_done = analysis_scraper.load_scraped_tournaments() if analysis_enabled else set()
+    analysis_new = [t for t in analysis_tournaments if tournament_key(t) and tournament_key(t) not in analysis_done]
+
+    archetype_by_url = {t['url']: t for t in archetype_new if t.get('url')}
+    analysis_by_url = {t['url']: t for t in analysis_new if t.get('url')}
+    queue = list(dict.fromkeys(list(archetype_by_url) + list(analysis_by_url)))
+
+    print(f"\n📊 Tournaments to scrape: {len(archetype_new)} for archetypes, {len(analysis_new)} for analysis "
+          f"({len(queue)} pages)")
+
+    card_db = get_card_database() if analysis_by_url else None
+    request_timeout = analysis_config.get('request_timeout', 20)
+    max_retries = analysis_config.get('max_retries', 2)
+    retry_delay = analysis_config.get('retry_delay', 1.0)
+    max_decklists = analysis_config.get('max_decklists_per_league', 16)
+
+    # ------------------------------------------------------------------
+    # 4. Fetch every tournament page once, feed both extractors
+    # ------------------------------------------------------------------
+    archetype_data: List[Dict[str, str]] = []
+    analysis_decks: List[Dict[str, Any]] = []
+    newly_scraped_ids = set()
+
+    for i, url in enumerate(queue, 1):
+        tournament = archetype_by_url.get(url) or analysis_by_url[url]
+        print(f"\n[{i}/{len(queue)}] Processing tournament {tournament_key(tournament)}", flush=True)
+
+        html = pages.get(url) or analysis_scraper.safe_fetch(url, request_timeout, max_retries, retry_delay)
+        if not html:
+            print(f"  [WARN] Failed to fetch tournament page: {url}", flush=True)
+            continue
+
+        if url in archetype_by_url:
+            rows = archetype_scraper.build_archetype_rows(html, archetype_by_url[url])
+            archetype_data.extend(rows)
+            print(f"  Archetypes: {len(rows)} deck entries")
+
+        if url in analysis_by_url:
+            try:
+                decklists = analysis_scraper.process_tournament_decklists(
+                    html, max_decklists, analysis_by_url[url],
+                    request_timeout, max_retries, retry_delay, card_db
+                )
+                analysis_decks.extend(decklists)
+                newly_scraped_ids.add(tournament_key(analysis_by_url[url]))
+                print(f"  Analysis: {len(decklists)} decklists", flush=True)
+            except Exception as e:
+                print(f"  [WARN] Tournament error (ID: {tournament_key(tournament)}): {e}", flush=True)
+
+    # ------------------------------------------------------------------
+    # 5. Write both outputs
+    # ------------------------------------------------------------------
+    if archetype_new:
+        archetype_scraper.save_results(archetype_data, archetype_settings['output_file'])
+    elif archetype_tournaments:
+        print("\n✅ All archetype tournaments in date range already scraped! Nothing new to scrape.")
+        archetype_scraper.regenerate_deck_statistics(archetype_settings['output_file'])
+
+    if newly_scraped_ids:
+        analysis_scraper.save_scraped_tournaments(analysis_done | newly_scraped_ids)
+        print(f"✓ Saved {len(newly_scraped_ids)} new tournament IDs to tracking file", flush=True)
+    if analysis_decks:
+        analysis_scraper.save_results(analysis_decks, analysis_settings, card_db)
+    elif analysis_enabled:
+        print("\nNo new City League decks for the analysis.")
+
+    print("\n" + "=" * 60)
+    print("City League pipeline finished!")
+    print(get_http_client().format_stats())
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\nScraping interrupted by user.")
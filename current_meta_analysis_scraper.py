@@ -25,6 +25,7 @@ from card_scraper_shared import (
     normalize_archetype_name,
     parse_copy_button_decklist
 )
+from http_client import backoff_delay, configure_rate_limit, get_http_client
 
 # ============================================================================
 # TOURNAMENT TRACKING (Incremental Scraping for Meta Play!)
@@ -87,8 +88,6 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
             "enabled": True,
             "max_decks": 60,
             "max_lists_per_deck": 20,
-            "delay_between_lists": 4.0,
-            "delay_between_decks": 8.0,
             "format_filter": "PFL"
         },
         "tournaments": {
@@ -99,10 +98,12 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
             "format_filter": ["Standard", "Standard (JP)"]
         }
     },
-    "delay_between_requests": 3.0,
     "request_timeout": 20,
     "max_retries": 2,
     "retry_delay": 1.0,
+    "requests_per_second": 0.25,      # start rate per host (the old fixed delays were ~4 s per request)
+    "max_requests_per_second": 0.5,   # the adaptive rate never climbs above this
+    "max_requests_in_flight": 1,
     "append_mode": True,
     "output_file": "current_meta_card_data.csv",
     "_comment": "Combines Limitless Online (Meta Live) and Play! (Meta Play!). append_mode=True keeps old data."
@@ -110,7 +111,7 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
 
 
 def safe_fetch(url: str, timeout: int, retries: int, retry_delay: float) -> str:
-    """Fetch a URL with retries and a configurable timeout."""
+    """Fetch a URL with retries (exponential backoff with jitter) and a configurable timeout."""
     attempts = retries + 1
     for attempt in range(1, attempts + 1):
         print(f"  Fetching: {url} (attempt {attempt}/{attempts})", flush=True)
@@ -118,7 +119,8 @@ def safe_fetch(url: str, timeout: int, retries: int, retry_delay: float) -> str:
         if html:
             return html
         print(f"  [WARN] Fetch failed (attempt {attempt}/{attempts}): {url}", flush=True)
-        time.sleep(retry_delay)
+        if attempt < attempts:
+            time.sleep(backoff_delay(retry_delay, attempt))
     return ""
 
 
@@ -198,8 +200,6 @@ def scrape_limitless_online(settings: Dict[str, Any], card_db: CardDatabaseLooku
 
     max_decks = config.get("max_decks", 60)
     max_lists_per_deck = config.get("max_lists_per_deck", 20)
-    delay_lists = config.get("delay_between_lists", settings.get("delay_between_requests", 1.5))
-    delay_decks = config.get("delay_between_decks", settings.get("delay_between_requests", 1.5))
     format_filter = config.get("format_filter", "PFL")
     request_timeout = settings.get("request_timeout", 20)
     max_retries = settings.get("max_retries", 2)
@@ -276,7 +276,8 @@ def scrape_limitless_online(settings: Dict[str, Any], card_db: CardDatabaseLooku
                     if not list_html:
                         continue
 
-                    cards = []
+                    entries = []  # (name, set, number, section) for card_db.resolve_many
+                    counts = []
 
                     pokemon_match = re.search(
                         r'<div class="cards"><div class="heading">Pokémon[^<]*</div>(.*?)</div>',
@@ -290,12 +291,8 @@ def scrape_limitless_online(settings: Dict[str, Any], card_db: CardDatabaseLooku
                             pokemon_match.group(1)
                         )
                         for set_code, set_number, count, card_name in pokemon_links:
-                            cards.append({
-                                "name": card_name.strip(),
-                                "count": int(count),
-                                "set_code": set_code.strip(),
-                                "set_number": set_number.strip()
-                            })
+                            counts.append(int(count))
+                            entries.append((card_name.strip(), set_code.strip(), set_number.strip(), "pokemon"))
 
                     trainer_match = re.search(
                         r'<div class="heading">Trainer[^<]*</div>(.*?)</div>',
@@ -309,15 +306,8 @@ def scrape_limitless_online(settings: Dict[str, Any], card_db: CardDatabaseLooku
                             trainer_match.group(1)
                         )
                         for count, card_name in trainer_links:
-                            card_name = card_name.strip()
-                            latest_card = card_db.get_latest_low_rarity_version(card_name)
-                            if latest_card:
-                                cards.append({
-                                    "name": card_name,
-                                    "count": int(count),
-                                    "set_code": latest_card.set_code,
-                                    "set_number": latest_card.number
-                                })
+                            counts.append(int(count))
+                            entries.append((card_name.strip(), "", "", "trainer"))
 
                     energy_match = re.search(
                         r'<div class="heading">Energy[^<]*</div>(.*?)</div>',
@@ -331,14 +321,20 @@ def scrape_limitless_online(settings: Dict[str, Any], card_db: CardDatabaseLooku
                             energy_match.group(1)
                         )
                         for count, card_name in energy_links:
-                            latest_card = card_db.get_latest_low_rarity_version(card_name)
-                            if latest_card:
-                                cards.append({
-                                    "name": card_name.strip(),
-                                    "count": int(count),
-                                    "set_code": latest_card.set_code,
-                                    "set_number": latest_card.number
-                                })
+                            counts.append(int(count))
+                            entries.append((card_name.strip(), "", "", "energy"))
+
+                    # Trainer/Energy cards without a low-rarity print in the database are skipped
+                    cards = [
+                        {
+                            "name": card.name,
+                            "count": count,
+                            "set_code": card.set_code,
+                            "set_number": card.number
+                        }
+                        for count, card in zip(counts, card_db.resolve_many(entries))
+                        if card.section == "pokemon" or card.from_database
+                    ]
 
                     if cards:
                         all_decks.append({
@@ -350,13 +346,9 @@ def scrape_limitless_online(settings: Dict[str, Any], card_db: CardDatabaseLooku
                         successful_lists += 1
                         print(f"    [{list_idx}] {deck_name}: Extracted {len(cards)} cards", flush=True)
 
-                    time.sleep(delay_lists)
-
                 except Exception:
                     continue
 
-            time.sleep(delay_decks)
-
         except Exception as e:
             print(f"  Error processing {deck_name}: {e}", flush=True)
             continue
@@ -617,7 +609,6 @@ def scrape_tournaments(settings: Dict[str, Any], card_db: CardDatabaseLookup) ->
 
     max_tournaments = config.get("max_tournaments", 150)
     max_decks_per_tournament = config.get("max_decks_per_tournament", 128)
-    delay_between_requests = settings.get("delay_between_requests", 3.0)
     request_timeout = settings.get("request_timeout", 20)
     
     # Get tournament filters
@@ -732,14 +723,11 @@ def scrape_tournaments(settings: Dict[str, Any], card_db: CardDatabaseLookup) ->
                     if j <= 3:
                         print(f"    Error extracting deck {j}: {e}", flush=True)
                     continue
-                
-                time.sleep(delay_between_requests / 10)  # Shorter delay between decks
             
             # Track successfully scraped tournament
             newly_scraped_ids.add(tournament['id'])
             
             print(f"  Collected {len(all_decks)} complete decks so far", flush=True)
-            time.sleep(delay_between_requests)
             
         except Exception as e:
             print(f"  Error processing tournament {tournament['id']}: {e}", flush=True)
@@ -788,6 +776,7 @@ def main():
 
     settings = load_settings()
     print("[DEBUG] Settings loaded", flush=True)
+    configure_rate_limit(settings, DEFAULT_SETTINGS)
 
     print("Loading unified card database (English + Japanese)...", flush=True)
     try:
@@ -824,6 +813,7 @@ def main():
     print("\n" + "=" * 60)
     print("SCRAPING COMPLETE!")
     print("=" * 60)
+    print(get_http_client().format_stats())
     input("\nPress Enter to exit...")
 
 
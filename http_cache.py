@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+HTTP Cache
+==========
+On-disk response cache under the shared HttpClient (see http_client.py).
+
+- One file per URL, named by the SHA-256 of the URL, body stored gzip-compressed
+- ETag / Last-Modified kept for conditional GETs (304 -> cached body)
+- Freshness per URL pattern (deck lists never expire, tournament lists after 1h, ...)
+- Size cap with LRU eviction (file mtime = last use)
+
+Entry file layout: one JSON header line, then the gzip body.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+HTTP_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'http_cache')
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+EVICT_TO_FRACTION = 0.9  # evict down to 90% of the cap so we don't evict on every store
+
+NEVER_EXPIRES = None
+HOUR = 3600
+DAY = 24 * HOUR
+
+# (URL regex, TTL in seconds or NEVER_EXPIRES) - first match wins.
+# TTL 0 = always revalidate (conditional GET if the server sent validators).
+DEFAULT_TTL_RULES: List[Tuple[str, Optional[int]]] = [
+    (r'limitlesstcg\.com/decks/list/\d+', NEVER_EXPIRES),               # single deck list
+    (r'/tournament/[^/]+/player/[^/]+/decklist', NEVER_EXPIRES),        # play.limitless decklists
+    (r'labs\.limitlesstcg\.com/[^/]+/player/[^/]+/decklist', NEVER_EXPIRES),
+    (r'labs\.limitlesstcg\.com/[^/?]+/standings', 12 * HOUR),
+    (r'limitlesstcg\.com/tournaments/\d+', DAY),                        # tournament standings
+    (r'limitlesstcg\.com/tournaments', HOUR),                           # tournament lists
+    (r'play\.limitlesstcg\.com/decks', HOUR),                           # meta / matchup stats
+    (r'limitlesstcg\.com/cards/[^/?]+/[^/?]+', 6 * HOUR),               # card detail (prices)
+    (r'limitlesstcg\.com/cards', HOUR),                                 # card search / lists
+]
+DEFAULT_TTL = HOUR
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class CachedEntry:
+    """Cached response: body plus the headers needed for revalidation."""
+
+    __slots__ = ('url', 'final_url', 'headers', 'body', 'stored_at')
+
+    def __init__(self, url: str, final_url: str, headers: Dict[str, str], body: bytes, stored_at: float):
+        self.url = url
+        self.final_url = final_url
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for this entry (may be empty)."""
+        conditional = {}
+        if self.headers.get('etag'):
+            conditional['If-None-Match'] = self.headers['etag']
+        if self.headers.get('last-modified'):
+            conditional['If-Modified-Since'] = self.headers['last-modified']
+        return conditional
+
+
+class HttpCache:
+    """Thread-safe on-disk cache keyed by URL with per-pattern TTLs and LRU size cap."""
+
+    KEPT_HEADERS = ('etag', 'last-modified', 'content-type')
+
+    def __init__(self, directory: str = HTTP_CACHE_DIR, max_bytes: int = HTTP_CACHE_MAX_BYTES,
+                 ttl_rules: Optional[List[Tuple[str, Optional[int]]]] = None, default_ttl: Optional[int] = DEFAULT_TTL):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._rules: List[Tuple[Pattern, Optional[int]]] = [
+            (re.compile(pattern), ttl) for pattern, ttl in (DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules)
+        ]
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # computed lazily on first store
+
+    # ----------------------------------------------------------------- policy
+
+    def ttl_for(self, url: str) -> Optional[int]:
+        """TTL in seconds for url (None = never expires)."""
+        for pattern, ttl in self._rules:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def is_fresh(self, entry: CachedEntry) -> bool:
+        ttl = self.ttl_for(entry.url)
+        return ttl is NEVER_EXPIRES or time.time() - entry.stored_at < ttl
+
+    # ---------------------------------------------------------------- storage
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.gz")
+
+    def get(self, url: str) -> Optional[CachedEntry]:
+        """Load the entry for url (fresh or stale), or None."""
+        path = self._path(url)
+        try:
+            with open(path, 'rb') as f:
+                header = json.loads(f.readline())
+                body = gzip.decompress(f.read())
+            os.utime(path)  # LRU: mark as recently used
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError, zlib.error):
+            self._discard(path)  # truncated / corrupted entry - refetch instead of failing every time
+            return None
+        if header.get('url') != url:
+            return None  # hash collision (practically impossible) or foreign file
+        return CachedEntry(url, header.get('final_url', url), header.get('headers', {}), body,
+                           header.get('stored_at', 0))
+
+    def _discard(self, path: str):
+        """Delete a broken entry file."""
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+
+    def put(self, url: str, final_url: str, headers: Dict[str, str], body: bytes) -> CachedEntry:
+        """Store a 200 response for url."""
+        kept = {name: headers[name] for name in self.KEPT_HEADERS if name in headers}
+        entry = CachedEntry(url, final_url, kept, body, time.time())
+        self._write(entry)
+        return entry
+
+    def touch(self, entry: CachedEntry) -> CachedEntry:
+        """Mark a revalidated (304) entry fresh again."""
+        entry.stored_at = time.time()
+        self._write(entry)
+        return entry
+
+    def _write(self, entry: CachedEntry):
+        path = self._path(entry.url)
+        header = {'url': entry.url, 'final_url': entry.final_url, 'headers': entry.headers, 'stored_at': entry.stored_at}
+        data = json.dumps(header).encode('utf-8') + b'\n' + gzip.compress(entry.body, compresslevel=6)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                old_size = os.path.getsize(path)
+            except OSError:
+                old_size = 0
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"  Warning: Could not write HTTP cache entry: {e}")
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(data) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    # --------------------------------------------------------------- eviction
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """(last used, size, path) of every entry file."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for bucket in os.scandir(self.directory):
+            if not bucket.is_dir():
+                continue
+            for item in os.scandir(bucket.path):
+                if item.name.endswith('.gz'):
+                    stat = item.stat()
+                    entries.append((stat.st_mtime, stat.st_size, item.path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Delete least recently used entries until below EVICT_TO_FRACTION of the cap (lock held)."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TO_FRACTION
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._total_bytes = total
+
+    def clear(self):
+        """Delete all cached entries."""
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes = 0
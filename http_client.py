@@ -0,0 +1,641 @@
+#!/usr/bin/env python3
+"""
+HTTP Client - Shared Pooled Page Fetcher
+========================================
+One HTTP client for all scrapers instead of a urllib.urlopen per page.
+
+- Persistent per-host connections (http.client keep-alive, thread-safe pool)
+- Accept-Encoding: gzip with streaming decompression
+- iter_text() for readers that stop early (e.g. the first rows of a list page)
+- Configurable timeouts and retries (network errors and 5xx responses)
+- Per-host adaptive rate control (token bucket + max in flight, 429/Retry-After backoff)
+- Redirects and HTTP(S) proxies from the environment, like urllib
+- Optional on-disk cache with conditional revalidation (http_cache.py)
+- Record / replay of all responses for offline benchmarks (http_replay.py)
+- Byte / latency counters for the end-of-run summary
+
+Usage:
+    from http_client import fetch_page, get_http_client
+
+    html = fetch_page('https://limitlesstcg.com/tournaments', timeout=30)
+    print(get_http_client().format_stats())
+"""
+
+import codecs
+import contextlib
+import email.utils
+import http.client
+import random
+import threading
+import time
+import urllib.parse
+import urllib.request
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from http_cache import HttpCache
+
+# ============================================================================
+# SETTINGS
+# ============================================================================
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+DEFAULT_TIMEOUT = 30
+MAX_REDIRECTS = 5
+MAX_IDLE_PER_HOST = 8
+READ_CHUNK_SIZE = 64 * 1024
+
+# Adaptive per-host rate control (shared client): start rate, bounds in requests/second
+ADAPTIVE_START_RATE = 2.0
+ADAPTIVE_MIN_RATE = 0.2
+ADAPTIVE_MAX_RATE = 4.0
+ADAPTIVE_MAX_IN_FLIGHT = 4
+MAX_THROTTLE_RETRIES = 5  # 429 responses are retried this often regardless of `retries`
+
+# Errors that mean a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                            BrokenPipeError, ConnectionResetError, ConnectionAbortedError)
+
+
+class HttpError(Exception):
+    """Non-2xx final response (mirrors urllib's HTTPError for callers)."""
+
+    def __init__(self, url: str, status: int, reason: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(f"HTTP Error {status}: {reason}")
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers or {}
+
+
+class HttpResponse:
+    """Fully read response: final URL, status, lower-cased headers, decoded body bytes."""
+
+    __slots__ = ('url', 'status', 'headers', 'body')
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='ignore')
+
+# ============================================================================
+# PER-HOST RATE LIMIT
+# ============================================================================
+
+class HostRateLimiter:
+    """
+    Adaptive token bucket (requests/second, burst) plus a cap on requests in flight.
+    
+    Shared by all threads talking to one host, so N workers together never
+    exceed the current rate. Use as a context manager around one request.
+    
+    The rate adapts between min_rate and max_rate: healthy responses raise it
+    by a small step, 429/5xx/timeouts halve it and pause the host for
+    Retry-After or an exponential backoff with jitter. With min_rate ==
+    max_rate the rate is fixed and only the pauses apply.
+    """
+
+    def __init__(self, rate: float, max_in_flight: int = 4, burst: int = 1,
+                 min_rate: Optional[float] = None, max_rate: Optional[float] = None,
+                 increase_step: float = 0.1, backoff_base: float = 1.0, backoff_max: float = 60.0):
+        self.rate = rate
+        self.min_rate = rate if min_rate is None else min_rate
+        self.max_rate = rate if max_rate is None else max_rate
+        self.increase_step = increase_step
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.capacity = max(1, burst)
+        self.max_in_flight = max_in_flight
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._failures = 0  # consecutive throttle signals
+        self._lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+
+    def acquire(self):
+        """Block until a request slot and a token are available (and the host is not paused)."""
+        self._in_flight.acquire()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def release(self):
+        self._in_flight.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
+
+    def on_success(self):
+        """Healthy response: ramp the rate up (additive increase)."""
+        with self._lock:
+            self._failures = 0
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> float:
+        """429/5xx/timeout: halve the rate and pause the host. Returns the pause in seconds."""
+        with self._lock:
+            self._failures += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            delay = retry_after if retry_after is not None else backoff_delay(self.backoff_base, self._failures,
+                                                                             self.backoff_max)
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            return delay
+
+
+def backoff_delay(base: float, attempt: int, cap: float = 60.0) -> float:
+    """Exponential backoff with jitter: base * 2^(attempt-1), randomized to 50-100%, capped."""
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header (seconds or HTTP date) -> seconds, or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class HttpClient:
+    """Pooled keep-alive HTTP client shared by all scrapers of one process."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, retries: int = 0, retry_delay: float = 1.0,
+                 user_agent: str = DEFAULT_USER_AGENT, cache: Optional[HttpCache] = None, adaptive: bool = False):
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.user_agent = user_agent
+        self.cache = cache  # None = always hit the network
+        self.adaptive = adaptive  # create an adaptive HostRateLimiter for every host on first use
+        self.adaptive_rates = (ADAPTIVE_START_RATE, ADAPTIVE_MAX_RATE, ADAPTIVE_MAX_IN_FLIGHT)  # start, max, in flight
+        self.recorder = None  # http_replay.FixtureRecorder
+        self.replayer = None  # http_replay.FixtureReplayer (no network at all)
+        self._pool: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._limiters: Dict[str, HostRateLimiter] = {}  # hostname -> limiter
+        self._lock = threading.Lock()
+        self._proxies = urllib.request.getproxies()
+        self._stats = {
+            'requests': 0,
+            'errors': 0,
+            'connections_opened': 0,
+            'connections_reused': 0,
+            'bytes_received': 0,  # on the wire (compressed)
+            'bytes_decoded': 0,
+            'seconds': 0.0,
+            'cache_hits': 0,
+            'cache_revalidated': 0,
+        }
+
+    # ------------------------------------------------------------- rate limit
+
+    def set_rate_limit(self, host: str, rate: float, max_in_flight: int = 4, burst: int = 1,
+                       min_rate: float = ADAPTIVE_MIN_RATE) -> HostRateLimiter:
+        """
+        Limit all requests to host (e.g. 'limitlesstcg.com') to at most rate/second and
+        max_in_flight. The rate drops towards min_rate while the host throttles us.
+        """
+        limiter = HostRateLimiter(rate, max_in_flight=max_in_flight, burst=burst,
+                                  min_rate=min(min_rate, rate), max_rate=rate)
+        with self._lock:
+            self._limiters[host.lower()] = limiter
+        return limiter
+
+    def configure_adaptive(self, start_rate: float, max_rate: float, max_in_flight: int):
+        """Start rate, ceiling (requests/second) and max in flight of the adaptive limiters created from now on."""
+        self.adaptive_rates = (start_rate, max(start_rate, max_rate), max(1, max_in_flight))
+
+    def _limiter_for(self, host: str) -> Optional[HostRateLimiter]:
+        host = (host or '').lower()
+        limiter = self._limiters.get(host)
+        if limiter is None and self.adaptive and host:
+            with self._lock:
+                limiter = self._limiters.get(host)
+                if limiter is None:
+                    start_rate, max_rate, max_in_flight = self.adaptive_rates
+                    limiter = self._limiters[host] = HostRateLimiter(
+                        start_rate, max_in_flight=max_in_flight,
+                        min_rate=min(ADAPTIVE_MIN_RATE, start_rate), max_rate=max_rate)
+        return limiter
+
+    # ---------------------------------------------------------------- pooling
+
+    def _connection_target(self, scheme: str, host: str, port: int) -> Tuple[str, str, int, Optional[str]]:
+        """Return (scheme, host, port, tunnel_host) to connect to, honoring env proxies."""
+        proxy = self._proxies.get(scheme)
+        if proxy and not urllib.request.proxy_bypass(host):
+            parsed = urllib.parse.urlsplit(proxy if '://' in proxy else f"http://{proxy}")
+            proxy_port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+            return parsed.scheme, parsed.hostname, proxy_port, host if scheme == 'https' else None
+        return scheme, host, port, None
+
+    def _acquire(self, key: Tuple[str, str, int], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Get an idle pooled connection for key, or open a new one. Returns (conn, reused)."""
+        with self._lock:
+            idle = self._pool.get(key)
+            if idle:
+                self._stats['connections_reused'] += 1
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            self._stats['connections_opened'] += 1
+
+        scheme, host, port = key
+        connect_scheme, connect_host, connect_port, tunnel_host = self._connection_target(scheme, host, port)
+        if tunnel_host or connect_scheme == 'https':
+            conn = http.client.HTTPSConnection(connect_host, connect_port, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(connect_host, connect_port, timeout=timeout)
+        if tunnel_host:
+            conn.set_tunnel(tunnel_host, port)
+        return conn, False
+
+    def _release(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection):
+        """Return a connection to the pool (or close it if the pool is full)."""
+        with self._lock:
+            idle = self._pool.setdefault(key, [])
+            if len(idle) < MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            pools, self._pool = self._pool, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    # --------------------------------------------------------------- requests
+
+    def _request_target(self, url: str, headers: Dict[str, str]) -> Tuple[Tuple[str, str, int], str, Dict[str, str]]:
+        """(pool key, request path, request headers) of a GET for url."""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parts.hostname, port)
+
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        if scheme == 'http' and self._proxies.get('http') and not urllib.request.proxy_bypass(parts.hostname):
+            path = url  # plain HTTP proxies take the absolute URL
+
+        request_headers = {
+            'Host': parts.netloc,
+            'User-Agent': self.user_agent,
+            'Accept-Encoding': 'gzip',
+            'Connection': 'keep-alive',
+        }
+        request_headers.update(headers)
+        return key, path, request_headers
+
+    def _request_once(self, url: str, headers: Dict[str, str], timeout: float) -> HttpResponse:
+        """One GET on a pooled connection (retried once on a stale keep-alive connection)."""
+        key, path, request_headers = self._request_target(url, headers)
+        limiter = self._limiter_for(key[1])
+        while True:
+            conn, reused = self._acquire(key, timeout)
+            try:
+                with limiter or contextlib.nullcontext():
+                    conn.request('GET', path, headers=request_headers)
+                    response = conn.getresponse()
+                    body, wire_bytes = self._read_body(response)
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue  # server closed the idle connection - reconnect once per pooled conn
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+
+            with self._lock:
+                self._stats['bytes_received'] += wire_bytes
+                self._stats['bytes_decoded'] += len(body)
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+            return HttpResponse(url, response.status, response_headers, body)
+
+    @staticmethod
+    def _read_body(response: http.client.HTTPResponse) -> Tuple[bytes, int]:
+        """Read the whole body, gunzipping while streaming. Returns (body, wire bytes)."""
+        encoding = (response.getheader('Content-Encoding') or '').strip().lower()
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if encoding == 'gzip' else None
+        chunks = []
+        wire_bytes = 0
+        while True:
+            chunk = response.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            wire_bytes += len(chunk)
+            chunks.append(decompressor.decompress(chunk) if decompressor else chunk)
+        if decompressor:
+            chunks.append(decompressor.flush())
+        return b''.join(chunks), wire_bytes
+
+    def request(self, url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = None, retries: Optional[int] = None,
+                revalidate: bool = False) -> HttpResponse:
+        """
+        GET url following redirects; retries network errors and 5xx responses.
+        Served from the cache when fresh, revalidated with a conditional GET when stale
+        (always revalidated with revalidate=True, e.g. for prices that must be current).
+        Raises HttpError for a final non-2xx status, or the last network error.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        retries = self.retries if retries is None else retries
+        headers = headers or {}
+
+        cache = self.cache
+        entry = cache.get(url) if cache else None
+        if entry and not revalidate and cache.is_fresh(entry):
+            with self._lock:
+                self._stats['cache_hits'] += 1
+            return HttpResponse(entry.final_url, 200, dict(entry.headers), entry.body)
+        if entry:
+            headers = {**entry.validators(), **headers}
+
+        response = self._request_network(url, headers, timeout, retries, allow_not_modified=entry is not None)
+
+        if cache:
+            if response.status == 304:
+                entry = cache.touch(entry)
+                with self._lock:
+                    self._stats['cache_revalidated'] += 1
+                return HttpResponse(entry.final_url, 200, dict(entry.headers), entry.body)
+            if response.status == 200 and 'no-store' not in response.headers.get('cache-control', ''):
+                cache.put(url, response.url, response.headers, response.body)
+        return response
+
+    def _request_network(self, url: str, headers: Dict[str, str], timeout: float, retries: int,
+                         allow_not_modified: bool = False) -> HttpResponse:
+        """
+        The network part of request(): retry loop and status check (304 allowed for revalidation).
+        429/5xx/network errors slow the host down; retries wait for Retry-After or a jittered backoff.
+        """
+        limiter = self._limiter_for(urllib.parse.urlsplit(url).hostname)
+        failures = 0  # network errors / 5xx so far
+        throttled = 0  # 429 responses so far
+        while True:
+            start = time.perf_counter()
+            try:
+                response = self._follow_redirects(url, headers, timeout)
+                if response.status == 429 or response.status >= 500:
+                    raise HttpError(url, response.status, http.client.responses.get(response.status, ''),
+                                    response.headers)
+            except (HttpError, OSError, http.client.HTTPException, zlib.error) as e:
+                with self._lock:
+                    self._stats['seconds'] += time.perf_counter() - start
+                    self._stats['errors'] += 1
+                if isinstance(e, HttpError) and e.status < 500 and e.status != 429:
+                    raise
+                retry_after = parse_retry_after(e.headers.get('retry-after')) if isinstance(e, HttpError) else None
+                if isinstance(e, HttpError) and e.status == 429:
+                    throttled += 1
+                    give_up = throttled > MAX_THROTTLE_RETRIES
+                else:
+                    failures += 1
+                    give_up = failures > retries
+                if limiter:
+                    delay = limiter.on_throttle(retry_after)  # the next acquire() waits it out
+                else:
+                    delay = retry_after if retry_after is not None else backoff_delay(self.retry_delay, failures + throttled)
+                if give_up:
+                    raise
+                if not limiter:
+                    time.sleep(delay)
+                continue
+
+            if limiter:
+                limiter.on_success()
+            with self._lock:
+                self._stats['requests'] += 1
+                self._stats['seconds'] += time.perf_counter() - start
+            if not 200 <= response.status < 300 and not (allow_not_modified and response.status == 304):
+                raise HttpError(response.url, response.status, http.client.responses.get(response.status, ''),
+                                response.headers)
+            return response
+
+    def _follow_redirects(self, url: str, headers: Dict[str, str], timeout: float) -> HttpResponse:
+        for _ in range(MAX_REDIRECTS + 1):
+            if self.replayer:
+                response = self.replayer.respond(url)
+            else:
+                response = self._request_once(url, headers, timeout)
+                if self.recorder:
+                    self.recorder.record(url, response)
+            location = response.headers.get('location')
+            if response.status not in (301, 302, 303, 307, 308) or not location:
+                return response
+            url = urllib.parse.urljoin(url, location)
+        raise HttpError(url, response.status, 'Too many redirects', response.headers)
+
+    def iter_text(self, url: str, timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        GET url and yield the decoded body chunk by chunk, so the caller can stop reading
+        as soon as it has what it needs. No cache, redirects or retries; a connection that
+        was not read to the end is closed instead of going back to the pool.
+        Raises HttpError for a non-200 status. While recording, the whole body is still
+        downloaded (after the caller stopped) so the fixture archive gets the complete page.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if self.replayer:
+            replayed = self.replayer.respond(url)
+            if replayed.status != 200:
+                raise HttpError(url, replayed.status, http.client.responses.get(replayed.status, ''),
+                                replayed.headers)
+            yield replayed.text
+            return
+
+        key, path, request_headers = self._request_target(url, {})
+        limiter = self._limiter_for(key[1])
+        start = time.perf_counter()
+        while True:
+            conn, reused = self._acquire(key, timeout)
+            try:
+                with limiter or contextlib.nullcontext():
+                    conn.request('GET', path, headers=request_headers)
+                    response = conn.getresponse()
+                break
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+        response_headers = {name.lower(): value for name, value in response.getheaders()}
+        recorder = self.recorder
+        complete = False
+        wire_bytes = decoded_bytes = 0
+        decompressor = None
+        body_parts: List[bytes] = []  # only kept while recording
+        try:
+            if response.status != 200:
+                if recorder:
+                    body, wire_bytes = self._read_body(response)
+                    recorder.record(url, HttpResponse(url, response.status, response_headers, body))
+                raise HttpError(url, response.status, response.reason, response_headers)
+            encoding = (response.getheader('Content-Encoding') or '').strip().lower()
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if encoding == 'gzip' else None
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+            while True:
+                chunk = response.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                wire_bytes += len(chunk)
+                data = decompressor.decompress(chunk) if decompressor else chunk
+                decoded_bytes += len(data)
+                if recorder:
+                    body_parts.append(data)
+                yield decoder.decode(data)
+            if decompressor:
+                data = decompressor.flush()
+                if recorder:
+                    body_parts.append(data)
+                yield decoder.decode(data, final=True)
+            complete = True
+        finally:
+            if recorder and response.status == 200:
+                try:
+                    if not complete:
+                        # Caller stopped early - finish the download for the fixture
+                        while True:
+                            chunk = response.read(READ_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            wire_bytes += len(chunk)
+                            body_parts.append(decompressor.decompress(chunk) if decompressor else chunk)
+                            decoded_bytes += len(body_parts[-1])
+                        if decompressor:
+                            body_parts.append(decompressor.flush())
+                        complete = True
+                    recorder.record(url, HttpResponse(url, response.status, response_headers, b''.join(body_parts)))
+                except (OSError, http.client.HTTPException, zlib.error):
+                    pass  # not recorded - a replay falls back like a failed request
+            if complete and not response.will_close:
+                self._release(key, conn)
+            else:
+                conn.close()
+            if limiter and complete:
+                limiter.on_success()
+            with self._lock:
+                self._stats['requests'] += 1
+                self._stats['seconds'] += time.perf_counter() - start
+                self._stats['bytes_received'] += wire_bytes
+                self._stats['bytes_decoded'] += decoded_bytes
+
+    def fetch_text(self, url: str, timeout: Optional[float] = None, retries: Optional[int] = None,
+                   quiet: bool = False, revalidate: bool = False) -> str:
+        """Fetch a page as text; returns '' (and logs) on any error, like the old fetch_page()."""
+        try:
+            return self.request(url, timeout=timeout, retries=retries, revalidate=revalidate).text
+        except (HttpError, OSError, http.client.HTTPException, zlib.error, ValueError) as e:
+            if not quiet:
+                print(f"  Error fetching {url}: {e}")
+            return ""
+
+    # ------------------------------------------------------------------ stats
+
+    def stats(self) -> Dict[str, float]:
+        """Snapshot of the byte / latency counters."""
+        with self._lock:
+            return dict(self._stats)
+
+    def format_stats(self) -> str:
+        """One-line summary for the end of a scraper run."""
+        s = self.stats()
+        avg_ms = s['seconds'] / s['requests'] * 1000 if s['requests'] else 0.0
+        summary = (f"HTTP: {s['requests']} requests, {s['errors']} errors, "
+                   f"{s['connections_opened']} connections opened / {s['connections_reused']} reused, "
+                   f"{s['bytes_received'] / 1024:.0f} KiB received ({s['bytes_decoded'] / 1024:.0f} KiB decoded), "
+                   f"avg {avg_ms:.0f} ms")
+        if self.cache:
+            summary += f", cache: {s['cache_hits']} hits / {s['cache_revalidated']} revalidated (304)"
+        return summary
+
+# ============================================================================
+# SHARED INSTANCE
+# ============================================================================
+
+_shared_client: Optional[HttpClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get or create the process-wide HttpClient (on-disk cache in data/http_cache/,
+    adaptive rate control per host shared by every scraper module of the process).
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = HttpClient(cache=HttpCache(), adaptive=True)
+    return _shared_client
+
+
+def configure_rate_limit(settings: Dict, defaults: Optional[Dict] = None):
+    """
+    Per-host pacing of the shared client from a scraper's settings:
+    requests_per_second (start rate), max_requests_per_second (ceiling the adaptive
+    rate may climb to) and max_requests_in_flight. Call before the first request.
+    The limit applies per process - scrapers started in parallel (RUN_ALL_SCRAPERS.bat)
+    each have their own limiter, so their loads on a host add up.
+    """
+    def value(key, fallback):
+        if settings.get(key) is not None:
+            return settings[key]
+        return (defaults or {}).get(key, fallback)
+
+    start_rate = float(value('requests_per_second', ADAPTIVE_START_RATE))
+    max_rate = float(value('max_requests_per_second', ADAPTIVE_MAX_RATE))
+    max_in_flight = int(value('max_requests_in_flight', ADAPTIVE_MAX_IN_FLIGHT))
+    get_http_client().configure_adaptive(start_rate, max_rate, max_in_flight)
+    print(f"HTTP pacing: {start_rate:g} requests/s (max {max(start_rate, max_rate):g}), "
+          f"{max_in_flight} in flight per host", flush=True)
+
+
+def fetch_page(url: str, timeout: float = DEFAULT_TIMEOUT, retries: int = 0, revalidate: bool = False) -> str:
+    """Fetch a webpage and return its HTML content ('' on error); revalidate=True ignores the cache TTL."""
+    return get_http_client().fetch_text(url, timeout=timeout, retries=retries, revalidate=revalidate)
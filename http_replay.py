@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+HTTP Record / Replay
+====================
+Runs a scraper against a fixture archive instead of the live site.
+
+- record: every response the shared HttpClient receives is written to a zip archive
+- replay: responses are served from the archive without network access,
+  optionally with injected latency per request (to simulate the server)
+
+The on-disk cache is bypassed in both modes, so each run exercises the same
+code paths and replay runs are deterministic, comparable benchmarks.
+
+Usage:
+    python http_replay.py record fixtures/jh.zip tournament_scraper_JH.py
+    python http_replay.py replay fixtures/jh.zip tournament_scraper_JH.py --latency-ms 80
+"""
+
+import argparse
+import builtins
+import hashlib
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+import zipfile
+from typing import Dict, Optional
+
+from http_client import HttpClient, HttpResponse, get_http_client
+
+INDEX_NAME = 'index.json'
+
+# ============================================================================
+# FIXTURE ARCHIVE
+# ============================================================================
+
+class ReplayMiss(OSError):
+    """URL not in the fixture archive (handled like a network error by the client)."""
+
+
+class FixtureRecorder:
+    """Collects responses in memory; save() writes the zip archive."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._responses: Dict[str, HttpResponse] = {}
+        self._lock = threading.Lock()
+
+    def record(self, url: str, response: HttpResponse):
+        with self._lock:
+            self._responses[url] = response
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        index = {}
+        with self._lock, zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for url in sorted(self._responses):
+                response = self._responses[url]
+                body_name = f"bodies/{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
+                archive.writestr(body_name, response.body)
+                index[url] = {'status': response.status, 'headers': response.headers, 'body': body_name}
+            archive.writestr(INDEX_NAME, json.dumps(index, indent=1, sort_keys=True))
+        print(f"Recorded {len(index)} responses to {self.path}")
+
+
+class FixtureReplayer:
+    """Serves responses from a recorded archive, with optional latency per request."""
+
+    def __init__(self, path: str, latency: float = 0.0):
+        self.latency = latency
+        self.misses = 0
+        with zipfile.ZipFile(path) as archive:
+            index = json.loads(archive.read(INDEX_NAME))
+            self._responses = {
+                url: HttpResponse(url, entry['status'], entry['headers'], archive.read(entry['body']))
+                for url, entry in index.items()
+            }
+
+    def respond(self, url: str) -> HttpResponse:
+        if self.latency:
+            time.sleep(self.latency)
+        response = self._responses.get(url)
+        if response is None:
+            self.misses += 1
+            raise ReplayMiss(f"Not in fixture archive: {url}")
+        return response
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+def enable_recording(path: str, client: Optional[HttpClient] = None) -> FixtureRecorder:
+    """Record every response of client (default: the shared client) into path."""
+    client = client or get_http_client()
+    client.cache = None
+    client.recorder = FixtureRecorder(path)
+    return client.recorder
+
+
+def enable_replay(path: str, latency: float = 0.0, client: Optional[HttpClient] = None) -> FixtureReplayer:
+    """Serve all requests of client (default: the shared client) from the archive at path."""
+    client = client or get_http_client()
+    client.cache = None
+    client.replayer = FixtureReplayer(path, latency)
+    return client.replayer
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a scraper with recorded / replayed HTTP responses')
+    parser.add_argument('mode', choices=['record', 'replay'])
+    parser.add_argument('archive', help='Fixture archive (.zip)')
+    parser.add_argument('script', help='Scraper script to run, e.g. tournament_scraper_JH.py')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Injected latency per replayed request')
+    args = parser.parse_args()
+
+    if args.mode == 'record':
+        recorder = enable_recording(args.archive)
+    else:
+        replayer = enable_replay(args.archive, args.latency_ms / 1000)
+
+    start = time.perf_counter()
+    sys.argv = [args.script]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    builtins.input = lambda prompt='': print(prompt) or ''  # don't block on "Press Enter to exit..."
+    try:
+        runpy.run_path(args.script, run_name='__main__')
+    except SystemExit:
+        pass
+    finally:
+        elapsed = time.perf_counter() - start
+        if args.mode == 'record':
+            recorder.save()
+        print(f"\n[{args.mode}] {args.script}: {elapsed:.2f} s")
+        print(get_http_client().format_stats())
+        if args.mode == 'replay' and replayer.misses:
+            print(f"WARNING: {replayer.misses} requests were not in the archive")
+
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,8 @@ import time
 from datetime import datetime
 from typing import List, Dict, Set, Tuple
 
+from card_list_page import fetch_card_list_page, probe_latest_sets, read_card_list_page_selenium
+
 # Fix Windows console encoding for Unicode characters (✓, ×, •, etc.)
 if sys.platform == 'win32':
     if hasattr(sys.stdout, 'reconfigure'):
@@ -38,9 +40,14 @@ DEFAULT_SETTINGS = {
     "detail_page_wait_seconds": 2.0,
     "detail_request_delay_seconds": 0.5,
     "keep_latest_sets": 4,
+    "latest_sets_cache_minutes": 15,
     "skip_detail_scraping": False
 }
 
+# Japanese cards URL (lang=en.t for English-translated Japanese)
+JAPANESE_LIST_URL = "https://limitlesstcg.com/cards?q=lang%3Aen.t&display=list"
+LATEST_SETS_CACHE_FILE = 'japanese_latest_sets.json'
+
 # Load settings from file if it exists
 settings_path = 'japanese_cards_scraper_settings.json'
 if os.path.exists(settings_path):
@@ -61,8 +68,6 @@ try:
     from selenium import webdriver
     from selenium.webdriver.common.by import By
     from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -108,58 +113,78 @@ def load_existing_sets() -> Set[str]:
         return set()
 
 
-def quick_check_latest_sets() -> Set[str]:
-    """Quick check of first page to see what the latest sets are."""
-    print("[Japanese Scraper] Quick check: Loading first page to detect latest sets...")
-    
-    chrome_options = Options()
-    if SETTINGS['headless']:
-        chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    driver = webdriver.Chrome(options=chrome_options)
-    current_sets = []
-    
+def load_latest_sets_cache() -> Set[str]:
+    """Sets of the last quick check if it is younger than latest_sets_cache_minutes (else empty)."""
+    cache_path = os.path.join(get_data_dir(), LATEST_SETS_CACHE_FILE)
+    ttl_minutes = float(SETTINGS.get('latest_sets_cache_minutes') or 0)
+    if not ttl_minutes or not os.path.exists(cache_path):
+        return set()
     try:
-        base_url = "https://limitlesstcg.com/cards?q=lang%3Aen.t&display=list"
-        driver.get(base_url)
-        
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr"))
-        )
-        
-        rows = driver.find_elements(By.CSS_SELECTOR, "tbody tr")
-        seen_sets = []
-        
-        for row in rows:
-            try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 1:
-                    set_code = cells[0].get_attribute('textContent').strip()
-                    if set_code and set_code not in seen_sets:
-                        seen_sets.append(set_code)
-                        if len(seen_sets) >= SETTINGS['keep_latest_sets']:
-                            break
-            except:
-                continue
-        
-        current_sets = seen_sets[:SETTINGS['keep_latest_sets']]
-        
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        age_minutes = (datetime.now() - datetime.fromisoformat(cached['checked_at'])).total_seconds() / 60
+        if cached.get('keep_latest_sets') != SETTINGS['keep_latest_sets'] or not 0 <= age_minutes < ttl_minutes:
+            return set()
+        print(f"[Japanese Scraper] Quick check: Using cached result from {age_minutes:.0f} min ago")
+        return set(cached.get('sets') or [])
+    except Exception:
+        return set()
+
+
+def save_latest_sets_cache(sets: List[str]):
+    """Remember the quick check result for latest_sets_cache_minutes."""
+    data_dir = get_data_dir()
+    try:
+        os.makedirs(data_dir, exist_ok=True)
+        with open(os.path.join(data_dir, LATEST_SETS_CACHE_FILE), 'w', encoding='utf-8') as f:
+            json.dump({
+                'checked_at': datetime.now().isoformat(),
+                'keep_latest_sets': SETTINGS['keep_latest_sets'],
+                'sets': sets
+            }, f, indent=2)
     except Exception as e:
-        print(f"[Japanese Scraper] Error during quick check: {e}")
-    finally:
-        driver.quit()
-    
+        print(f"[Japanese Scraper] Could not save quick check cache: {e}")
+
+
+def quick_check_latest_sets() -> Set[str]:
+    """Quick check of first page to see what the latest sets are.
+
+    Reads only the first rows of the list page over HTTP (card_list_page.probe_latest_sets)
+    and caches the result briefly; Chrome is only started if that fails.
+    """
+    cached_sets = load_latest_sets_cache()
+    if cached_sets:
+        return cached_sets
+
+    keep = SETTINGS['keep_latest_sets']
+    print("[Japanese Scraper] Quick check: Reading first rows of the list page to detect latest sets...")
+    current_sets = probe_latest_sets(JAPANESE_LIST_URL, keep)
+
+    if not current_sets:
+        print("[Japanese Scraper] HTTP quick check failed, falling back to Selenium...")
+        driver = None
+        try:
+            driver = create_list_browser()
+            page = read_card_list_page_selenium(driver, JAPANESE_LIST_URL)
+            for set_code, *_ in (page.rows if page else []):
+                if set_code and set_code not in current_sets:
+                    current_sets.append(set_code)
+                    if len(current_sets) >= keep:
+                        break
+        except Exception as e:
+            print(f"[Japanese Scraper] Error during quick check: {e}")
+        finally:
+            if driver is not None:
+                driver.quit()
+
+    if current_sets:
+        save_latest_sets_cache(current_sets)
     return set(current_sets)
 
 
-def scrape_japanese_cards_list() -> List[Dict[str, str]]:
-    """Scrape Japanese card list and extract set information."""
+def create_list_browser():
+    """Chrome instance for the Selenium fallback of the list scraping."""
     print("[Japanese Scraper] Starting Selenium WebDriver...")
-    
     chrome_options = Options()
     if SETTINGS['headless']:
         chrome_options.add_argument("--headless")
@@ -167,13 +192,20 @@ def scrape_japanese_cards_list() -> List[Dict[str, str]]:
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-    
-    driver = webdriver.Chrome(options=chrome_options)
+    return webdriver.Chrome(options=chrome_options)
+
+
+def scrape_japanese_cards_list() -> List[Dict[str, str]]:
+    """Scrape Japanese card list and extract set information.
+
+    List pages are fetched over HTTP and parsed (card_list_page); Selenium is
+    only started if a page can't be read that way.
+    """
+    driver = None
     all_cards_data = []
     
     try:
-        # Japanese cards URL (lang=en.t for English-translated Japanese)
-        base_url = "https://limitlesstcg.com/cards?q=lang%3Aen.t&display=list"
+        base_url = JAPANESE_LIST_URL
         print(f"[Japanese Scraper] Loading Japanese cards: {base_url}")
 
         seen_keys = set()
@@ -189,65 +221,44 @@ def scrape_japanese_cards_list() -> List[Dict[str, str]]:
                 current_url = f"{base_url}&page={page_index}"
 
             print(f"[Japanese Scraper] Loading page {page_index}: {current_url}")
-            driver.get(current_url)
-
-            # Wait for table rows to appear
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr"))
-                )
-            except Exception:
+            page = fetch_card_list_page(current_url)
+            if page is None:
+                print("[Japanese Scraper] HTTP list page unavailable, falling back to Selenium...")
+                if driver is None:
+                    driver = create_list_browser()
+                page = read_card_list_page_selenium(driver, current_url)
+
+            if page is None:
                 print("[Japanese Scraper] ERROR: Table rows not found on this page.")
                 break
 
-            # Extract data from table rows
-            rows = driver.find_elements(By.CSS_SELECTOR, "tbody tr")
-            print(f"[Japanese Scraper] Found {len(rows)} rows on page {page_index}")
+            print(f"[Japanese Scraper] Found {page.row_count} rows on page {page_index}")
             
             # If no rows or same as before, we've reached the end
-            if len(rows) == 0:
+            if page.row_count == 0:
                 print("[Japanese Scraper] No cards found on this page - stopping.")
                 break
 
             cards_added_this_page = 0
-            for idx, row in enumerate(rows):
-                try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-
-                    if len(cells) >= 4:
-                        # Extract data - column order: Set, No, Name, Type
-                        set_code = cells[0].get_attribute('textContent').strip()
-                        set_number = cells[1].get_attribute('textContent').strip()
-                        card_name = cells[2].get_attribute('textContent').strip()
-                        card_type = cells[3].get_attribute('textContent').strip()
-
-                        # Try to get card link for detail page
-                        try:
-                            link_elem = cells[2].find_element(By.TAG_NAME, "a")
-                            card_url = link_elem.get_attribute('href')
-                        except:
-                            card_url = None
-
-                        if card_name:
-                            key = f"{card_name}::{set_code}::{set_number}"
-                            if key in seen_keys:
-                                continue
-                            seen_keys.add(key)
-                            all_cards_data.append({
-                                'name': card_name,
-                                'set': set_code,
-                                'number': set_number,
-                                'type': card_type,
-                                'card_url': card_url,
-                                'image_url': '',
-                                'rarity': ''
-                            })
-                            cards_added_this_page += 1
-
-                            if (len(all_cards_data)) % 500 == 0:
-                                print(f"[Japanese Scraper]   Processed {len(all_cards_data)} cards so far...")
-                except Exception:
-                    continue
+            for set_code, set_number, card_name, card_type, card_url in page.rows:
+                if card_name:
+                    key = f"{card_name}::{set_code}::{set_number}"
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    all_cards_data.append({
+                        'name': card_name,
+                        'set': set_code,
+                        'number': set_number,
+                        'type': card_type,
+                        'card_url': card_url,
+                        'image_url': '',
+                        'rarity': ''
+                    })
+                    cards_added_this_page += 1
+
+                    if (len(all_cards_data)) % 500 == 0:
+                        print(f"[Japanese Scraper]   Processed {len(all_cards_data)} cards so far...")
             
             print(f"[Japanese Scraper] Added {cards_added_this_page} new cards from page {page_index}")
             
@@ -265,7 +276,8 @@ def scrape_japanese_cards_list() -> List[Dict[str, str]]:
         import traceback
         traceback.print_exc()
     finally:
-        driver.quit()
+        if driver is not None:
+            driver.quit()
     
     print(f"\n[Japanese Scraper] ✓ Extracted {len(all_cards_data)} Japanese cards from list")
     return all_cards_data
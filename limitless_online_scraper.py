@@ -6,7 +6,6 @@ Scrapes deck statistics from play.limitlesstcg.com/decks
 No external dependencies required - uses only Python standard library
 """
 
-import urllib.request
 import urllib.parse
 import csv
 import re
@@ -18,6 +17,8 @@ from datetime import datetime
 from html.parser import HTMLParser
 from typing import List, Dict, Optional, Tuple, Any
 
+from http_client import get_http_client
+
 # Fix Windows console encoding for Unicode characters (✓, ×, •, etc.)
 if sys.platform == 'win32':
     if hasattr(sys.stdout, 'reconfigure'):
@@ -115,17 +116,8 @@ def load_settings() -> Dict[str, Any]:
     return settings
 
 def fetch_page(url: str) -> str:
-    """Fetch a webpage and return its HTML content."""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=15) as response:
-            return response.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"Error fetching {url}: {e}")
-        return ""
+    """Fetch a webpage and return its HTML content (shared pooled HTTP client)."""
+    return get_http_client().fetch_text(url, timeout=15)
 
 class DeckStatsParser(HTMLParser):
     """Parser to extract deck statistics from the decks page."""
@@ -1694,6 +1686,7 @@ def main():
     
     print("\n" + "=" * 60)
     print("Scraping finished!")
+    print(get_http_client().format_stats())
 
 if __name__ == "__main__":
     try:
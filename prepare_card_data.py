@@ -16,6 +16,8 @@ import os
 from pathlib import Path
 from typing import List, Dict
 
+from price_store import read_price_rows
+
 def load_csv(filepath: str) -> List[Dict]:
     """Load CSV file."""
     cards = []
@@ -40,7 +42,7 @@ def create_merged_database():
     # Load databases
     english_cards = load_csv('data/all_cards_database.csv')
     japanese_cards = load_csv('data/japanese_cards_database.csv')
-    price_data = load_csv('data/price_data.csv')
+    price_data = read_price_rows('data/price_data.csv')  # includes updates of a still running price scrape
     
     print(f"[Updater] Loaded {len(english_cards)} English cards")
     print(f"[Updater] Loaded {len(japanese_cards)} Japanese cards")
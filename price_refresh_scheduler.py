@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Price Refresh Scheduler
+=======================
+Ranks cards for card_price_scraper so a run refreshes the prices people
+actually look at instead of sweeping all ~20k cards.
+
+Score per card (0..1 each, weighted):
+- staleness   age of last_checked, the last refresh attempt with or without a price
+              (falls back to last_updated; cards without a price entry count as maximally stale)
+- relevance   decks the card appears in, from current_meta_card_data.csv,
+              tournament_cards_data_cards.csv and city_league_analysis.csv
+- volatility  relative change between the previous and the current price
+
+select_refresh_batch() returns the top-K cards in priority order; the
+scraper then works through them until its time or request budget is used up.
+"""
+
+import csv
+import math
+import os
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Deck-usage CSVs (semicolon separated, columns set_code / set_number / deck_count)
+RELEVANCE_FILES = [
+    'current_meta_card_data.csv',
+    'tournament_cards_data_cards.csv',
+    'city_league_analysis.csv',
+]
+
+DEFAULT_WEIGHTS = {'staleness': 0.5, 'relevance': 0.35, 'volatility': 0.15}
+MAX_STALENESS_DAYS = 30.0  # older prices all count as fully stale
+
+PRICE_NUMBER_PATTERN = re.compile(r'\d[\d.,]*')
+
+# ============================================================================
+# INPUTS
+# ============================================================================
+
+def parse_eur_price(text: str) -> Optional[float]:
+    """'0.12€', '12,99 €', '1.234,56€' -> float (None if no number)."""
+    match = PRICE_NUMBER_PATTERN.search(text or '')
+    if not match:
+        return None
+    number = match.group(0).rstrip('.,')
+    if ',' in number and '.' in number:
+        # The later separator is the decimal one
+        if number.rfind(',') > number.rfind('.'):
+            number = number.replace('.', '').replace(',', '.')
+        else:
+            number = number.replace(',', '')
+    else:
+        number = number.replace(',', '.')
+    try:
+        return float(number)
+    except ValueError:
+        return None
+
+
+def load_card_relevance(data_dir: str, files: Optional[List[str]] = None) -> Dict[str, float]:
+    """SET_NUM -> number of decks the card appears in (summed over all deck-usage CSVs)."""
+    relevance: Dict[str, float] = {}
+    for filename in (RELEVANCE_FILES if files is None else files):
+        path = os.path.join(data_dir, filename)
+        if not os.path.isfile(path):
+            continue
+        try:
+            with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+                for row in csv.DictReader(f, delimiter=';'):
+                    set_code = (row.get('set_code') or '').strip()
+                    set_number = (row.get('set_number') or '').strip()
+                    if not set_code or not set_number:
+                        continue
+                    try:
+                        decks = float(row.get('deck_count') or 1)
+                    except ValueError:
+                        decks = 1.0
+                    key = f"{set_code}_{set_number}"
+                    relevance[key] = relevance.get(key, 0.0) + decks
+        except Exception as e:
+            print(f"[Price Scheduler] Warning: Could not read {filename}: {e}")
+    return relevance
+
+# ============================================================================
+# SCORING
+# ============================================================================
+
+def staleness_days(last_updated: str, now: datetime) -> float:
+    """Age of an ISO timestamp in days (MAX_STALENESS_DAYS if missing/unparseable)."""
+    try:
+        updated = datetime.fromisoformat(last_updated)
+    except (TypeError, ValueError):
+        return MAX_STALENESS_DAYS
+    return max(0.0, (now - updated).total_seconds() / 86400)
+
+
+def checked_at(price: Dict[str, str]) -> str:
+    """Time of the last refresh attempt (last_updated for rows written before last_checked existed)."""
+    return price.get('last_checked') or price.get('last_updated', '')
+
+
+def volatility(price: Dict[str, str]) -> float:
+    """Relative change previous -> current price, capped at 1.0 (0.0 without history)."""
+    current = parse_eur_price(price.get('eur_price', ''))
+    previous = parse_eur_price(price.get('previous_eur_price', ''))
+    if not current or not previous:
+        return 0.0
+    return min(1.0, abs(current - previous) / previous)
+
+
+def score_card(key: str, existing_prices: Dict[str, Dict[str, str]], relevance: Dict[str, float],
+               max_relevance: float, now: datetime) -> Tuple[float, float, float]:
+    """(staleness, relevance, volatility) of one card, each 0..1."""
+    price = existing_prices.get(key)
+    if price is None:
+        stale = 1.0  # never scraped
+    else:
+        stale = min(staleness_days(checked_at(price), now), MAX_STALENESS_DAYS) / MAX_STALENESS_DAYS
+    decks = relevance.get(key, 0.0)
+    relevant = math.log1p(decks) / math.log1p(max_relevance) if max_relevance > 0 else 0.0
+    volatile = volatility(price) if price else 0.0
+    return stale, relevant, volatile
+
+
+def select_refresh_batch(cards: List[Dict[str, str]], existing_prices: Dict[str, Dict[str, str]],
+                         data_dir: str, top_k: int, min_age_hours: float = 0.0,
+                         weights: Optional[Dict[str, float]] = None,
+                         now: Optional[datetime] = None) -> List[Dict[str, str]]:
+    """
+    Top-K cards by weighted score, highest priority first.
+    Cards checked less than min_age_hours ago (even without finding a price) are never selected.
+    """
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    now = now or datetime.now()
+    relevance = load_card_relevance(data_dir)
+    max_relevance = max(relevance.values(), default=0.0)
+
+    ranked = []
+    for index, card in enumerate(cards):
+        key = f"{card['set']}_{card['number']}"
+        price = existing_prices.get(key)
+        if price is not None and min_age_hours and \
+                staleness_days(checked_at(price), now) * 24 < min_age_hours:
+            continue
+        stale, relevant, volatile = score_card(key, existing_prices, relevance, max_relevance, now)
+        score = (weights['staleness'] * stale + weights['relevance'] * relevant
+                 + weights['volatility'] * volatile)
+        ranked.append((-score, index, card))  # index keeps the order stable for equal scores
+
+    ranked.sort(key=lambda item: (item[0], item[1]))
+    selected = [card for _, _, card in ranked[:top_k]] if top_k else [card for _, _, card in ranked]
+
+    relevant_selected = sum(1 for card in selected if f"{card['set']}_{card['number']}" in relevance)
+    print(f"[Price Scheduler] {len(ranked)} candidates, {len(relevance)} cards used in decks")
+    print(f"[Price Scheduler] Selected {len(selected)} cards ({relevant_selected} used in decks)")
+    return selected
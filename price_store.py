@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Price Store
+===========
+Keyed store for price_data.csv used by card_price_scraper.
+
+The CSV is read once per run (plus the update log of an unfinished run).
+Progress saves only append the rows that actually changed to an update log
+(price_data_updates.jsonl), so they cost O(batch) instead of re-reading,
+merging and rewriting the whole CSV. export_csv() writes the sorted CSV
+(atomic rename) and clears the log - at the end of a run, or whenever a
+reader needs the file.
+
+Merge rule (unchanged from the old save_prices): a non-empty price is never
+overwritten by an empty one; the replaced price is kept as previous_eur_price.
+last_checked is the time of the last attempt, with or without a price - the
+refresh scheduler ranks by it, so cards without a price don't stay stale forever.
+"""
+
+import csv
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+PRICE_FIELDS = ['name', 'set', 'number', 'eur_price', 'previous_eur_price', 'cardmarket_url', 'last_updated',
+                'last_checked']
+UPDATE_LOG_SUFFIX = '_updates.jsonl'
+
+
+def price_key(row: Dict[str, str]) -> str:
+    return f"{row.get('set', '')}_{row.get('number', '')}"
+
+
+class PriceStore:
+    """price_data.csv as a dict (SET_NUM -> row) with an append-only update log."""
+
+    def __init__(self, csv_path: str):
+        self.csv_path = csv_path
+        self.log_path = os.path.splitext(csv_path)[0] + UPDATE_LOG_SUFFIX
+        self.rows: Dict[str, Dict[str, str]] = {}
+        self.pending = 0  # logged rows not yet exported to the CSV
+        self._log = None
+        self._lock = threading.Lock()
+        self._load()
+
+    # ---------------------------------------------------------------- loading
+
+    def _load(self):
+        if os.path.isfile(self.csv_path):
+            with open(self.csv_path, 'r', encoding='utf-8', newline='') as f:
+                for row in csv.DictReader(f):
+                    if not row:
+                        continue
+                    self.rows[price_key(row)] = {field: (row.get(field) or '').strip() for field in PRICE_FIELDS}
+        if os.path.isfile(self.log_path) and os.path.isfile(self.csv_path) and \
+                os.path.getmtime(self.log_path) < os.path.getmtime(self.csv_path):
+            # Older than the CSV: left over from before a reset / an export by another tool
+            os.remove(self.log_path)
+        if os.path.isfile(self.log_path):
+            # Updates of a run that ended before its export
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        row = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line
+                    self.rows[price_key(row)] = row
+                    self.pending += 1
+
+    # --------------------------------------------------------------- updating
+
+    def merge(self, price: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """Row that price would produce (None = no change)."""
+        key = price_key(price)
+        old = self.rows.get(key)
+        new_price = (price.get('eur_price') or '').strip()
+        checked = (price.get('last_checked') or '').strip()
+
+        if new_price:
+            # New valid price found - update everything, keep the replaced price for volatility
+            old_price = (old or {}).get('eur_price', '')
+            if old_price and old_price != new_price:
+                previous = old_price
+            else:
+                previous = (old or {}).get('previous_eur_price', '') or price.get('previous_eur_price', '')
+            row = {field: price.get(field, '') or '' for field in PRICE_FIELDS}
+            row['previous_eur_price'] = previous
+            row['last_checked'] = checked or (old or {}).get('last_checked', '')
+        elif old is None:
+            # New card but no price yet - add entry with empty price
+            row = {field: price.get(field, '') or '' for field in PRICE_FIELDS}
+        elif checked and checked != old.get('last_checked'):
+            # Attempt without a price - keep the existing price, remember the check
+            row = {**old, 'last_checked': checked}
+        else:
+            return None  # Keep existing price (don't overwrite with empty)
+
+        return None if row == old else row
+
+    def update(self, prices: List[Dict[str, str]]) -> int:
+        """Apply prices; only changed rows are appended to the update log. Returns the number of changed rows."""
+        with self._lock:
+            lines = []
+            for price in prices:
+                row = self.merge(price)
+                if row is not None:
+                    self.rows[price_key(row)] = row
+                    lines.append(json.dumps(row, ensure_ascii=False))
+            if lines:
+                if self._log is None:
+                    self._log = open(self.log_path, 'a', encoding='utf-8')
+                self._log.write('\n'.join(lines) + '\n')
+                self._log.flush()
+                self.pending += len(lines)
+            return len(lines)
+
+    # -------------------------------------------------------------- exporting
+
+    def export_csv(self, force: bool = False) -> bool:
+        """Write the sorted CSV (temp file + rename) and clear the update log. Skipped if nothing changed."""
+        with self._lock:
+            if not self.pending and not force and os.path.isfile(self.csv_path):
+                return False
+            os.makedirs(os.path.dirname(self.csv_path) or '.', exist_ok=True)
+            tmp_path = f"{self.csv_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=PRICE_FIELDS, extrasaction='ignore')
+                writer.writeheader()
+                for key in sorted(self.rows):
+                    writer.writerow(self.rows[key])
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.csv_path)
+
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            try:
+                os.remove(self.log_path)
+            except FileNotFoundError:
+                pass
+            self.pending = 0
+            return True
+
+    def close(self):
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+
+
+def read_price_rows(csv_path: str) -> List[Dict[str, str]]:
+    """All price rows including updates not yet exported (for readers like prepare_card_data)."""
+    store = PriceStore(csv_path)
+    return [store.rows[key] for key in sorted(store.rows)]
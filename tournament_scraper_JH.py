@@ -5,7 +5,6 @@ Scrapes card usage data from limitlesstcg.com/tournaments
 No external dependencies required - uses only Python standard library
 """
 
-import urllib.request
 import urllib.parse
 import csv
 import re
@@ -15,6 +14,7 @@ import os
 import sys
 import html
 import math
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
 from typing import List, Dict, Optional
 
@@ -33,7 +33,8 @@ if sys.platform == 'win32':
 
 # Import the reliable card type lookup module
 from card_type_lookup import is_trainer_or_energy, is_valid_card
-from card_scraper_shared import CardDatabaseLookup
+from card_scraper_shared import CardDatabaseLookup, get_card_database
+from http_client import get_http_client
 
 # ============================================================================
 # TOURNAMENT TRACKING (Incremental Scraping)
@@ -85,6 +86,9 @@ DEFAULT_SETTINGS = {
     "format_filter": ["Standard"],
     "tournament_types": ["Regional", "Special Event", "LAIC", "EUIC", "NAIC", "Worlds", "International", "Championship"],
     "append_mode": True,
+    "online_card_lookup": False,
+    "deck_fetch_workers": 4,
+    "requests_per_second": 3.0,
     "_comment": "Scrapes individual deck lists from each tournament. Nur Standard-Format Turniere (Regional, Special Event, LAIC, EUIC, NAIC, Worlds) werden automatisch gescraped. append_mode=True keeps old tournament data and only adds new tournaments."
 }
 
@@ -146,19 +150,11 @@ def load_settings() -> Dict:
 
 
 def fetch_page(url: str) -> str:
-    """Fetch a webpage and return its HTML content."""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=30) as response:
-            html = response.read().decode('utf-8', errors='ignore')
-            print(f"  Fetched {len(html)} bytes")
-            return html
-    except Exception as e:
-        print(f"Error fetching {url}: {e}")
-        return ""
+    """Fetch a webpage and return its HTML content (shared pooled HTTP client)."""
+    html = get_http_client().fetch_text(url, timeout=30)
+    if html:
+        print(f"  Fetched {len(html)} bytes")
+    return html
 
 def get_tournament_links(base_url: str, max_tournaments: int, start_tournament_id: int = None, scraped_ids: set = None) -> List[Dict]:
     """Get tournament links from the main tournaments page with pagination support."""
@@ -313,16 +309,60 @@ def get_format_code(format_name: str) -> str:
     # Return original if no match found
     return format_name
 
-def get_tournament_info(tournament_url: str) -> Dict:
-    """Get tournament name and details from the tournament page."""
-    html = fetch_page(tournament_url)
+# ============================================================================
+# TOURNAMENT PAGE
+# ============================================================================
+
+TOURNAMENT_TITLE_PATTERN = re.compile(r'<title>([^<]+)</title>', re.IGNORECASE)
+TOURNAMENT_DATE_PATTERN = re.compile(r'(\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4})')
+TOURNAMENT_PLAYERS_PATTERN = re.compile(r'(\d+)\s*Players', re.IGNORECASE)
+FORMAT_CODE_LINK_PATTERN = re.compile(r'<a[^>]*href=["\'][^"\']*[?&]format=([^"\'&]+)["\'][^>]*>', re.IGNORECASE)
+FORMAT_NAME_LINK_PATTERN = re.compile(r'(\d+)\s*Players\s*[^<]*?<a[^>]*>([^<]+)</a>', re.IGNORECASE | re.DOTALL)
+FORMAT_NAME_TEXT_PATTERN = re.compile(r'(\d+)\s*Players\s*•\s*([^<\n•]+?)(?:•|<|Results|$)', re.IGNORECASE)
+JP_KR_FLAG_PATTERN = re.compile(r'\bKR\b|\bJP\b')
+FLAG_IMAGE_PATTERN = re.compile(r'<img[^>]*flags/[A-Z]{2}\.png')
+DECK_LIST_ID_PATTERN = re.compile(r'/decks/list/(\d+)')
+
+
+class TournamentDocument:
+    """
+    A tournament page, fetched once with show=2000 (all standings on one page).
+    Tournament info, format / JP detection and deck list links all come from it.
+    """
+
+    def __init__(self, url: str, html: str):
+        self.url = url
+        self.html = html
+        self._info: Optional[Dict] = None
+        self._deck_list_links: Optional[List[Dict]] = None
+
+    @classmethod
+    def fetch(cls, tournament_url: str) -> 'TournamentDocument':
+        separator = '&' if '?' in tournament_url else '?'
+        return cls(tournament_url, fetch_page(f"{tournament_url}{separator}show=2000"))
+
+    @property
+    def info(self) -> Dict:
+        if self._info is None:
+            self._info = parse_tournament_info(self.html)
+        return self._info
+
+    @property
+    def deck_list_links(self) -> List[Dict]:
+        if self._deck_list_links is None:
+            self._deck_list_links = parse_deck_list_links(self.html)
+        return self._deck_list_links
+
+
+def parse_tournament_info(html: str) -> Dict:
+    """Get tournament name and details from the tournament page HTML."""
     if not html:
         return {'name': 'Unknown Tournament', 'date': '', 'players': '', 'format': ''}
     
     info = {'name': 'Unknown Tournament', 'date': '', 'players': '', 'format': ''}
     
     # Try to extract tournament name from title or heading
-    title_match = re.search(r'<title>([^<]+)</title>', html, re.IGNORECASE)
+    title_match = TOURNAMENT_TITLE_PATTERN.search(html)
     if title_match:
         title = title_match.group(1).strip()
         # Clean up title (remove " | Limitless" suffix if present)
@@ -330,12 +370,12 @@ def get_tournament_info(tournament_url: str) -> Dict:
         info['name'] = title
     
     # Try to extract date
-    date_match = re.search(r'(\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4})', html)
+    date_match = TOURNAMENT_DATE_PATTERN.search(html)
     if date_match:
         info['date'] = date_match.group(1)
     
     # Try to extract player count
-    players_match = re.search(r'(\d+)\s*Players', html, re.IGNORECASE)
+    players_match = TOURNAMENT_PLAYERS_PATTERN.search(html)
     if players_match:
         info['players'] = players_match.group(1)
     
@@ -347,7 +387,7 @@ def get_tournament_info(tournament_url: str) -> Dict:
     # Primary: Extract format code directly from the link href attribute
     # Example: <a href="/decks/?time=all&format=BRS-SFA">Brilliant Stars - Shrouded Fable</a>
     # This is the most reliable method as the code is already provided
-    format_code_match = re.search(r'<a[^>]*href=["\'][^"\']*[?&]format=([^"\'&]+)["\'][^>]*>', html, re.IGNORECASE)
+    format_code_match = FORMAT_CODE_LINK_PATTERN.search(html)
     if format_code_match:
         format_code = format_code_match.group(1).strip()
         info['format'] = format_code
@@ -355,7 +395,7 @@ def get_tournament_info(tournament_url: str) -> Dict:
     # Fallback: Try to extract format name from <a> tag text after "Players"
     # Only used if format code not found in href
     if not format_code:
-        format_match = re.search(r'(\d+)\s*Players\s*[^<]*?<a[^>]*>([^<]+)</a>', html, re.IGNORECASE | re.DOTALL)
+        format_match = FORMAT_NAME_LINK_PATTERN.search(html)
         if format_match:
             candidate = format_match.group(2).strip()
             # Decode HTML entities
@@ -370,7 +410,7 @@ def get_tournament_info(tournament_url: str) -> Dict:
     
     # Fallback 2: Try without <a> tag (for tournaments that don't use links)
     if not format_code and not format_name:
-        format_match2 = re.search(r'(\d+)\s*Players\s*•\s*([^<\n•]+?)(?:•|<|Results|$)', html, re.IGNORECASE)
+        format_match2 = FORMAT_NAME_TEXT_PATTERN.search(html)
         if format_match2:
             candidate = format_match2.group(2).strip()
             # Remove any trailing text like "RK9", "Results", links, etc.
@@ -401,8 +441,8 @@ def get_tournament_info(tournament_url: str) -> Dict:
         is_jp_tournament = True
     
     # Also check if tournament has mostly JP/KR players (Korean League, Japanese domestic events)
-    jp_kr_count = len(re.findall(r'\bKR\b|\bJP\b', html))
-    total_flags = len(re.findall(r'<img[^>]*flags/[A-Z]{2}\.png', html))
+    jp_kr_count = sum(1 for _ in JP_KR_FLAG_PATTERN.finditer(html))
+    total_flags = sum(1 for _ in FLAG_IMAGE_PATTERN.finditer(html))
     
     if total_flags > 20 and jp_kr_count > total_flags * 0.7:  # If >70% are JP/KR
         is_jp_tournament = True
@@ -481,24 +521,17 @@ def get_tournament_info(tournament_url: str) -> Dict:
     
     return info
 
-def get_deck_list_links(tournament_url: str) -> List[Dict]:
+def parse_deck_list_links(html: str) -> List[Dict]:
     """
-    Extract all individual deck list URLs from a tournament page.
+    Extract all individual deck list URLs from a tournament page (fetched with show=2000).
     Returns list of dicts: [{'url': 'https://...', 'player_count': 2}, ...]
     where player_count = how many players used this exact deck.
     """
-    # Try with high show parameter to get all decks on one page
-    if '?' in tournament_url:
-        fetch_url = f"{tournament_url}&show=2000"
-    else:
-        fetch_url = f"{tournament_url}?show=2000"
-    
-    html = fetch_page(fetch_url)
     if not html:
         return []
     
     # Find all deck list links - pattern: /decks/list/\d+
-    all_matches = re.findall(r'/decks/list/(\d+)', html)
+    all_matches = DECK_LIST_ID_PATTERN.findall(html)
     
     print(f"  [DEBUG] Found {len(all_matches)} total /decks/list/ mentions")
     
@@ -563,17 +596,169 @@ def get_deck_options(cards_url: str) -> List[Dict]:
     
     return deck_options
 
+# Decklist regex patterns (shared by extract_single_deck and extract_cards_from_page)
+DECKLIST_HEADING_PATTERN = re.compile(r'<div[^>]*class="decklist-column-heading"[^>]*>\s*([^<]+?)\s*</div>', re.IGNORECASE)
+DECKLIST_CARD_PATTERN = re.compile(r'<div[^>]*class="decklist-card"[^>]*data-set="([A-Z0-9]*)"[^>]*data-number="(\d*)"[^>]*>.*?<span class="card-count">([0-9.]+)</span>\s*<span class="card-name">([^<]+)</span>', re.IGNORECASE | re.DOTALL)
+
 # Old is_trainer_or_energy() function removed - now using card_type_lookup.py
 # which provides 100% accurate card type detection based on Alle Karten.txt
 
-# Global cache for card lookups
+# Card search result patterns on limitlesstcg.com/cards
+CARD_SEARCH_LIST_PATTERN = re.compile(
+    r'<div[^>]*class="[^"]*card-list-card[^"]*"[^>]*data-set="([A-Z0-9]+)"[^>]*data-number="(\d+)"[^>]*>',
+    re.IGNORECASE
+)
+CARD_SEARCH_SET_PATTERN = re.compile(
+    r'<span[^>]*class="[^"]*set[^"]*"[^>]*>\s*([A-Z0-9]+)\s+(\d+)\s*</span>',
+    re.IGNORECASE
+)
+
+# Persistent lookup cache: names resolved online are never searched again,
+# names NOT found are searched again after CARD_LOOKUP_NEGATIVE_TTL seconds
+CARD_LOOKUP_CACHE_FILENAME = 'card_lookup_cache.json'
+CARD_LOOKUP_NEGATIVE_TTL = 7 * 24 * 3600
+
+# Global cache for card lookups (card name -> result or None)
 _card_lookup_cache = {}
+_card_lookup_disk_cache: Optional[Dict[str, Dict]] = None  # loaded on first use
+
+
+def get_card_lookup_cache_file() -> str:
+    """Get path to the persistent card lookup cache."""
+    return os.path.join(get_data_dir(), CARD_LOOKUP_CACHE_FILENAME)
+
+
+def load_card_lookup_cache() -> Dict[str, Dict]:
+    """Load the persistent card lookup cache ({name: {'result': ..., 'checked': epoch}})."""
+    global _card_lookup_disk_cache
+    if _card_lookup_disk_cache is None:
+        _card_lookup_disk_cache = {}
+        cache_file = get_card_lookup_cache_file()
+        if os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    _card_lookup_disk_cache = json.load(f).get('entries', {})
+            except Exception as e:
+                print(f"Warning: Could not load card lookup cache: {e}")
+    return _card_lookup_disk_cache
+
+
+def save_card_lookup_cache() -> None:
+    """Atomically write the persistent card lookup cache."""
+    if _card_lookup_disk_cache is None:
+        return
+    cache_file = get_card_lookup_cache_file()
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        data = {
+            'entries': _card_lookup_disk_cache,
+            'last_updated': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"Warning: Could not save card lookup cache: {e}")
+
 
-def lookup_card_info(card_name: str, retries: int = 3) -> Optional[Dict]:
-    """Look up card information from Limitless TCG cards database with improved robustness."""
-    # Check cache first
+def _lookup_card_info_offline(card_name: str, card_db: Optional[CardDatabaseLookup] = None) -> tuple:
+    """
+    Resolve a card without network access.
+    Returns (known, result): known is False if only an online search can tell.
+    """
     if card_name in _card_lookup_cache:
-        return _card_lookup_cache[card_name]
+        return True, _card_lookup_cache[card_name]
+    
+    # Local card database (exact, partial, then typo-tolerant)
+    if card_db is not None:
+        db_info = card_db.get_card_info(card_name, fuzzy=True)
+        if db_info:
+            result = {'set_code': db_info['set_code'], 'card_number': db_info['number']}
+            _card_lookup_cache[card_name] = result
+            return True, result
+    
+    # Earlier online searches (negative results expire)
+    entry = load_card_lookup_cache().get(card_name)
+    if entry and (entry['result'] or time.time() - entry['checked'] < CARD_LOOKUP_NEGATIVE_TTL):
+        _card_lookup_cache[card_name] = entry['result']
+        return True, entry['result']
+    
+    return False, None
+
+
+def _remember_card_lookup(card_name: str, result: Optional[Dict], searched: bool) -> None:
+    """
+    Store an online search result in the in-process cache, and in the persistent
+    cache if the search actually got an answer (not for unreachable pages).
+    """
+    _card_lookup_cache[card_name] = result
+    if searched:
+        load_card_lookup_cache()[card_name] = {'result': result, 'checked': int(time.time())}
+
+
+def lookup_card_info(card_name: str, retries: int = 3, card_db: Optional[CardDatabaseLookup] = None) -> Optional[Dict]:
+    """
+    Look up a card's set code and number.
+    Offline first: in-process cache, local card database (if card_db is given),
+    persistent lookup cache - only then the Limitless TCG card search.
+    """
+    known, result = _lookup_card_info_offline(card_name, card_db)
+    if known:
+        return result
+    
+    result, searched = _search_card_info_online(card_name, retries)
+    _remember_card_lookup(card_name, result, searched)
+    if searched:
+        save_card_lookup_cache()
+    return result
+
+
+def lookup_card_infos(card_names: List[str], card_db: Optional[CardDatabaseLookup] = None,
+                      allow_network: bool = True, retries: int = 3) -> Dict[str, Optional[Dict]]:
+    """
+    Batch mode of lookup_card_info for all unknown names of a tournament.
+    Every name is resolved once; online searches (if allowed) only run for names
+    neither the local database nor the persistent cache can answer, and the cache
+    file is written once at the end.
+    """
+    results: Dict[str, Optional[Dict]] = {}
+    online_names = []
+    for card_name in dict.fromkeys(card_names):
+        known, results[card_name] = _lookup_card_info_offline(card_name, card_db)
+        if not known and allow_network:
+            online_names.append(card_name)
+    
+    for idx, card_name in enumerate(online_names):
+        if idx:
+            time.sleep(0.3)  # Rate limiting
+        results[card_name], searched = _search_card_info_online(card_name, retries)
+        _remember_card_lookup(card_name, results[card_name], searched)
+    
+    if online_names:
+        save_card_lookup_cache()
+    return results
+
+
+def apply_card_lookup(card: Dict, info: Dict) -> None:
+    """Fill a deck card's missing set/number from a lookup result."""
+    # Fix PR-SV to SVP mapping
+    set_code = info['set_code']
+    if set_code == 'PR-SV':
+        set_code = 'SVP'
+    card['set_code'] = set_code
+    card['card_number'] = info['card_number']
+    card['full_name'] = f"{card['name']} {set_code} {info['card_number']}"
+    card['needs_lookup'] = False
+
+
+def _search_card_info_online(card_name: str, retries: int = 3) -> tuple:
+    """
+    Look up card information from Limitless TCG cards database with improved robustness.
+    Returns (result, searched): searched is False if no search page could be fetched.
+    """
+    pattern1 = CARD_SEARCH_LIST_PATTERN
+    pattern2 = CARD_SEARCH_SET_PATTERN
+    searched = False
     
     # Create list of names to try
     names_to_try = [card_name]
@@ -597,13 +782,10 @@ def lookup_card_info(card_name: str, retries: int = 3) -> Optional[Dict]:
             if not html:
                 time.sleep(1.0)
                 continue
+            searched = True
             
             # Strategy 1: Look for data-set and data-number in card container
             # Pattern: <div class="card-list-card" data-set="PAR" data-number="123">
-            pattern1 = re.compile(
-                r'<div[^>]*class="[^"]*card-list-card[^"]*"[^>]*data-set="([A-Z0-9]+)"[^>]*data-number="(\d+)"[^>]*>',
-                re.IGNORECASE
-            )
             matches = pattern1.findall(html)
             if matches:
                 # Take the first match (most relevant)
@@ -611,23 +793,17 @@ def lookup_card_info(card_name: str, retries: int = 3) -> Optional[Dict]:
                     'set_code': matches[0][0].upper(),
                     'card_number': matches[0][1]
                 }
-                _card_lookup_cache[card_name] = result
-                return result
+                return result, True
             
             # Strategy 2: Look for set code in span with class "set"
             # Pattern: <span class="set">PAR 123</span>
-            pattern2 = re.compile(
-                r'<span[^>]*class="[^"]*set[^"]*"[^>]*>\s*([A-Z0-9]+)\s+(\d+)\s*</span>',
-                re.IGNORECASE
-            )
             matches2 = pattern2.findall(html)
             if matches2:
                 result = {
                     'set_code': matches2[0][0].upper(),
                     'card_number': matches2[0][1]
                 }
-                _card_lookup_cache[card_name] = result
-                return result
+                return result, True
             
             # Strategy 3: Search for card name in text and find nearest set info
             # This is more flexible but less precise
@@ -648,8 +824,7 @@ def lookup_card_info(card_name: str, retries: int = 3) -> Optional[Dict]:
                         'set_code': data_match.group(1).upper(),
                         'card_number': data_match.group(2)
                     }
-                    _card_lookup_cache[card_name] = result
-                    return result
+                    return result, True
                 
                 # Try to find set span
                 set_match = re.search(r'<span[^>]*class="[^"]*set[^"]*"[^>]*>\s*([A-Z0-9]+)\s+(\d+)\s*</span>', search_section)
@@ -658,8 +833,7 @@ def lookup_card_info(card_name: str, retries: int = 3) -> Optional[Dict]:
                         'set_code': set_match.group(1).upper(),
                         'card_number': set_match.group(2)
                     }
-                    _card_lookup_cache[card_name] = result
-                    return result
+                    return result, True
             
             # If exact search failed, try alternative names
             if attempt == retries - 1 and len(names_to_try) > 1:
@@ -679,8 +853,7 @@ def lookup_card_info(card_name: str, retries: int = 3) -> Optional[Dict]:
                                 'set_code': set_code,
                                 'card_number': alt_matches[0][1]
                             }
-                            _card_lookup_cache[card_name] = result
-                            return result
+                            return result, True
                         
                         alt_matches2 = pattern2.findall(html_alt)
                         if alt_matches2:
@@ -691,8 +864,7 @@ def lookup_card_info(card_name: str, retries: int = 3) -> Optional[Dict]:
                                 'set_code': set_code,
                                 'card_number': alt_matches2[0][1]
                             }
-                            _card_lookup_cache[card_name] = result
-                            return result
+                            return result, True
             
             # If still failed, try broader search without exact name matching
             if attempt == retries - 1:
@@ -707,8 +879,7 @@ def lookup_card_info(card_name: str, retries: int = 3) -> Optional[Dict]:
                             'set_code': pattern1_matches[0][0].upper(),
                             'card_number': pattern1_matches[0][1]
                         }
-                        _card_lookup_cache[card_name] = result
-                        return result
+                        return result, True
                     
                     pattern2_matches = pattern2.findall(html_broad)
                     if pattern2_matches:
@@ -716,17 +887,14 @@ def lookup_card_info(card_name: str, retries: int = 3) -> Optional[Dict]:
                             'set_code': pattern2_matches[0][0].upper(),
                             'card_number': pattern2_matches[0][1]
                         }
-                        _card_lookup_cache[card_name] = result
-                        return result
+                        return result, True
             
         except Exception as e:
             print(f"    Warning: Error looking up {card_name} (attempt {attempt+1}): {e}")
             if attempt < retries - 1:
                 time.sleep(1.0)
     
-    # Cache negative result to avoid repeated lookups
-    _card_lookup_cache[card_name] = None
-    return None
+    return None, searched
 
 def extract_single_deck(deck_url: str, card_db: CardDatabaseLookup) -> tuple:
     """
@@ -784,13 +952,9 @@ def extract_single_deck(deck_url: str, card_db: CardDatabaseLookup) -> tuple:
     seen_cards = set()
     cards_to_lookup = []
     
-    # Regex patterns (same as extract_cards_from_page)
-    heading_pattern = re.compile(r'<div[^>]*class="decklist-column-heading"[^>]*>\s*([^<]+?)\s*</div>', re.IGNORECASE)
-    card_pattern = re.compile(r'<div[^>]*class="decklist-card"[^>]*data-set="([A-Z0-9]*)"[^>]*data-number="(\d*)"[^>]*>.*?<span class="card-count">([0-9.]+)</span>\s*<span class="card-name">([^<]+)</span>', re.IGNORECASE | re.DOTALL)
-
     # Find all headings with their span (start/end ranges)
     headings = []
-    for m in heading_pattern.finditer(html_content):
+    for m in DECKLIST_HEADING_PATTERN.finditer(html_content):
         title = m.group(1).strip().lower()
         if 'trainer' in title:
             section_type = 'trainer'
@@ -807,11 +971,13 @@ def extract_single_deck(deck_url: str, card_db: CardDatabaseLookup) -> tuple:
         headings[idx]['end'] = end
 
     # Extract cards per section
+    entries = []  # (name, set, number, section) for card_db.resolve_many
+    counts = []
     for sec in headings if headings else [{'start': 0, 'end': len(html_content), 'type': 'pokemon'}]:
         block = html_content[sec['start']:sec['end']]
         section_type = sec['type']
 
-        for match in card_pattern.findall(block):
+        for match in DECKLIST_CARD_PATTERN.findall(block):
             try:
                 set_code_raw = match[0].upper() if match[0] else ""
                 card_number_raw = match[1] if match[1] else ""
@@ -828,55 +994,51 @@ def extract_single_deck(deck_url: str, card_db: CardDatabaseLookup) -> tuple:
 
                 # Parse count (should be integer for individual decks, but allow decimal)
                 count = int(float(count_str))
-
-                # Get set/number based on section type
-                if section_type in ['trainer', 'energy']:
-                    latest_card = card_db.get_latest_low_rarity_version(name)
-                    if latest_card:
-                        set_code = latest_card.set_code
-                        card_number = latest_card.number
-                        full_name = f"{name} {set_code} {card_number}"
-                        card_key = f"{name}|{set_code}|{card_number}".lower()
-                        needs_lookup = False
-                    else:
-                        set_code = ""
-                        card_number = ""
-                        full_name = name
-                        card_key = name.lower()
-                        needs_lookup = False
-                else:
-                    # Pokemon: require set/number
-                    set_code = set_code_raw
-                    card_number = card_number_raw
-                    
-                    if set_code == 'PR-SV':
-                        set_code = 'SVP'
-                    
-                    if not set_code or not card_number:
-                        cards_to_lookup.append(len(cards))
-                        full_name = name
-                        card_key = name.lower()
-                        needs_lookup = True
-                    else:
-                        full_name = f"{name} {set_code} {card_number}"
-                        card_key = f"{name}|{set_code}|{card_number}".lower()
-                        needs_lookup = False
-
-                if card_key not in seen_cards and name:
-                    seen_cards.add(card_key)
-                    is_ace_spec = card_db.is_ace_spec_by_name(name)
-                    cards.append({
-                        'count': count,
-                        'name': name,
-                        'set_code': set_code,
-                        'card_number': card_number,
-                        'full_name': full_name,
-                        'needs_lookup': needs_lookup,
-                        'is_ace_spec': 'Yes' if is_ace_spec else 'No'
-                    })
             except (ValueError, IndexError):
                 continue
 
+            if section_type in ['trainer', 'energy']:
+                # Set/number come from the low-rarity lookup ("" if none found)
+                entries.append((name, "", "", section_type))
+            else:
+                # Pokemon: keep set/number from the page
+                set_code = 'SVP' if set_code_raw == 'PR-SV' else set_code_raw
+                entries.append((name, set_code, card_number_raw, section_type))
+            counts.append(count)
+
+    # Resolve the whole deck in one call
+    for count, card in zip(counts, card_db.resolve_many(entries)):
+        name = card.name
+        set_code = card.set_code
+        card_number = card.number
+
+        if card.section == 'pokemon' and (not set_code or not card_number):
+            # Pokemon: require set/number
+            cards_to_lookup.append(len(cards))
+            full_name = name
+            card_key = name.lower()
+            needs_lookup = True
+        elif set_code and card_number:
+            full_name = f"{name} {set_code} {card_number}"
+            card_key = f"{name}|{set_code}|{card_number}".lower()
+            needs_lookup = False
+        else:
+            full_name = name
+            card_key = name.lower()
+            needs_lookup = False
+
+        if card_key not in seen_cards and name:
+            seen_cards.add(card_key)
+            cards.append({
+                'count': count,
+                'name': name,
+                'set_code': set_code,
+                'card_number': card_number,
+                'full_name': full_name,
+                'needs_lookup': needs_lookup,
+                'is_ace_spec': 'Yes' if card.is_ace_spec else 'No'
+            })
+
     # Lookup missing Pokemon card info (skip for single deck scraping to save time)
     # Can be re-enabled if needed
     
@@ -1017,13 +1179,9 @@ def extract_cards_from_page(cards_url: str, card_db: CardDatabaseLookup, deck_na
     seen_cards = set()
     cards_to_lookup = []  # Track cards that need lookup
     
-    # Regex patterns
-    heading_pattern = re.compile(r'<div[^>]*class="decklist-column-heading"[^>]*>\s*([^<]+?)\s*</div>', re.IGNORECASE)
-    card_pattern = re.compile(r'<div[^>]*class="decklist-card"[^>]*data-set="([A-Z0-9]*)"[^>]*data-number="(\d*)"[^>]*>.*?<span class="card-count">([0-9.]+)</span>\s*<span class="card-name">([^<]+)</span>', re.IGNORECASE | re.DOTALL)
-
     # Find all headings with their span (start/end ranges)
     headings = []
-    for m in heading_pattern.finditer(html_content):
+    for m in DECKLIST_HEADING_PATTERN.finditer(html_content):
         title = m.group(1).strip().lower()
         # Classify section by heading text
         if 'trainer' in title:
@@ -1045,7 +1203,7 @@ def extract_cards_from_page(cards_url: str, card_db: CardDatabaseLookup, deck_na
         block = html_content[sec['start']:sec['end']]
         section_type = sec['type']
 
-        for match in card_pattern.findall(block):
+        for match in DECKLIST_CARD_PATTERN.findall(block):
             try:
                 set_code_raw = match[0].upper() if match[0] else ""
                 card_number_raw = match[1] if match[1] else ""
@@ -1130,6 +1288,7 @@ def extract_cards_from_page(cards_url: str, card_db: CardDatabaseLookup, deck_na
         successful_lookups = 0
         failed_lookups = 0
         
+        lookup_cards = []
         for idx in cards_to_lookup:
             if idx >= len(cards):
                 print(f"    WARNING: Invalid index {idx}, skipping")
@@ -1142,18 +1301,15 @@ def extract_cards_from_page(cards_url: str, card_db: CardDatabaseLookup, deck_na
                 print(f"    SKIPPING (detected as Trainer/Energy): {card['name']}")
                 card['needs_lookup'] = False
                 continue
-            
+            lookup_cards.append(card)
+        
+        # Local database / lookup cache first, one online search per remaining name
+        infos = lookup_card_infos([card['name'] for card in lookup_cards], card_db)
+        for card in lookup_cards:
             print(f"    Looking up: {card['name']}...", end=' ')
-            info = lookup_card_info(card['name'])
+            info = infos[card['name']]
             if info:
-                # Fix PR-SV to SVP mapping
-                set_code = info['set_code']
-                if set_code == 'PR-SV':
-                    set_code = 'SVP'
-                card['set_code'] = set_code
-                card['card_number'] = info['card_number']
-                card['full_name'] = f"{card['name']} {set_code} {info['card_number']}"
-                card['needs_lookup'] = False
+                apply_card_lookup(card, info)
                 successful_lookups += 1
                 print(f"✓ {card['full_name']}")
             else:
@@ -1163,7 +1319,6 @@ def extract_cards_from_page(cards_url: str, card_db: CardDatabaseLookup, deck_na
                 print(f"✗ NOT FOUND - keeping card anyway: {card['name']}")
             # Update Ace Spec status (in case it wasn't set or needs update)
             card['is_ace_spec'] = 'Yes' if card_db.is_ace_spec_by_name(card['name']) else 'No'
-            time.sleep(0.3)  # Rate limiting
         
         print(f"  Lookup summary: {successful_lookups} found, {failed_lookups} kept without set/number")
 
@@ -1305,17 +1460,24 @@ def main():
     start_tournament_id = settings.get('start_tournament_id', None)
     tournament_types = settings.get('tournament_types', ["Regional", "Special Event", "LAIC", "EUIC", "NAIC", "Worlds", "International", "Championship"])
     append_mode = settings.get('append_mode', False)
+    online_card_lookup = settings.get('online_card_lookup', False)
+    deck_fetch_workers = max(1, settings.get('deck_fetch_workers', 4))
+    requests_per_second = settings.get('requests_per_second', 3.0)
+    
+    # All workers share one adaptive token bucket: at most requests_per_second, slower while throttled
+    get_http_client().set_rate_limit('limitlesstcg.com', requests_per_second, max_in_flight=deck_fetch_workers)
     
     print(f"✓ Settings loaded successfully")
     print(f"  Max tournaments: {max_tournaments}")
     print(f"  Append mode: {append_mode}")
     print(f"  Scraping mode: INDIVIDUAL DECK LISTS (all decks per tournament)")
+    print(f"  Deck fetch: {deck_fetch_workers} workers, max {requests_per_second} requests/s")
     print()
     
     # Initialize card database (now uses unified CardDataManager)
     print("Step 2: Loading unified card database (English + Japanese)...")
     try:
-        card_db = CardDatabaseLookup()  # Auto-loads from CardDataManager
+        card_db = get_card_database()  # Shared with card_type_lookup
     except Exception as e:
         print(f"ERROR: Could not load card database: {e}")
         print("Make sure CardDataManager and databases are properly configured.")
@@ -1356,9 +1518,10 @@ def main():
         print(f"\nProcessing tournament {i}/{len(tournaments)}")
         print("-" * 30)
         
-        # Get tournament info
-        print(f"Fetching tournament info: {tournament['url']}")
-        info = get_tournament_info(tournament['url'])
+        # Get tournament info (the same document provides the deck list links below)
+        print(f"Fetching tournament page: {tournament['url']}")
+        document = TournamentDocument.fetch(tournament['url'])
+        info = document.info
         tournament['name'] = info['name']
         tournament['date'] = info['date']
         tournament['players'] = info['players']
@@ -1409,7 +1572,7 @@ def main():
         
         # NEW APPROACH: Scrape individual deck lists instead of archetyp aggregations
         print(f"Fetching individual deck lists from tournament page...")
-        deck_list_urls = get_deck_list_links(tournament['url'])
+        deck_list_urls = document.deck_list_links
         
         if not deck_list_urls:
             print(f"  WARNING: No deck lists found for this tournament")
@@ -1422,39 +1585,54 @@ def main():
         
         total_players = sum(d['player_count'] for d in deck_list_urls)
         print(f"  Found {len(deck_list_urls)} unique decks representing {total_players} total players")
-        print(f"  Estimated time: ~{len(deck_list_urls) * 0.3 / 60:.1f} minutes")
+        print(f"  Estimated time: ~{len(deck_list_urls) / requests_per_second / 60:.1f} minutes")
         
         # Scrape each individual deck (with player counts)
         all_decks = []  # List of dicts: {'cards': [...], 'player_count': 2}
         successful_decks = 0
         failed_decks = 0
         
-        for j, deck_info in enumerate(deck_list_urls, 1):
-            # Progress indicator every 10 decks
-            if j % 10 == 0 or j == 1:
-                print(f"  Progress: {j}/{len(deck_list_urls)} decks ({successful_decks} ok, {failed_decks} failed)")
+        # Fetch concurrently (rate limited per host by the HTTP client), but collect
+        # results in deck list order so the aggregation is identical to a sequential run
+        with ThreadPoolExecutor(max_workers=deck_fetch_workers) as executor:
+            futures = [executor.submit(extract_single_deck, deck_info['url'], card_db)
+                       for deck_info in deck_list_urls]
             
-            try:
-                cards, deck_name = extract_single_deck(deck_info['url'], card_db)
-                if cards:
-                    all_decks.append({
-                        'cards': cards,
-                        'player_count': deck_info['player_count'],
-                        'deck_name': deck_name
-                    })
-                    successful_decks += 1
-                else:
+            for j, (deck_info, future) in enumerate(zip(deck_list_urls, futures), 1):
+                # Progress indicator every 10 decks
+                if j % 10 == 0 or j == 1:
+                    print(f"  Progress: {j}/{len(deck_list_urls)} decks ({successful_decks} ok, {failed_decks} failed)")
+                
+                try:
+                    cards, deck_name = future.result()
+                    if cards:
+                        all_decks.append({
+                            'cards': cards,
+                            'player_count': deck_info['player_count'],
+                            'deck_name': deck_name
+                        })
+                        successful_decks += 1
+                    else:
+                        failed_decks += 1
+                except Exception as e:
+                    print(f"    ERROR scraping {deck_info['url']}: {e}")
                     failed_decks += 1
-            except Exception as e:
-                print(f"    ERROR scraping {deck_info['url']}: {e}")
-                failed_decks += 1
-            
-            # Rate limiting: 0.3s between requests
-            if j < len(deck_list_urls):
-                time.sleep(0.3)
         
         print(f"  Scraping complete: {successful_decks} decks ok, {failed_decks} failed")
         
+        # Resolve Pokemon without set/number for the whole tournament in one batch
+        # (local database + lookup cache; online search only if enabled in settings)
+        missing_cards = [card for deck in all_decks for card in deck['cards'] if card.get('needs_lookup')]
+        if missing_cards:
+            infos = lookup_card_infos([card['name'] for card in missing_cards], card_db,
+                                      allow_network=online_card_lookup)
+            resolved = 0
+            for card in missing_cards:
+                if infos.get(card['name']):
+                    apply_card_lookup(card, infos[card['name']])
+                    resolved += 1
+            print(f"  Resolved set/number for {resolved}/{len(missing_cards)} cards without print info")
+        
         # Aggregate statistics across all decks
         if all_decks:
             total_players = sum(d['player_count'] for d in all_decks)
@@ -1506,6 +1684,7 @@ def main():
         print(f"Data saved to: {os.path.join(get_data_dir(), output_file.replace('.csv', '_cards.csv'))}")
     else:
         print("No data collected.")
+    print(get_http_client().format_stats())
 
 if __name__ == "__main__":
     try: